@@ -70,3 +70,25 @@ def fetch_now(db: Session = Depends(get_db)):
 @router.get('/status', response_model=NewsStatusOut, dependencies=[Depends(require_role(['admin']))])
 def news_status(db: Session = Depends(get_db)):
     return news_service.admin_status(db)
+
+
+@router.get('/embedding-cache', dependencies=[Depends(require_role(['admin']))])
+def embedding_cache_stats():
+    from app.services.embedder import get_query_cache
+    return get_query_cache().stats()
+
+
+@router.post('/reconcile-vectors', dependencies=[Depends(require_role(['admin']))])
+def reconcile_vectors(dry_run: bool = False, db: Session = Depends(get_db)):
+    from app.services.vector_reconciler import reconcile_vector_index
+    return reconcile_vector_index(db, dry_run=dry_run).to_dict()
+
+
+@router.get('/vector-store', dependencies=[Depends(require_role(['admin']))])
+def vector_store_status():
+    from app.services.vector_store import get_chunk_vector_store, get_user_vector_store, get_vector_store
+    return {
+        'articles': get_vector_store().status().to_dict(),
+        'users': get_user_vector_store().status().to_dict(),
+        'chunks': get_chunk_vector_store().status().to_dict(),
+    }
@@ -16,6 +16,7 @@ from app.api.deps import get_current_user, get_db
 from app.models.news import NewsArticle, UserEvent
 from app.models.user import User
 from app.schemas.events import EventBatch, EventBatchResponse
+from app.services.recommender import EventRecord
 
 logger = logging.getLogger(__name__)
 
@@ -41,12 +42,17 @@ def submit_events(
 ):
     accepted = 0
     duplicates = 0
-    cutoff = datetime.utcnow() - DEDUP_WINDOW
+    # Plain copies for the profile updates: commit expires the ORM objects,
+    # and reading them back afterwards would cost a SELECT per event
+    user_id = user.id
+    new_events: list[EventRecord] = []
+    now = datetime.utcnow()
+    cutoff = now - DEDUP_WINDOW
 
     for event in payload.events:
         # Dedup check
         existing = db.query(UserEvent).filter(
-            UserEvent.user_id == user.id,
+            UserEvent.user_id == user_id,
             UserEvent.article_id == event.article_id,
             UserEvent.event_type == event.event_type,
             UserEvent.created_at >= cutoff,
@@ -59,12 +65,14 @@ def submit_events(
             continue
 
         db.add(UserEvent(
-            user_id=user.id,
+            user_id=user_id,
             article_id=event.article_id,
             event_type=event.event_type,
             dwell_seconds=event.dwell_seconds,
             session_id=event.session_id,
+            created_at=now,
         ))
+        new_events.append(EventRecord(event.article_id, event.event_type, event.dwell_seconds, now))
 
         # Update popularity score on the article
         weight = POPULARITY_WEIGHTS.get(event.event_type, 0)
@@ -76,7 +84,22 @@ def submit_events(
         accepted += 1
 
     db.commit()
+
+    # Queue accepted events for the user's profile vector; fold them into the cached profile
+    if new_events:
+        try:
+            from app.services.user_vectors import queue_user_vector_update
+            queue_user_vector_update(user_id, new_events)
+        except Exception as exc:
+            logger.warning('User vector update failed for user %d: %s', user_id, exc)
+        try:
+            from app.services.user_profiles import apply_events
+            apply_events(db, user_id, new_events)
+        except Exception as exc:
+            db.rollback()
+            logger.warning('User profile update failed for user %d: %s', user_id, exc)
+
     logger.info('User %d submitted %d events (%d accepted, %d deduped)',
-                user.id, len(payload.events), accepted, duplicates)
+                user_id, len(payload.events), accepted, duplicates)
 
     return EventBatchResponse(accepted=accepted, duplicates_skipped=duplicates)
@@ -81,6 +81,22 @@ def get_explore_feed(
     return news_service.get_explore(db, user, topic, source, q, from_date, to_date, page, page_size)
 
 
+@router.get('/news/search', response_model=NewsFeedResponse)
+def search_news(
+    q: str = Query(min_length=1),
+    topic: str | None = None,
+    source: str | None = None,
+    from_date: str | None = Query(default=None, alias='from'),
+    to_date: str | None = Query(default=None, alias='to'),
+    page: int = 1,
+    page_size: int = 12,
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    """Keyword + semantic search (BM25 and vector results fused by rank)."""
+    return news_service.search_articles(db, user, q, topic, source, from_date, to_date, page, page_size)
+
+
 @router.get('/news/saved', response_model=NewsFeedResponse)
 def get_saved_feed(
     page: int = 1,
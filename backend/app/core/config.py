@@ -19,13 +19,55 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 10080
     NEWS_DATA_LAKE_PATH: str = './data/news'
     VECTOR_DB_URL: str = 'http://localhost:6333'
-    VECTOR_DB_PROVIDER: str = 'none'  # 'none' | 'chroma' | 'qdrant'
+    VECTOR_DB_PROVIDER: str = 'none'  # 'none' | 'chroma' | 'qdrant' | 'numpy' | 'hnsw'
     VECTOR_DB_PATH: str = './data/chroma'
+    VECTOR_DB_HNSW_M: int = 16
+    VECTOR_DB_HNSW_EF_CONSTRUCTION: int = 200
+    VECTOR_DB_HNSW_EF_SEARCH: int = 64
+    VECTOR_DB_HNSW_OVERFETCH: int = 4  # filtered searches fetch top_k * this before post-filtering
+    VECTOR_DB_QUANTIZATION: str = 'none'  # 'none' | 'int8' (numpy, qdrant)
+    VECTOR_DB_RESCORE_OVERFETCH: int = 4  # int8 shortlist is top_k * this, rescored with float vectors
     VECTOR_DB_NEWS_INDEX: str = 'gymunity-news'
     VECTOR_DB_USER_INDEX: str = 'gymunity-users'
+    VECTOR_DB_CHUNK_INDEX: str = 'gymunity-news-chunks'
+    VECTOR_DB_STATUS_INTERVAL_SECONDS: float = 30.0  # background count/health refresh
+    VECTOR_DB_RETENTION_DAYS: int = 14  # vectors of older articles are pruned (0 keeps all)
+    VECTOR_DB_SHARDING: str = 'none'  # 'none' | 'week' (one article/chunk collection per ISO week)
+    VECTOR_DB_RECONCILE_INTERVAL_MINUTES: int = 60
+    VECTOR_DB_UPSERT_CHUNK_SIZE: int = 500  # vectors per request in bulk_upsert
+    VECTOR_DB_UPSERT_PARALLELISM: int = 4  # concurrent bulk_upsert requests (Chroma, Qdrant)
+    VECTOR_DB_ASYNC_WORKERS: int = 8  # thread pool behind AsyncVectorStore for sync-only backends
     EMBEDDING_MODEL_NAME: str = 'sentence-transformers/all-MiniLM-L6-v2'
+    EMBEDDING_MODEL_DIM: int = 384  # fallback only: the native size is read from the loaded model
+    EMBEDDING_REDUCTION: str = 'none'  # 'none' | 'truncate' | 'pca'
+    EMBEDDING_DIM: int = 0  # target dimension when EMBEDDING_REDUCTION is set
+    EMBEDDING_PCA_PATH: str = './data/embeddings/pca.npz'
+    EMBEDDING_SERVER_URL: str = ''  # e.g. 'http://127.0.0.1:8765' or 'unix:///tmp/gymunity-embed.sock'
+    EMBEDDING_SERVER_MAX_BATCH: int = 64
+    EMBEDDING_SERVER_MAX_WAIT_MS: float = 5.0
+    EMBEDDING_QUERY_CACHE_SIZE: int = 1024  # 0 disables the query-vector LRU cache
+    EMBEDDING_ENCODE_BATCH_SIZE: int = 128
+    EMBEDDING_CHUNKING_ENABLED: bool = False
+    EMBEDDING_CHUNK_TOKENS: int = 200
+    EMBEDDING_CHUNK_OVERLAP: int = 50
+    EMBEDDING_MAX_CHUNKS: int = 16
+    EMBEDDING_STORE_CHUNKS: bool = False  # also keep per-chunk vectors for RAG
+    USER_VECTOR_HALF_LIFE_DAYS: float = 14.0
+    USER_VECTOR_FLUSH_SECONDS: float = 5.0  # queued event weights are folded into user vectors this often; 0 = inline
+    USER_PROFILE_CACHE_TTL_SECONDS: float = 300.0  # 0 disables the in-process profile cache
+    USER_PROFILE_CACHE_SIZE: int = 10000
+    USER_PROFILE_REBUILD_HOURS: float = 24.0  # full re-aggregation drops events past the 30-day window
+    RECOMMENDER_POOL_BUDGET_MS: float = 150.0  # deadline of the SQL candidate pools
+    RECOMMENDER_VECTOR_POOL_BUDGET_MS: float = 300.0  # vector pool includes query encoding
+    RECOMMENDER_POOL_WORKERS: int = 16  # each pool may hold a quarter of them in flight
+    RECOMMENDER_SHARED_POOL_TTL_SECONDS: float = 60.0  # trending/newest pools; 0 disables the cache
     NEWS_PIPELINE_ENABLED: bool = False
     NEWS_PIPELINE_INTERVAL_MINUTES: int = 30
+    SEARCH_BUDGET_MS: float = 250.0  # retrievers still running after this are left out
+    SEARCH_CANDIDATES: int = 200  # hits taken from each retriever before fusion
+    SEARCH_RRF_K: int = 60
+    SEARCH_VECTOR_MIN_SCORE: float = 0.3  # vector hits below this cosine similarity are not matches
+    SEARCH_BM25_SYNC_SECONDS: float = 60.0
 
     # AI Coach (Groq)
     GROQ_API_KEY: str = ''
@@ -38,6 +38,10 @@ def _migrate_columns():
         _add_column_if_missing(conn, 'news_sources', 'fetch_error_count', "INTEGER", "0")
         _add_column_if_missing(conn, 'news_sources', 'last_error', "TEXT", "NULL")
 
+        # ArticleEmbedding raw vector
+        blob = 'BYTEA' if engine.dialect.name == 'postgresql' else 'BLOB'
+        _add_column_if_missing(conn, 'article_embeddings', 'vector', blob, "NULL")
+
 
 def seed_default_sources(db):
     """Seed the 5 Tier-1 default sources. Idempotent: uses rss_url as unique key."""
@@ -56,6 +60,43 @@ def seed_default_sources(db):
     db.commit()
 
 
+def backfill_article_topics(db, batch_size: int = 2000) -> int:
+    """Fill ``article_topics`` from ``topics_json`` for articles that have no rows yet.
+
+    Resumable: a startup interrupted mid-backfill picks up the remaining
+    articles on the next run.
+    """
+    from sqlalchemy import exists
+
+    from app.models.news import ArticleTopic, NewsArticle
+    from app.services.enrichment import topic_rows
+
+    has_topics = exists().where(ArticleTopic.article_id == NewsArticle.id)
+    inserted = 0
+    last_id = 0
+    while True:
+        batch = (
+            db.query(NewsArticle.id, NewsArticle.topics_json, NewsArticle.published_at)
+            .filter(NewsArticle.id > last_id, NewsArticle.topics_json != '[]', ~has_topics)
+            .order_by(NewsArticle.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not batch:
+            break
+        last_id = batch[-1][0]
+        rows = [
+            {'article_id': article_id, 'topic': row.topic, 'position': row.position, 'published_at': row.published_at}
+            for article_id, topics_json, published_at in batch
+            for row in topic_rows(topics_json, published_at)
+        ]
+        if rows:
+            db.bulk_insert_mappings(ArticleTopic, rows)
+            inserted += len(rows)
+        db.commit()
+    return inserted
+
+
 def init_db():
     # Create all tables (including new recommender tables)
     Base.metadata.create_all(bind=engine)
@@ -67,5 +108,7 @@ def init_db():
     try:
         # Seed Tier-1 default sources (idempotent, won't touch admin sources)
         seed_default_sources(db)
+        # Normalize topics of articles ingested before article_topics existed
+        backfill_article_topics(db)
     finally:
         db.close()
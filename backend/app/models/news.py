@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Integer, LargeBinary, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -51,6 +51,10 @@ class NewsArticle(Base):
     source = relationship('NewsSource', back_populates='articles')
     saved_by = relationship('UserSavedArticle', back_populates='article', cascade='all, delete-orphan')
     hidden_by = relationship('UserHiddenArticle', back_populates='article', cascade='all, delete-orphan')
+    topic_rows = relationship(
+        'ArticleTopic', back_populates='article', cascade='all, delete-orphan', passive_deletes=True,
+        order_by='ArticleTopic.position',
+    )
 
     __table_args__ = (
         Index('ix_news_article_source_unique', 'source_id', 'unique_hash', unique=True),
@@ -58,6 +62,22 @@ class NewsArticle(Base):
     )
 
 
+class ArticleTopic(Base):
+    """Normalized ``topics_json``: one row per (article, topic) for indexed topic lookups."""
+    __tablename__ = 'article_topics'
+
+    article_id: Mapped[int] = mapped_column(ForeignKey('news_articles.id', ondelete='CASCADE'), primary_key=True)
+    topic: Mapped[str] = mapped_column(String, primary_key=True)
+    position: Mapped[int] = mapped_column(Integer, default=0, nullable=False)  # order within topics_json
+    published_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)  # copied from the article
+
+    article = relationship('NewsArticle', back_populates='topic_rows')
+
+    __table_args__ = (
+        Index('ix_article_topics_topic_published', 'topic', 'published_at'),
+    )
+
+
 class UserNewsPreference(Base):
     __tablename__ = 'user_news_preferences'
 
@@ -141,6 +161,8 @@ class ArticleEmbedding(Base):
     model_name: Mapped[str] = mapped_column(String, nullable=False)
     dimensions: Mapped[int] = mapped_column(Integer, nullable=False)
     vector_id: Mapped[str] = mapped_column(String, nullable=False)
+    # Pre-reduction article vector as little-endian float16 bytes, so indexes can be rebuilt without the model
+    vector: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
@@ -177,3 +199,16 @@ class FeedImpression(Base):
     __table_args__ = (
         Index('ix_impressions_user_time', 'user_id', 'created_at'),
     )
+
+
+class UserProfileState(Base):
+    """Persisted recommender profile: raw affinity scores maintained incrementally."""
+    __tablename__ = 'user_profiles'
+
+    user_id: Mapped[int] = mapped_column(ForeignKey('users.id'), primary_key=True)
+    topic_scores_json: Mapped[str] = mapped_column(Text, default='{}', nullable=False)  # topic -> raw score
+    source_scores_json: Mapped[str] = mapped_column(Text, default='{}', nullable=False)  # source_id -> raw score
+    interacted_ids_json: Mapped[str] = mapped_column(Text, default='[]', nullable=False)
+    hidden_ids_json: Mapped[str] = mapped_column(Text, default='[]', nullable=False)
+    built_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)  # last full rebuild
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
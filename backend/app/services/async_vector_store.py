@@ -0,0 +1,268 @@
+"""Async counterparts of the vector stores for ``async def`` request handlers.
+
+Qdrant is served by its native ``AsyncQdrantClient``. Every other backend is
+wrapped so its calls run on a bounded thread pool
+(``VECTOR_DB_ASYNC_WORKERS`` threads) instead of blocking the event loop.
+Both share the synchronous store's cached status, filter grammar and hit
+format.
+
+    store = await get_async_vector_store()
+    hits = await store.search(query_vector, top_k=10)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from app.services.vector_store import (
+    QdrantVectorStore,
+    VectorStore,
+    VectorStoreStatus,
+    _qdrant_filter,
+    _qdrant_point_id,
+    get_chunk_vector_store,
+    get_user_vector_store,
+    get_vector_store,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncVectorStore(ABC):
+    """Awaitable version of the ``VectorStore`` interface."""
+
+    def __init__(self, sync_store: VectorStore):
+        self.sync_store = sync_store
+
+    def status(self) -> VectorStoreStatus:
+        """Cached snapshot of the underlying store (no I/O)."""
+        return self.sync_store.status()
+
+    def is_ready(self) -> bool:
+        return self.sync_store.is_ready()
+
+    @abstractmethod
+    async def upsert(self, ids: list[str], embeddings: list[list[float]], metadata: list[dict[str, Any]]) -> None:
+        ...
+
+    @abstractmethod
+    async def search(
+        self,
+        query_vector: list[float],
+        top_k: int = 50,
+        filters: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    async def search_many(
+        self,
+        query_vectors: list[list[float]],
+        top_k: int = 50,
+        filters: dict[str, Any] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        ...
+
+    @abstractmethod
+    async def get(self, ids: list[str]) -> list[dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    async def delete(self, ids: list[str]) -> None:
+        ...
+
+    @abstractmethod
+    async def count(self) -> int:
+        ...
+
+
+# ---------------------------------------------------------------------------
+# Thread pool wrapper (Chroma, NumPy, HNSW, sharded, null)
+# ---------------------------------------------------------------------------
+
+_executor: ThreadPoolExecutor | None = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """One bounded pool shared by every wrapped store."""
+    global _executor
+    if _executor is None:
+        from app.core.config import settings
+        _executor = ThreadPoolExecutor(
+            max_workers=max(1, settings.VECTOR_DB_ASYNC_WORKERS),
+            thread_name_prefix='vector-store',
+        )
+    return _executor
+
+
+class ThreadPoolAsyncVectorStore(AsyncVectorStore):
+    """Run a synchronous store's calls on the shared thread pool."""
+
+    async def _call(self, fn, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_executor(), functools.partial(fn, *args, **kwargs))
+
+    async def upsert(self, ids, embeddings, metadata):
+        await self._call(self.sync_store.upsert, ids, embeddings, metadata)
+
+    async def search(self, query_vector, top_k=50, filters=None):
+        return await self._call(self.sync_store.search, query_vector, top_k=top_k, filters=filters)
+
+    async def search_many(self, query_vectors, top_k=50, filters=None):
+        return await self._call(self.sync_store.search_many, query_vectors, top_k=top_k, filters=filters)
+
+    async def get(self, ids):
+        return await self._call(self.sync_store.get, ids)
+
+    async def delete(self, ids):
+        await self._call(self.sync_store.delete, ids)
+
+    async def count(self):
+        return await self._call(self.sync_store.count)
+
+
+# ---------------------------------------------------------------------------
+# Native async Qdrant
+# ---------------------------------------------------------------------------
+
+class AsyncQdrantVectorStore(AsyncVectorStore):
+    """Qdrant over ``AsyncQdrantClient``.
+
+    The synchronous store has already created the collection and payload
+    indexes; this class only issues data-plane calls.
+    """
+
+    def __init__(self, sync_store: QdrantVectorStore, url: str):
+        try:
+            from qdrant_client import AsyncQdrantClient
+        except ImportError:
+            raise ImportError('qdrant-client is required: pip install qdrant-client')
+
+        super().__init__(sync_store)
+        self._client = AsyncQdrantClient(url=url)
+        self._collection_name = sync_store._collection_name
+        self._search_params = sync_store._search_params
+
+    async def upsert(self, ids, embeddings, metadata):
+        from qdrant_client.models import PointStruct
+        points = [
+            PointStruct(id=_qdrant_point_id(doc_id), vector=vec, payload={**meta, 'doc_id': doc_id})
+            for doc_id, vec, meta in zip(ids, embeddings, metadata)
+        ]
+        await self._client.upsert(collection_name=self._collection_name, points=points)
+        await self._refresh_status()
+
+    async def search(self, query_vector, top_k=50, filters=None):
+        response = await self._client.query_points(
+            collection_name=self._collection_name,
+            query=query_vector,
+            query_filter=_qdrant_filter(filters),
+            search_params=self._search_params,
+            limit=top_k,
+            with_payload=True,
+        )
+        return [QdrantVectorStore._to_hit(hit, hit.score) for hit in response.points]
+
+    async def search_many(self, query_vectors, top_k=50, filters=None):
+        if not query_vectors:
+            return []
+        from qdrant_client.models import QueryRequest
+
+        query_filter = _qdrant_filter(filters)
+        responses = await self._client.query_batch_points(
+            collection_name=self._collection_name,
+            requests=[
+                QueryRequest(
+                    query=query_vector, filter=query_filter, params=self._search_params, limit=top_k, with_payload=True,
+                )
+                for query_vector in query_vectors
+            ],
+        )
+        return [[QdrantVectorStore._to_hit(hit, hit.score) for hit in response.points] for response in responses]
+
+    async def get(self, ids):
+        if not ids:
+            return []
+        points = await self._client.retrieve(
+            collection_name=self._collection_name,
+            ids=[_qdrant_point_id(doc_id) for doc_id in ids],
+            with_payload=True,
+            with_vectors=True,
+        )
+        hits = []
+        for point in points:
+            hit = QdrantVectorStore._to_hit(point)
+            hits.append({'id': hit['id'], 'vector': list(point.vector), 'metadata': hit['metadata']})
+        return hits
+
+    async def delete(self, ids):
+        from qdrant_client.models import PointIdsList
+        if ids:
+            await self._client.delete(
+                collection_name=self._collection_name,
+                points_selector=PointIdsList(points=[_qdrant_point_id(doc_id) for doc_id in ids]),
+            )
+            await self._refresh_status()
+
+    async def count(self):
+        info = await self._client.get_collection(self._collection_name)
+        return info.points_count or 0
+
+    async def _refresh_status(self) -> None:
+        # Keep the shared snapshot current without a blocking count() on the loop
+        try:
+            self.sync_store._status = VectorStoreStatus(count=await self.count(), refreshed_at=time.time())
+        except Exception as exc:
+            logger.warning('Async Qdrant status refresh failed: %s', exc)
+
+
+# ---------------------------------------------------------------------------
+# Async factory
+# ---------------------------------------------------------------------------
+
+_instances: dict[str, AsyncVectorStore] = {}
+_lock: asyncio.Lock | None = None
+
+
+def _wrap(sync_store: VectorStore) -> AsyncVectorStore:
+    from app.core.config import settings
+    if isinstance(sync_store, QdrantVectorStore):
+        try:
+            return AsyncQdrantVectorStore(sync_store, url=settings.VECTOR_DB_URL)
+        except ImportError as exc:
+            logger.warning('Async Qdrant client unavailable (%s), using the thread pool', exc)
+    return ThreadPoolAsyncVectorStore(sync_store)
+
+
+async def _get(name: str, sync_factory) -> AsyncVectorStore:
+    global _lock
+    store = _instances.get(name)
+    if store is not None:
+        return store
+    if _lock is None:
+        _lock = asyncio.Lock()
+    async with _lock:
+        if name not in _instances:
+            # Building the sync store may hit disk or the network: keep it off the loop
+            sync_store = await asyncio.get_running_loop().run_in_executor(_get_executor(), sync_factory)
+            _instances[name] = _wrap(sync_store)
+        return _instances[name]
+
+
+async def get_async_vector_store() -> AsyncVectorStore:
+    """Async counterpart of ``get_vector_store``."""
+    return await _get('articles', get_vector_store)
+
+
+async def get_async_user_vector_store() -> AsyncVectorStore:
+    return await _get('users', get_user_vector_store)
+
+
+async def get_async_chunk_vector_store() -> AsyncVectorStore:
+    return await _get('chunks', get_chunk_vector_store)
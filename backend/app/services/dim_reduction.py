@@ -0,0 +1,213 @@
+"""Optional dimensionality reduction for stored embeddings.
+
+``EMBEDDING_REDUCTION`` selects the stage applied to every article, chunk
+and query vector before it reaches the vector store:
+
+- ``none``     — keep the model's native vectors (default)
+- ``truncate`` — keep the first ``EMBEDDING_DIM`` components
+- ``pca``      — project onto the top ``EMBEDDING_DIM`` principal components
+  fitted on the corpus (see ``python -m app.services.dim_reduction fit``);
+  a missing or mismatched projection file is an error, never a fallback
+
+Reduced vectors are re-normalized so cosine scores stay comparable.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class Reducer:
+    """Linear reduction ``(x - mean) @ components.T`` or plain truncation."""
+
+    def __init__(self, method: str, dim: int, mean: np.ndarray | None = None, components: np.ndarray | None = None):
+        self.method = method
+        self.dim = dim
+        self.mean = mean
+        self.components = components
+
+    @property
+    def output_dim(self) -> int:
+        return self.dim
+
+    def transform_array(self, vectors: np.ndarray) -> np.ndarray:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if self.method == 'pca':
+            reduced = (vectors - self.mean) @ self.components.T
+        else:
+            reduced = vectors[..., :self.dim]
+        norms = np.linalg.norm(reduced, axis=-1, keepdims=True)
+        return reduced / np.where(norms == 0, 1, norms)
+
+    def transform(self, vectors: list[list[float]]) -> list[list[float]]:
+        if not vectors:
+            return []
+        return self.transform_array(np.asarray(vectors)).tolist()
+
+    @classmethod
+    def fit_pca(cls, vectors: np.ndarray, dim: int) -> 'Reducer':
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if dim > min(vectors.shape):
+            raise ValueError(f'Cannot fit {dim} components on a {vectors.shape} sample')
+        mean = vectors.mean(axis=0)
+        _, _, vt = np.linalg.svd(vectors - mean, full_matrices=False)
+        return cls('pca', dim, mean=mean, components=vt[:dim].astype(np.float32))
+
+    def explained_variance(self, vectors: np.ndarray) -> float:
+        """Fraction of the sample's variance kept by this projection."""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        centered = vectors - vectors.mean(axis=0)
+        total = float((centered ** 2).sum())
+        if self.method == 'pca':
+            kept = float(((centered @ self.components.T) ** 2).sum())
+        else:
+            kept = float((centered[:, :self.dim] ** 2).sum())
+        return kept / total if total else 0.0
+
+    def save(self, path: str | Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(path, mean=self.mean, components=self.components)
+
+    @classmethod
+    def load(cls, path: str | Path) -> 'Reducer':
+        data = np.load(path)
+        components = data['components']
+        return cls('pca', components.shape[0], mean=data['mean'], components=components)
+
+
+_reducer: Reducer | None = None
+_reducer_loaded = False
+
+
+def get_reducer() -> Reducer | None:
+    """Return the configured reducer singleton, or None when disabled.
+
+    Raises RuntimeError when PCA is configured but its projection file is
+    missing or does not match ``EMBEDDING_DIM``.
+    """
+    global _reducer, _reducer_loaded
+    if _reducer_loaded:
+        return _reducer
+
+    from app.core.config import settings
+    method = settings.EMBEDDING_REDUCTION
+    dim = settings.EMBEDDING_DIM
+
+    if method in ('truncate', 'pca') and 0 < dim < get_model_dim():
+        if method == 'pca':
+            # Never substitute another projection: vectors already stored were
+            # projected with this file, and mixing spaces silently ruins search
+            try:
+                reducer = Reducer.load(settings.EMBEDDING_PCA_PATH)
+            except (OSError, KeyError) as exc:
+                raise RuntimeError(
+                    f'EMBEDDING_REDUCTION=pca but the projection at {settings.EMBEDDING_PCA_PATH} '
+                    f'cannot be loaded ({exc}); fit it with `python -m app.services.dim_reduction fit`'
+                ) from exc
+            if reducer.dim != dim:
+                raise RuntimeError(
+                    f'PCA projection at {settings.EMBEDDING_PCA_PATH} has {reducer.dim} components, '
+                    f'EMBEDDING_DIM={dim}'
+                )
+            _reducer = reducer
+        else:
+            _reducer = Reducer('truncate', dim)
+        logger.info('Embedding reduction: %s to %d dims', _reducer.method, _reducer.dim)
+    elif method != 'none':
+        logger.warning('Ignoring EMBEDDING_REDUCTION=%s with EMBEDDING_DIM=%d', method, dim)
+
+    _reducer_loaded = True
+    return _reducer
+
+
+def reset_reducer() -> None:
+    """Forget the reducer singleton so the next call re-reads the settings and projection."""
+    global _reducer, _reducer_loaded
+    _reducer, _reducer_loaded = None, False
+
+
+def get_model_dim() -> int:
+    """Native output size of the embedding model.
+
+    Read from the loaded model (or embedding server), so it always matches
+    ``EMBEDDING_MODEL_NAME``; ``EMBEDDING_MODEL_DIM`` is only the fallback
+    while no model can be loaded.
+    """
+    from app.core.config import settings
+    from app.services import embedder
+
+    model = embedder._get_model()
+    if model is None:
+        return settings.EMBEDDING_MODEL_DIM
+    return model.get_sentence_embedding_dimension()
+
+
+def reduce_vectors(vectors: list[list[float]]) -> list[list[float]]:
+    """Apply the configured reduction (identity when disabled)."""
+    reducer = get_reducer()
+    return reducer.transform(vectors) if reducer else vectors
+
+
+def get_embedding_dim() -> int:
+    """Dimension of the vectors that reach the vector store."""
+    reducer = get_reducer()
+    return reducer.output_dim if reducer else get_model_dim()
+
+
+# ---------------------------------------------------------------------------
+# CLI: fit the PCA projection on a corpus sample
+# ---------------------------------------------------------------------------
+
+def fit_from_corpus(sample_size: int, dim: int, output: str) -> Reducer:
+    """Encode up to ``sample_size`` recent articles and fit a PCA projection."""
+    from app.db.session import SessionLocal
+    from app.models.news import NewsArticle
+    from app.services import embedder
+    from app.services.vector_store import reopen_vector_store
+
+    model = embedder._get_model()
+    if model is None:
+        raise RuntimeError('Embedding model not available')
+
+    db = SessionLocal()
+    try:
+        articles = db.query(NewsArticle).order_by(NewsArticle.id.desc()).limit(sample_size).all()
+        vectors = np.asarray(embedder.encode_articles(model, articles, reduce=False).vectors, dtype=np.float32)
+    finally:
+        db.close()
+
+    reducer = Reducer.fit_pca(vectors, dim)
+    reducer.save(output)
+    # A store opened while the projection was missing came up disabled
+    reset_reducer()
+    reopen_vector_store()
+    logger.info('PCA %d -> %d fitted on %d articles (%.1f%% variance kept), saved to %s',
+                vectors.shape[1], dim, len(vectors), 100 * reducer.explained_variance(vectors), output)
+    return reducer
+
+
+def main(argv: list[str] | None = None) -> None:
+    from app.core.config import settings
+
+    parser = argparse.ArgumentParser(description='Embedding dimensionality reduction tools.')
+    sub = parser.add_subparsers(dest='command', required=True)
+    fit = sub.add_parser('fit', help='fit a PCA projection on the article corpus')
+    fit.add_argument('--dim', type=int, default=settings.EMBEDDING_DIM or 128)
+    fit.add_argument('--sample', type=int, default=5000, help='number of articles to fit on')
+    fit.add_argument('--output', default=settings.EMBEDDING_PCA_PATH)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    if args.command == 'fit':
+        fit_from_corpus(args.sample, args.dim, args.output)
+
+
+if __name__ == '__main__':
+    main()
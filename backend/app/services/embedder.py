@@ -1,15 +1,23 @@
 """Article embedding service.
 
 Embeds article text using sentence-transformers and stores vectors
-in the configured vector store backend.
+in the configured vector store backend. With ``EMBEDDING_CHUNKING_ENABLED``
+long articles are split into overlapping token windows whose vectors are
+mean-pooled into the article vector.
 """
 
 from __future__ import annotations
 
 import hashlib
+import json
 import logging
-from datetime import datetime
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 
+import numpy as np
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.models.news import ArticleEmbedding, NewsArticle
@@ -18,22 +26,121 @@ logger = logging.getLogger(__name__)
 
 # Lazy-loaded model singleton
 _model = None
+_model_lock = threading.Lock()
+
+
+# ---------------------------------------------------------------------------
+# Query vector cache
+# ---------------------------------------------------------------------------
+
+class QueryVectorCache:
+    """Bounded, thread-safe LRU cache of query text -> embedding vector.
+
+    Feed queries are built from a small topic vocabulary, so most requests
+    repeat a few hundred distinct strings and can skip model inference.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._data: OrderedDict[str, tuple[float, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, text: str) -> list[float] | None:
+        with self._lock:
+            vector = self._data.get(text)
+            if vector is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(text)
+            self.hits += 1
+            return list(vector)
+
+    def put(self, text: str, vector: list[float]) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._data[text] = tuple(vector)
+            self._data.move_to_end(text)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._data),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+_query_cache: QueryVectorCache | None = None
+
+
+def get_query_cache() -> QueryVectorCache:
+    """Get or create the query vector cache singleton."""
+    global _query_cache
+    if _query_cache is None:
+        from app.core.config import settings
+        _query_cache = QueryVectorCache(max_size=settings.EMBEDDING_QUERY_CACHE_SIZE)
+    return _query_cache
 
 
 def _get_model():
-    """Load the sentence-transformers model (lazy, singleton)."""
+    """Load the embedding model (lazy, singleton).
+
+    With ``EMBEDDING_SERVER_URL`` set this returns a client for the shared
+    embedding server instead of loading a model into this process.
+    """
     global _model
     if _model is not None:
         return _model
 
+    from app.core.config import settings
+    with _model_lock:  # concurrent first calls wait for one load
+        if _model is not None:
+            return _model
+        if settings.EMBEDDING_SERVER_URL:
+            from app.services.embedding_server import EmbeddingServerClient
+            try:
+                client = EmbeddingServerClient(settings.EMBEDDING_SERVER_URL)
+                logger.info('Using embedding server at %s (dim=%d)',
+                            settings.EMBEDDING_SERVER_URL, client.get_sentence_embedding_dimension())
+                _model = client
+                return _model
+            except Exception as exc:
+                logger.error('Embedding server %s unavailable: %s', settings.EMBEDDING_SERVER_URL, exc)
+                return None
+
+        _model = load_local_model()
+        return _model
+
+
+def warm_model() -> None:
+    """Load the model on a background thread, so no request pays the cold load."""
+    threading.Thread(target=_get_model, name='embedder-warmup', daemon=True).start()
+
+
+def load_local_model():
+    """Load the sentence-transformers model into this process."""
     try:
         from sentence_transformers import SentenceTransformer
         from app.core.config import settings
         model_name = settings.EMBEDDING_MODEL_NAME
         logger.info('Loading embedding model: %s', model_name)
-        _model = SentenceTransformer(model_name)
-        logger.info('Embedding model loaded (dim=%d)', _model.get_sentence_embedding_dimension())
-        return _model
+        model = SentenceTransformer(model_name)
+        logger.info('Embedding model loaded (dim=%d)', model.get_sentence_embedding_dimension())
+        return model
     except ImportError:
         logger.warning('sentence-transformers not installed — embeddings disabled')
         return None
@@ -50,11 +157,235 @@ def _build_embed_text(article: NewsArticle) -> str:
     return '. '.join(p for p in parts if p)
 
 
+def _build_full_text(article: NewsArticle) -> str:
+    """Combine article fields without truncation (chunking mode)."""
+    parts = [article.title or '', article.summary or '', article.content or '']
+    return '. '.join(p for p in parts if p)
+
+
 def _content_hash(text: str) -> str:
     return hashlib.sha256(text.encode('utf-8')).hexdigest()
 
 
-def embed_pending_articles(db: Session, batch_size: int = 100) -> int:
+# ---------------------------------------------------------------------------
+# Chunking
+# ---------------------------------------------------------------------------
+
+def _split_into_chunks(model, text: str) -> list[str]:
+    """Split text into overlapping token windows sized for the model.
+
+    Uses the model's own tokenizer when available, whitespace otherwise.
+    """
+    from app.core.config import settings
+
+    size = settings.EMBEDDING_CHUNK_TOKENS
+    max_seq = getattr(model, 'max_seq_length', None)
+    if max_seq:
+        size = min(size, max_seq - 2)  # leave room for [CLS]/[SEP]
+    size = max(1, size)
+    step = max(1, size - min(settings.EMBEDDING_CHUNK_OVERLAP, size // 2))
+
+    tokenizer = getattr(model, 'tokenizer', None)
+    if tokenizer is not None:
+        tokens = tokenizer.tokenize(text)
+        join = tokenizer.convert_tokens_to_string
+    else:
+        # ~1.3 word pieces per English word: keep word windows under the token limit
+        size = max(1, int(size * 0.75))
+        step = max(1, size - min(settings.EMBEDDING_CHUNK_OVERLAP, size // 2))
+        tokens = text.split()
+        join = ' '.join
+
+    if len(tokens) <= size:
+        return [text] if text else []
+
+    chunks = []
+    for start in range(0, len(tokens), step):
+        chunks.append(join(tokens[start:start + size]))
+        if start + size >= len(tokens) or len(chunks) >= settings.EMBEDDING_MAX_CHUNKS:
+            break
+    return chunks
+
+
+@dataclass
+class EncodedArticles:
+    """Output of :func:`encode_articles` for one batch."""
+    vectors: list[list[float]]
+    # article index -> [(chunk_text, chunk_vector), ...]; only filled in chunking mode
+    chunks: dict[int, list[tuple[str, list[float]]]] = field(default_factory=dict)
+    # model output before dimensionality reduction (persisted in ``article_embeddings.vector``)
+    raw: list[list[float]] | None = None
+
+
+def encode_articles(model, articles: list[NewsArticle], reduce: bool = True) -> EncodedArticles:
+    """Encode a batch of articles into one vector each.
+
+    In chunking mode every article is split into overlapping windows, all
+    chunks of the batch are encoded together, and the article vector is the
+    normalized mean of its chunk vectors. With ``reduce`` the configured
+    dimensionality reduction is applied to every returned vector.
+    """
+    from app.core.config import settings
+    from app.services.dim_reduction import reduce_vectors
+
+    batch_size = settings.EMBEDDING_ENCODE_BATCH_SIZE
+
+    if not settings.EMBEDDING_CHUNKING_ENABLED:
+        texts = [_build_embed_text(a) for a in articles]
+        vectors = model.encode(texts, batch_size=batch_size, show_progress_bar=False).tolist()
+        return EncodedArticles(vectors=reduce_vectors(vectors) if reduce else vectors, raw=vectors)
+
+    chunk_texts: list[str] = []
+    spans: list[tuple[int, int]] = []
+    for article in articles:
+        pieces = _split_into_chunks(model, _build_full_text(article)) or [article.title or '']
+        spans.append((len(chunk_texts), len(chunk_texts) + len(pieces)))
+        chunk_texts.extend(pieces)
+
+    chunk_vectors = np.asarray(
+        model.encode(chunk_texts, batch_size=batch_size, show_progress_bar=False),
+        dtype=np.float32,
+    )
+
+    vectors = []
+    chunks: dict[int, list[tuple[str, list[float]]]] = {}
+    for idx, (lo, hi) in enumerate(spans):
+        pooled = chunk_vectors[lo:hi].mean(axis=0)
+        norm = float(np.linalg.norm(pooled))
+        if norm > 0:
+            pooled = pooled / norm
+        vectors.append(pooled.tolist())
+        if settings.EMBEDDING_STORE_CHUNKS:
+            chunk_list = chunk_vectors[lo:hi].tolist()
+            if reduce:
+                chunk_list = reduce_vectors(chunk_list)
+            chunks[idx] = list(zip(chunk_texts[lo:hi], chunk_list))
+
+    return EncodedArticles(vectors=reduce_vectors(vectors) if reduce else vectors, chunks=chunks, raw=vectors)
+
+
+def article_metadata(article: NewsArticle) -> dict:
+    topics = []
+    try:
+        topics = json.loads(article.topics_json) if article.topics_json else []
+    except Exception:
+        pass
+    return {
+        'article_id': article.id,
+        'source_id': article.source_id,
+        'topics': ','.join(topics) if topics else 'general',
+        'published_at': str(article.published_at) if article.published_at else '',
+        'published_ts': published_ts(article),
+        'language': article.language or 'en',
+    }
+
+
+def published_ts(article: NewsArticle) -> float:
+    """Epoch seconds used for range filters (falls back to ingestion time)."""
+    when = article.published_at or article.created_at or datetime.utcnow()
+    return when.replace(tzinfo=timezone.utc).timestamp()
+
+
+def upsert_chunks(articles: list[NewsArticle], encoded: EncodedArticles) -> None:
+    """Store per-chunk vectors (with their text) for RAG retrieval."""
+    if not encoded.chunks:
+        return
+
+    from app.core.config import settings
+    from app.services.vector_store import get_chunk_vector_store
+
+    chunk_store = get_chunk_vector_store()
+    ids, embeddings, metadata_list, stale_ids = [], [], [], []
+    for idx, pieces in encoded.chunks.items():
+        article = articles[idx]
+        base_meta = article_metadata(article)
+        for n, (text, vector) in enumerate(pieces):
+            ids.append(f'{article.id}-{n}')
+            embeddings.append(vector)
+            metadata_list.append({**base_meta, 'chunk_index': n, 'text': text})
+        # Drop leftovers from a previous, longer version of the article
+        stale_ids.extend(f'{article.id}-{n}' for n in range(len(pieces), settings.EMBEDDING_MAX_CHUNKS))
+
+    chunk_store.delete(stale_ids)
+    chunk_store.upsert(ids=ids, embeddings=embeddings, metadata=metadata_list)
+
+
+def pack_vector(vector: list[float]) -> bytes:
+    """Serialize a vector as little-endian float16 bytes."""
+    return np.asarray(vector, dtype='<f2').tobytes()
+
+
+def unpack_vectors(blobs: list[bytes]) -> np.ndarray:
+    """Decode ``pack_vector`` blobs of one dimension into a float32 matrix."""
+    return np.frombuffer(b''.join(blobs), dtype='<f2').reshape(len(blobs), -1).astype(np.float32)
+
+
+def record_embeddings(
+    db: Session,
+    articles: list[NewsArticle],
+    model_name: str,
+    dim: int,
+    raw_vectors: list[list[float]] | None = None,
+) -> None:
+    """Create or update ``article_embeddings`` rows for freshly embedded articles.
+
+    The article's own ``content_hash`` is recorded so the pending-article
+    query stops selecting it until its content changes again. ``raw_vectors``
+    (the pre-reduction model output) are stored alongside for index rebuilds.
+    """
+    existing = {
+        row.article_id: row
+        for row in db.query(ArticleEmbedding).filter(
+            ArticleEmbedding.article_id.in_([a.id for a in articles])
+        ).all()
+    }
+
+    for i, article in enumerate(articles):
+        c_hash = article.content_hash or _content_hash(_build_embed_text(article))
+        blob = pack_vector(raw_vectors[i]) if raw_vectors is not None else None
+        record = existing.get(article.id)
+        if record:
+            record.content_hash = c_hash
+            record.model_name = model_name
+            record.dimensions = dim
+            record.vector = blob
+            record.updated_at = datetime.utcnow()
+        else:
+            db.add(ArticleEmbedding(
+                article_id=article.id,
+                content_hash=c_hash,
+                model_name=model_name,
+                dimensions=dim,
+                vector_id=str(article.id),
+                vector=blob,
+            ))
+
+
+# ``article_embeddings.content_hash`` of a record the reconciler re-queued
+REQUEUED_HASH = ''
+
+
+def pending_articles_query(db: Session, since: datetime | None = None):
+    """Articles with no embedding record, a re-queued one, or whose content changed since.
+
+    ``since`` limits the query to articles published (or ingested, when the
+    publish date is unknown) at or after that time.
+    """
+    query = (
+        db.query(NewsArticle)
+        .outerjoin(ArticleEmbedding, ArticleEmbedding.article_id == NewsArticle.id)
+        .filter(
+            (ArticleEmbedding.id.is_(None)) |
+            (ArticleEmbedding.content_hash == REQUEUED_HASH) |
+            (NewsArticle.content_hash != ArticleEmbedding.content_hash)
+        )
+    )
+    if since is not None:
+        query = query.filter(func.coalesce(NewsArticle.published_at, NewsArticle.created_at) >= since)
+    return query
+
+
+def embed_pending_articles(db: Session, batch_size: int = 100, since: datetime | None = None) -> int:
     """Embed articles that are new or have changed content.
 
     Returns number of articles embedded.
@@ -72,16 +403,7 @@ def embed_pending_articles(db: Session, batch_size: int = 100) -> int:
     # Find articles that need embedding:
     # 1. No embedding record exists, OR
     # 2. content_hash has changed
-    articles = (
-        db.query(NewsArticle)
-        .outerjoin(ArticleEmbedding, ArticleEmbedding.article_id == NewsArticle.id)
-        .filter(
-            (ArticleEmbedding.id.is_(None)) |
-            (NewsArticle.content_hash != ArticleEmbedding.content_hash)
-        )
-        .limit(batch_size)
-        .all()
-    )
+    articles = pending_articles_query(db, since=since).limit(batch_size).all()
 
     if not articles:
         return 0
@@ -89,55 +411,18 @@ def embed_pending_articles(db: Session, batch_size: int = 100) -> int:
     logger.info('Embedding %d articles', len(articles))
 
     # Build texts and embed
-    texts = [_build_embed_text(a) for a in articles]
-    embeddings = model.encode(texts, show_progress_bar=False).tolist()
+    encoded = encode_articles(model, articles)
 
     # Prepare for vector store
     ids = [str(a.id) for a in articles]
-    metadata_list = []
-    for a in articles:
-        import json
-        topics = []
-        try:
-            topics = json.loads(a.topics_json) if a.topics_json else []
-        except Exception:
-            pass
-        metadata_list.append({
-            'article_id': a.id,
-            'source_id': a.source_id,
-            'topics': ','.join(topics) if topics else 'general',
-            'published_at': str(a.published_at) if a.published_at else '',
-            'language': a.language or 'en',
-        })
+    metadata_list = [article_metadata(a) for a in articles]
 
     # Upsert to vector store
-    vector_store.upsert(ids=ids, embeddings=embeddings, metadata=metadata_list)
+    vector_store.upsert(ids=ids, embeddings=encoded.vectors, metadata=metadata_list)
+    upsert_chunks(articles, encoded)
 
     # Update/create embedding records
-    model_name = settings.EMBEDDING_MODEL_NAME
-    dim = model.get_sentence_embedding_dimension()
-
-    for article in articles:
-        embed_text = _build_embed_text(article)
-        c_hash = _content_hash(embed_text)
-
-        existing = db.query(ArticleEmbedding).filter(
-            ArticleEmbedding.article_id == article.id
-        ).first()
-
-        if existing:
-            existing.content_hash = c_hash
-            existing.model_name = model_name
-            existing.dimensions = dim
-            existing.updated_at = datetime.utcnow()
-        else:
-            db.add(ArticleEmbedding(
-                article_id=article.id,
-                content_hash=c_hash,
-                model_name=model_name,
-                dimensions=dim,
-                vector_id=str(article.id),
-            ))
+    record_embeddings(db, articles, settings.EMBEDDING_MODEL_NAME, len(encoded.vectors[0]), encoded.raw)
 
     db.commit()
     logger.info('Embedded %d articles successfully', len(articles))
@@ -145,8 +430,19 @@ def embed_pending_articles(db: Session, batch_size: int = 100) -> int:
 
 
 def embed_user_query(text: str) -> list[float] | None:
-    """Embed a text query for vector search. Returns None if model unavailable."""
+    """Embed a text query for vector search. Returns None if model unavailable.
+
+    Results are served from the query vector LRU cache when possible.
+    """
+    cache = get_query_cache()
+    cached = cache.get(text)
+    if cached is not None:
+        return cached
+
     model = _get_model()
     if model is None:
         return None
-    return model.encode(text, show_progress_bar=False).tolist()
+    from app.services.dim_reduction import reduce_vectors
+    vector = reduce_vectors([model.encode(text, show_progress_bar=False).tolist()])[0]
+    cache.put(text, vector)
+    return vector
@@ -0,0 +1,253 @@
+"""Resumable embedding backfill for the whole ``news_articles`` table.
+
+Walks articles by keyset on ``id`` and overlaps the three stages of work:
+a reader thread pulls batches from the DB, an encoder thread runs the model,
+and the main thread streams vectors through ``VectorStore.bulk_upsert``
+(chunked, parallel uploads) and writes ``article_embeddings`` rows. Progress
+is checkpointed after every written batch, so an interrupted run picks up
+where it stopped; the checkpoint is removed once a run completes.
+
+    python -m app.services.embedding_backfill              # pending articles only
+    python -m app.services.embedding_backfill --all        # re-embed everything
+    python -m app.services.embedding_backfill --restart    # ignore checkpoint
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.news import NewsArticle
+from app.services import embedder
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+@dataclass
+class Checkpoint:
+    last_id: int = 0
+    processed: int = 0
+    model_name: str = ''
+    mode: str = 'pending'
+    updated_at: str = ''
+
+
+def default_checkpoint_path() -> Path:
+    return Path(settings.NEWS_DATA_LAKE_PATH) / 'embedding_backfill.json'
+
+
+def load_checkpoint(path: Path) -> Checkpoint | None:
+    if not path.exists():
+        return None
+    try:
+        return Checkpoint(**json.loads(path.read_text(encoding='utf-8')))
+    except Exception as exc:
+        logger.warning('Ignoring unreadable checkpoint %s: %s', path, exc)
+        return None
+
+
+def save_checkpoint(path: Path, checkpoint: Checkpoint) -> None:
+    """Write atomically so a crash never leaves a half-written checkpoint."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    checkpoint.updated_at = datetime.utcnow().isoformat()
+    tmp = path.with_suffix('.tmp')
+    tmp.write_text(json.dumps(asdict(checkpoint)), encoding='utf-8')
+    os.replace(tmp, path)
+
+
+def _base_query(db, reembed_all: bool):
+    """Articles to embed, limited to the servable window the reconciler keeps."""
+    from sqlalchemy import func
+    from app.services.vector_reconciler import retention_cutoff
+
+    since = retention_cutoff()
+    if not reembed_all:
+        return embedder.pending_articles_query(db, since=since)
+    query = db.query(NewsArticle)
+    if since is not None:
+        query = query.filter(func.coalesce(NewsArticle.published_at, NewsArticle.created_at) >= since)
+    return query
+
+
+def _format_eta(seconds: float) -> str:
+    seconds = int(seconds)
+    hours, rem = divmod(seconds, 3600)
+    minutes, secs = divmod(rem, 60)
+    return f'{hours:d}:{minutes:02d}:{secs:02d}'
+
+
+def _reader(start_id: int, batch_size: int, reembed_all: bool, out: queue.Queue, stop: threading.Event) -> None:
+    """Stage 1: fetch article batches by keyset and hand them off detached."""
+    db = SessionLocal()
+    last_id = start_id
+    try:
+        while not stop.is_set():
+            batch = (
+                _base_query(db, reembed_all)
+                .filter(NewsArticle.id > last_id)
+                .order_by(NewsArticle.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not batch:
+                break
+            last_id = batch[-1].id
+            db.expunge_all()
+            out.put(batch)
+    except Exception as exc:
+        out.put(exc)
+    finally:
+        db.close()
+        out.put(_DONE)
+
+
+def _encoder(model, inp: queue.Queue, out: queue.Queue, stop: threading.Event) -> None:
+    """Stage 2: run the model on each batch."""
+    try:
+        while True:
+            item = inp.get()
+            if item is _DONE or isinstance(item, Exception) or stop.is_set():
+                out.put(item)
+                if item is not _DONE:
+                    out.put(_DONE)
+                return
+            out.put((item, embedder.encode_articles(model, item)))
+    except Exception as exc:
+        out.put(exc)
+        out.put(_DONE)
+
+
+def run_backfill(
+    batch_size: int = 256,
+    reembed_all: bool = False,
+    restart: bool = False,
+    checkpoint_path: Path | None = None,
+) -> Checkpoint:
+    """Embed every (pending) article, resuming from the last checkpoint."""
+    model = embedder._get_model()
+    if model is None:
+        raise RuntimeError('Embedding model not available')
+
+    from app.services.vector_store import get_vector_store
+
+    checkpoint_path = checkpoint_path or default_checkpoint_path()
+    mode = 'all' if reembed_all else 'pending'
+    model_name = settings.EMBEDDING_MODEL_NAME
+
+    checkpoint = None if restart else load_checkpoint(checkpoint_path)
+    if checkpoint and (checkpoint.model_name != model_name or checkpoint.mode != mode):
+        logger.info('Checkpoint is for %s/%s — starting over', checkpoint.model_name, checkpoint.mode)
+        checkpoint = None
+    checkpoint = checkpoint or Checkpoint(model_name=model_name, mode=mode)
+
+    db = SessionLocal()
+    try:
+        remaining = _base_query(db, reembed_all).filter(NewsArticle.id > checkpoint.last_id).count()
+    finally:
+        db.close()
+
+    print(f'Backfill ({mode}) starting after id={checkpoint.last_id}: '
+          f'{remaining} articles to embed, {checkpoint.processed} already done')
+    if remaining == 0:
+        checkpoint_path.unlink(missing_ok=True)
+        return checkpoint
+
+    vector_store = get_vector_store()
+    stop = threading.Event()
+    fetched: queue.Queue = queue.Queue(maxsize=2)
+    encoded_q: queue.Queue = queue.Queue(maxsize=2)
+    threads = [
+        threading.Thread(target=_reader, args=(checkpoint.last_id, batch_size, reembed_all, fetched, stop), daemon=True),
+        threading.Thread(target=_encoder, args=(model, fetched, encoded_q, stop), daemon=True),
+    ]
+    for t in threads:
+        t.start()
+
+    started = time.perf_counter()
+    done_this_run = 0
+    in_flight: deque = deque()  # encoded batches whose vectors are being written
+    db = SessionLocal()
+
+    def _vector_batches():
+        while True:
+            item = encoded_q.get()
+            if item is _DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            articles, encoded = item
+            in_flight.append(item)
+            yield [str(a.id) for a in articles], encoded.vectors, [embedder.article_metadata(a) for a in articles]
+
+    def _batch_written(_index: int) -> None:
+        # Stage 3b: vectors of this batch are stored; write bookkeeping, then checkpoint
+        nonlocal done_this_run
+        articles, encoded = in_flight.popleft()
+        embedder.upsert_chunks(articles, encoded)
+        embedder.record_embeddings(db, articles, model_name, len(encoded.vectors[0]), encoded.raw)
+        db.commit()
+
+        checkpoint.last_id = articles[-1].id
+        checkpoint.processed += len(articles)
+        save_checkpoint(checkpoint_path, checkpoint)
+
+        done_this_run += len(articles)
+        elapsed = time.perf_counter() - started
+        rate = done_this_run / elapsed if elapsed else 0.0
+        eta = (remaining - done_this_run) / rate if rate else 0.0
+        print(f'  {done_this_run}/{remaining} articles  '
+              f'{rate:.1f} articles/s  ETA {_format_eta(max(0.0, eta))}')
+
+    try:
+        # Stage 3a: chunked, parallel vector uploads overlapping with encoding
+        report = vector_store.bulk_upsert(_vector_batches(), on_batch=_batch_written)
+    except KeyboardInterrupt:
+        print(f'Interrupted — resume from id={checkpoint.last_id} by re-running the command')
+        raise
+    finally:
+        stop.set()
+        db.close()
+
+    # A finished run needs no resume point; the next run starts from scratch
+    checkpoint_path.unlink(missing_ok=True)
+
+    elapsed = time.perf_counter() - started
+    print(f'Backfill complete: {done_this_run} articles in {elapsed:.1f}s '
+          f'({done_this_run / elapsed if elapsed else 0:.1f} articles/s, '
+          f'{report.vectors_per_s:.0f} vectors/s upserted)')
+    return checkpoint
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description='Embed the news_articles table into the vector store.')
+    parser.add_argument('--batch-size', type=int, default=256)
+    parser.add_argument('--all', dest='reembed_all', action='store_true',
+                        help='re-embed every article, not only new or changed ones')
+    parser.add_argument('--restart', action='store_true', help='ignore any saved checkpoint')
+    parser.add_argument('--checkpoint', type=Path, default=None, help='checkpoint file path')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    run_backfill(
+        batch_size=args.batch_size,
+        reembed_all=args.reembed_all,
+        restart=args.restart,
+        checkpoint_path=args.checkpoint,
+    )
+
+
+if __name__ == '__main__':
+    main()
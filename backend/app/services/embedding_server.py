@@ -0,0 +1,265 @@
+"""Shared embedding server with dynamic request batching.
+
+One process holds the sentence-transformers model; API workers talk to it
+over localhost HTTP or a Unix socket instead of each loading a copy.
+Concurrent requests are grouped into micro-batches: the batcher waits at
+most ``EMBEDDING_SERVER_MAX_WAIT_MS`` after the first request (or until
+``EMBEDDING_SERVER_MAX_BATCH`` texts are queued) and encodes them together.
+
+    python -m app.services.embedding_server --url http://127.0.0.1:8765
+    python -m app.services.embedding_server --url unix:///tmp/gymunity-embed.sock
+
+Workers switch to it by setting ``EMBEDDING_SERVER_URL`` to the same value.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import queue
+import socketserver
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# Micro-batcher
+# ---------------------------------------------------------------------------
+
+class MicroBatcher:
+    """Group concurrent encode requests into one model call."""
+
+    def __init__(self, model, max_batch: int = 64, max_wait_ms: float = 5.0):
+        self._model = model
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._queue: queue.Queue[tuple[list[str], Future]] = queue.Queue()
+        self._stats_lock = threading.Lock()
+        self.requests = 0
+        self.batches = 0
+        self.texts = 0
+        self._thread = threading.Thread(target=self._run, name='embedding-batcher', daemon=True)
+        self._thread.start()
+
+    def submit(self, texts: list[str]) -> Future:
+        future: Future = Future()
+        self._queue.put((texts, future))
+        return future
+
+    def encode(self, texts: list[str], timeout: float | None = None) -> list[list[float]]:
+        return self.submit(texts).result(timeout=timeout)
+
+    def _collect(self) -> list[tuple[list[str], Future]]:
+        pending = [self._queue.get()]
+        size = len(pending[0][0])
+        deadline = time.monotonic() + self.max_wait
+        while size < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            pending.append(item)
+            size += len(item[0])
+        return pending
+
+    def _run(self) -> None:
+        while True:
+            pending = self._collect()
+            texts = [t for batch, _ in pending for t in batch]
+            try:
+                vectors = self._model.encode(
+                    texts, batch_size=max(self.max_batch, 1), show_progress_bar=False,
+                ).tolist()
+            except Exception as exc:
+                for _, future in pending:
+                    future.set_exception(exc)
+                continue
+
+            offset = 0
+            for batch, future in pending:
+                future.set_result(vectors[offset:offset + len(batch)])
+                offset += len(batch)
+
+            with self._stats_lock:
+                self.requests += len(pending)
+                self.batches += 1
+                self.texts += len(texts)
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                'requests': self.requests,
+                'batches': self.batches,
+                'texts': self.texts,
+                'mean_batch_texts': round(self.texts / self.batches, 2) if self.batches else 0.0,
+            }
+
+
+# ---------------------------------------------------------------------------
+# HTTP server
+# ---------------------------------------------------------------------------
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = 'GymUnityEmbed/1.0'
+    batcher: MicroBatcher
+    info: dict
+
+    def _send_json(self, status: int, body: dict) -> None:
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._send_json(200, {'status': 'ok'})
+        elif self.path == '/info':
+            self._send_json(200, {**self.info, 'stats': self.batcher.stats()})
+        else:
+            self._send_json(404, {'detail': 'Not found'})
+
+    def do_POST(self):
+        if self.path != '/encode':
+            self._send_json(404, {'detail': 'Not found'})
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            texts = json.loads(self.rfile.read(length))['texts']
+            if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+                raise ValueError('texts must be a list of strings')
+        except (ValueError, KeyError, TypeError) as exc:
+            self._send_json(400, {'detail': str(exc)})
+            return
+        try:
+            self._send_json(200, {'vectors': self.batcher.encode(texts) if texts else []})
+        except Exception as exc:
+            logger.exception('Encoding failed')
+            self._send_json(500, {'detail': str(exc)})
+
+    def address_string(self):
+        # Unix socket peers have no (host, port) address
+        return self.client_address[0] if self.client_address else 'unix'
+
+    def log_message(self, format, *args):
+        logger.debug('%s - %s', self.address_string(), format % args)
+
+
+class _ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    request_queue_size = 128  # Unix sockets refuse (EAGAIN) instead of retrying when the backlog is full
+
+    def server_bind(self):
+        socketserver.UnixStreamServer.server_bind(self)
+        self.server_name, self.server_port = 'unix', 0
+
+
+def create_server(url: str, model, max_batch: int, max_wait_ms: float):
+    """Build (but do not start) the HTTP server for ``url``."""
+    batcher = MicroBatcher(model, max_batch=max_batch, max_wait_ms=max_wait_ms)
+    handler = type('EmbeddingHandler', (_Handler,), {
+        'batcher': batcher,
+        'info': {
+            'dim': model.get_sentence_embedding_dimension(),
+            'max_seq_length': getattr(model, 'max_seq_length', None),
+            'max_batch': max_batch,
+            'max_wait_ms': max_wait_ms,
+        },
+    })
+
+    parsed = urlparse(url)
+    if parsed.scheme == 'unix':
+        if os.path.exists(parsed.path):
+            os.unlink(parsed.path)
+        return _ThreadingUnixHTTPServer(parsed.path, handler)
+    return ThreadingHTTPServer((parsed.hostname or '127.0.0.1', parsed.port or 8765), handler)
+
+
+# ---------------------------------------------------------------------------
+# Client used by the API workers
+# ---------------------------------------------------------------------------
+
+class EmbeddingServerClient:
+    """Drop-in stand-in for ``SentenceTransformer`` backed by the server.
+
+    Implements the subset of the model API that ``embedder`` relies on.
+    """
+
+    tokenizer = None
+
+    def __init__(self, url: str, timeout: float = 30.0):
+        import httpx
+
+        parsed = urlparse(url)
+        if parsed.scheme == 'unix':
+            self._client = httpx.Client(
+                transport=httpx.HTTPTransport(uds=parsed.path),
+                base_url='http://embedding-server',
+                timeout=timeout,
+            )
+        else:
+            self._client = httpx.Client(base_url=url.rstrip('/'), timeout=timeout)
+
+        info = self._client.get('/info')
+        info.raise_for_status()
+        info = info.json()
+        self._dim = info['dim']
+        self.max_seq_length = info.get('max_seq_length')
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return self._dim
+
+    def encode(self, sentences, batch_size: int = 32, show_progress_bar: bool = False, **kwargs):
+        import numpy as np
+
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+        resp = self._client.post('/encode', json={'texts': texts})
+        resp.raise_for_status()
+        vectors = np.asarray(resp.json()['vectors'], dtype=np.float32)
+        return vectors[0] if single else vectors
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+def main(argv: list[str] | None = None) -> None:
+    from app.core.config import settings
+    from app.services.embedder import load_local_model
+
+    parser = argparse.ArgumentParser(description='Serve the embedding model to API workers.')
+    parser.add_argument('--url', default=settings.EMBEDDING_SERVER_URL or 'http://127.0.0.1:8765')
+    parser.add_argument('--max-batch', type=int, default=settings.EMBEDDING_SERVER_MAX_BATCH)
+    parser.add_argument('--max-wait-ms', type=float, default=settings.EMBEDDING_SERVER_MAX_WAIT_MS)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    model = load_local_model()
+    if model is None:
+        raise SystemExit('Embedding model not available')
+
+    server = create_server(args.url, model, args.max_batch, args.max_wait_ms)
+    logger.info('Embedding server listening on %s (max_batch=%d, max_wait=%.1fms)',
+                args.url, args.max_batch, args.max_wait_ms)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
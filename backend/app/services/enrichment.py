@@ -144,3 +144,21 @@ def enrich_article(article_data: dict) -> dict:
     )
 
     return article_data
+
+
+def topic_rows(topics_json: str | None, published_at: datetime | None) -> list:
+    """``ArticleTopic`` rows for an article's ``topics_json`` (assign to ``article.topic_rows``)."""
+    from app.models.news import ArticleTopic
+
+    try:
+        topics = json.loads(topics_json) if topics_json else []
+    except ValueError:
+        topics = []
+    seen: set[str] = set()
+    rows = []
+    for topic in topics:
+        topic = str(topic)
+        if topic not in seen:
+            seen.add(topic)
+            rows.append(ArticleTopic(topic=topic, position=len(rows), published_at=published_at))
+    return rows
@@ -0,0 +1,342 @@
+"""Hybrid keyword + vector article retrieval.
+
+An in-process BM25 inverted index over title, summary, keywords and tags is
+queried alongside the vector store; the two rankings are merged with
+reciprocal rank fusion (``score = sum 1 / (k + rank)``). BM25 runs inline
+on the request thread; vector retrieval runs on a small pool of its own and
+is fused only if it finishes within ``SEARCH_BUDGET_MS``. A vector call that
+misses the budget keeps its worker until it returns, and while every worker
+is busy new searches skip the vector side instead of queueing behind it, so
+a slow embedding model or vector backend can neither stall nor blank
+explore search.
+
+The BM25 index lives in each worker and is kept current incrementally: a
+sync diffs ``(id, content fingerprint)`` pairs against the database and only
+re-tokenizes new or changed articles. Syncs never run on a request: they are
+started in the background at startup, after each ingestion run, and when a
+search finds the index older than ``SEARCH_BM25_SYNC_SECONDS``. Until the
+first build finishes, explore search uses its substring listing instead.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from collections.abc import Collection
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+
+from sqlalchemy.orm import Session
+
+from app.models.news import NewsArticle
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+_STOPWORDS = frozenset(
+    'a an and are as at be by for from has have how in is it its of on or that the this to was '
+    'were what when which who will with you your'.split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    return [t for t in _TOKEN_RE.findall(text.lower()) if len(t) > 1 and t not in _STOPWORDS]
+
+
+def _json_list(value: str | None) -> list[str]:
+    try:
+        items = json.loads(value) if value else []
+    except ValueError:
+        return []
+    return [str(item) for item in items] if isinstance(items, list) else []
+
+
+def article_terms(article: NewsArticle) -> list[str]:
+    """Indexed terms of an article; the title counts twice."""
+    title = tokenize(article.title or '')
+    return (
+        title + title
+        + tokenize(article.summary or '')
+        + tokenize(' '.join(_json_list(article.keywords_json)))
+        + tokenize((article.tags or '').replace(',', ' '))
+    )
+
+
+def _fingerprint(content_hash: str | None, keywords_json: str | None, tags: str | None) -> str:
+    # content_hash covers title/summary; enrichment can change keywords and tags on their own
+    raw = f'{content_hash}|{keywords_json}|{tags}'
+    return hashlib.md5(raw.encode('utf-8')).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# BM25 inverted index
+# ---------------------------------------------------------------------------
+
+class Bm25Index:
+    """Okapi BM25 over an incrementally updated inverted index."""
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.RLock()
+        self._sync_lock = threading.Lock()  # one sync at a time; searches only wait on ``_lock``
+        self._postings: dict[str, dict[int, int]] = defaultdict(dict)  # term -> {doc: tf}
+        self._doc_terms: dict[int, Counter] = {}
+        self._doc_len: dict[int, int] = {}
+        self._total_len = 0
+        self._fingerprints: dict[int, str] = {}
+        self._synced_at = 0.0
+
+    def __len__(self) -> int:
+        return len(self._doc_len)
+
+    def add(self, doc_id: int, terms: list[str]) -> None:
+        """Index ``terms`` for ``doc_id``, replacing any previous version."""
+        counts = Counter(terms)
+        with self._lock:
+            self.remove(doc_id)
+            for term, tf in counts.items():
+                self._postings[term][doc_id] = tf
+            self._doc_terms[doc_id] = counts
+            self._doc_len[doc_id] = len(terms)
+            self._total_len += len(terms)
+
+    def remove(self, doc_id: int) -> None:
+        with self._lock:
+            counts = self._doc_terms.pop(doc_id, None)
+            if counts is None:
+                return
+            for term in counts:
+                posting = self._postings.get(term)
+                if posting is not None:
+                    posting.pop(doc_id, None)
+                    if not posting:
+                        del self._postings[term]
+            self._total_len -= self._doc_len.pop(doc_id, 0)
+            self._fingerprints.pop(doc_id, None)
+
+    def search(
+        self, query: str, top_k: int = 50, doc_ids: Collection[int] | None = None,
+    ) -> list[tuple[int, float]]:
+        """Return ``(doc_id, score)`` pairs, best first, optionally only among ``doc_ids``."""
+        terms = set(tokenize(query))
+        with self._lock:
+            n = len(self._doc_len)
+            if not terms or n == 0:
+                return []
+            avg_len = self._total_len / n
+            scores: dict[int, float] = defaultdict(float)
+            for term in terms:
+                posting = self._postings.get(term)
+                if not posting:
+                    continue
+                idf = math.log(1 + (n - len(posting) + 0.5) / (len(posting) + 0.5))
+                for doc_id, tf in posting.items():
+                    if doc_ids is not None and doc_id not in doc_ids:
+                        continue
+                    norm = self.k1 * (1 - self.b + self.b * self._doc_len[doc_id] / avg_len)
+                    scores[doc_id] += idf * tf * (self.k1 + 1) / (tf + norm)
+        return sorted(scores.items(), key=lambda item: item[1], reverse=True)[:top_k]
+
+    def is_stale(self, max_age: float) -> bool:
+        return not self._synced_at or time.monotonic() - self._synced_at >= max_age
+
+    def sync(self, db: Session) -> int:
+        """Bring the index up to date with ``news_articles``; returns docs changed.
+
+        The table scan and tokenization run without the index lock, which is
+        only taken per document, so searches keep running during a sync.
+        """
+        with self._sync_lock:
+            rows = db.query(
+                NewsArticle.id, NewsArticle.content_hash, NewsArticle.keywords_json, NewsArticle.tags,
+            ).all()
+            current = {row[0]: _fingerprint(row[1], row[2], row[3]) for row in rows}
+            with self._lock:
+                known = dict(self._fingerprints)
+            changed = [doc_id for doc_id, fp in current.items() if known.get(doc_id) != fp]
+            removed = [doc_id for doc_id in known if doc_id not in current]
+
+            for doc_id in removed:
+                self.remove(doc_id)
+            for start in range(0, len(changed), 500):
+                batch = db.query(NewsArticle).filter(NewsArticle.id.in_(changed[start:start + 500])).all()
+                for article in batch:
+                    terms = article_terms(article)
+                    with self._lock:
+                        self.add(article.id, terms)
+                        self._fingerprints[article.id] = current[article.id]
+            self._synced_at = time.monotonic()
+
+        if changed or removed:
+            logger.info('BM25 index synced: %d added/updated, %d removed (%d docs)', len(changed), len(removed), len(self))
+        return len(changed) + len(removed)
+
+
+_index: Bm25Index | None = None
+_index_lock = threading.Lock()
+_VECTOR_WORKERS = 4
+_vector_executor: ThreadPoolExecutor | None = None
+_vector_slots = threading.BoundedSemaphore(_VECTOR_WORKERS)  # one per vector call in flight
+_refresh_executor: ThreadPoolExecutor | None = None
+_refresh_future = None
+
+
+def get_bm25_index() -> Bm25Index:
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = Bm25Index()
+    return _index
+
+
+def _get_vector_executor() -> ThreadPoolExecutor:
+    global _vector_executor
+    if _vector_executor is None:
+        with _index_lock:
+            if _vector_executor is None:
+                _vector_executor = ThreadPoolExecutor(max_workers=_VECTOR_WORKERS, thread_name_prefix='hybrid-vector')
+    return _vector_executor
+
+
+def refresh_bm25_index() -> int:
+    """Sync the index on a session of its own; returns docs changed."""
+    from app.db.session import SessionLocal
+
+    db = SessionLocal()
+    try:
+        return get_bm25_index().sync(db)
+    except Exception as exc:
+        logger.warning('BM25 index sync failed: %s', exc)
+        return 0
+    finally:
+        db.close()
+
+
+def schedule_bm25_refresh(force: bool = False) -> None:
+    """Start a background sync if the index is stale (or ``force``); never blocks.
+
+    Called at startup and after ingestion with ``force``, and by every search
+    without; at most one refresh runs at a time.
+    """
+    global _refresh_executor, _refresh_future
+    from app.core.config import settings
+
+    if not force and not get_bm25_index().is_stale(settings.SEARCH_BM25_SYNC_SECONDS):
+        return
+    with _index_lock:
+        if _refresh_future is not None and not _refresh_future.done():
+            return
+        if _refresh_executor is None:
+            _refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='bm25-refresh')
+        _refresh_future = _refresh_executor.submit(refresh_bm25_index)
+
+
+# ---------------------------------------------------------------------------
+# Hybrid retrieval
+# ---------------------------------------------------------------------------
+
+@dataclass
+class HybridHit:
+    article_id: int
+    score: float
+    ranks: dict[str, int] = field(default_factory=dict)  # retriever -> 1-based rank
+
+
+def reciprocal_rank_fusion(rankings: dict[str, list[int]], k: int = 60) -> list[HybridHit]:
+    """Merge ranked id lists: each list contributes ``1 / (k + rank)``."""
+    hits: dict[int, HybridHit] = {}
+    for name, ids in rankings.items():
+        for rank, doc_id in enumerate(ids, start=1):
+            hit = hits.setdefault(doc_id, HybridHit(article_id=doc_id, score=0.0))
+            hit.score += 1.0 / (k + rank)
+            hit.ranks[name] = rank
+    return sorted(hits.values(), key=lambda h: h.score, reverse=True)
+
+
+def _vector_ranking(query: str, top_k: int, filters: dict | None, min_score: float) -> list[int]:
+    from app.services.embedder import embed_user_query
+    from app.services.vector_store import get_vector_store
+
+    store = get_vector_store()
+    if not store.is_ready():
+        return []
+    vector = embed_user_query(query)
+    if vector is None:
+        return []
+    hits = store.search(vector, top_k=top_k, filters=filters)
+    # Every article is some distance away: without a floor any query "matches" the whole catalog
+    return [int(hit['id']) for hit in hits if hit['score'] >= min_score]
+
+
+def _bm25_ranking(query: str, top_k: int, doc_ids: Collection[int] | None) -> list[int]:
+    return [doc_id for doc_id, _ in get_bm25_index().search(query, top_k=top_k, doc_ids=doc_ids)]
+
+
+def _submit_vector_ranking(query: str, top_k: int, filters: dict | None, min_score: float) -> Future | None:
+    """Start a vector retrieval, or return None while every vector worker is busy."""
+    if not _vector_slots.acquire(blocking=False):
+        return None
+    try:
+        future = _get_vector_executor().submit(_vector_ranking, query, top_k, filters, min_score)
+    except Exception:
+        _vector_slots.release()
+        raise
+    future.add_done_callback(lambda _: _vector_slots.release())
+    return future
+
+
+def hybrid_search(
+    query: str,
+    top_k: int | None = None,
+    vector_filters: dict | None = None,
+    budget_ms: float | None = None,
+    doc_ids: Collection[int] | None = None,
+) -> list[HybridHit]:
+    """Run BM25 inline and vector retrieval alongside it, and fuse their rankings.
+
+    ``vector_filters`` restrict the vector search and ``doc_ids`` the BM25
+    candidates, so filtered searches rank only matching articles. Vector hits
+    scoring below ``SEARCH_VECTOR_MIN_SCORE`` are dropped.
+
+    A vector search that misses the budget, fails, or finds every vector
+    worker still busy is left out of the fusion rather than delaying the
+    response. A stale BM25 index is refreshed in the background; this search
+    uses it as it is.
+    """
+    from app.core.config import settings
+
+    top_k = top_k or settings.SEARCH_CANDIDATES
+    budget = (settings.SEARCH_BUDGET_MS if budget_ms is None else budget_ms) / 1000
+    schedule_bm25_refresh()
+
+    started = time.perf_counter()
+    vector_future = _submit_vector_ranking(query, top_k, vector_filters, settings.SEARCH_VECTOR_MIN_SCORE)
+    if vector_future is None:
+        logger.info('vector retrieval skipped: all %d vector workers are busy', _VECTOR_WORKERS)
+
+    rankings: dict[str, list[int]] = {}
+    try:
+        rankings['bm25'] = _bm25_ranking(query, top_k, doc_ids)
+    except Exception as exc:
+        logger.warning('bm25 retrieval failed: %s', exc)
+
+    if vector_future is not None:
+        remaining = max(0.0, budget - (time.perf_counter() - started))
+        done, _ = wait([vector_future], timeout=remaining)
+        if not done:
+            logger.info('vector retrieval missed the %.0fms search budget', budget * 1000)
+        else:
+            try:
+                rankings['vector'] = vector_future.result()
+            except Exception as exc:
+                logger.warning('vector retrieval failed: %s', exc)
+
+    return reciprocal_rank_fusion(rankings, k=settings.SEARCH_RRF_K)
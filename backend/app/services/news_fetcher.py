@@ -19,7 +19,8 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.models.news import NewsArticle, NewsSource, RawFeedItem
-from app.services.enrichment import enrich_article
+from app.services.enrichment import enrich_article, topic_rows
+from app.services.shared_pools import invalidate_shared_pools
 
 logger = logging.getLogger(__name__)
 
@@ -244,6 +245,7 @@ def _process_source(db: Session, source: NewsSource) -> dict:
                     'published_at': published,
                 })
                 existing_article.topics_json = enriched['topics_json']
+                existing_article.topic_rows = topic_rows(enriched['topics_json'], existing_article.published_at)
                 existing_article.keywords_json = enriched['keywords_json']
                 existing_article.quality_score = enriched['quality_score']
             raw_item.status = 'processed'
@@ -272,6 +274,7 @@ def _process_source(db: Session, source: NewsSource) -> dict:
             tags=','.join(source.tags.split(',')[:3]) if source.tags else '',
             language='en',
             topics_json=enriched['topics_json'],
+            topic_rows=topic_rows(enriched['topics_json'], published),
             keywords_json=enriched['keywords_json'],
             quality_score=enriched['quality_score'],
             popularity_score=0.0,
@@ -332,6 +335,10 @@ def fetch_news(db: Session) -> dict:
         time.sleep(1)
 
     db.commit()
+    invalidate_shared_pools()  # new articles and popularity-ordered pools are stale now
+
+    from app.services.hybrid_search import schedule_bm25_refresh
+    schedule_bm25_refresh(force=True)
     logger.info(
         'RSS ingestion complete: %d/%d sources ok, %d new articles',
         total_stats['sources_success'], total_stats['sources_checked'],
@@ -1,8 +1,10 @@
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
+from app.core.config import settings
 from app.db.session import SessionLocal
 from app.services.news_fetcher import fetch_news
+from app.services.vector_reconciler import run_maintenance
 
 
 def start_news_scheduler(app, interval_minutes: int = 30) -> None:
@@ -18,7 +20,21 @@ def start_news_scheduler(app, interval_minutes: int = 30) -> None:
         finally:
             db.close()
 
+    def vector_job():
+        db = SessionLocal()
+        try:
+            run_maintenance(db)
+        finally:
+            db.close()
+
     scheduler.add_job(job, IntervalTrigger(minutes=interval_minutes), id='news_fetch', replace_existing=True)
+    if settings.VECTOR_DB_PROVIDER != 'none' and settings.VECTOR_DB_RECONCILE_INTERVAL_MINUTES > 0:
+        scheduler.add_job(
+            vector_job,
+            IntervalTrigger(minutes=settings.VECTOR_DB_RECONCILE_INTERVAL_MINUTES),
+            id='vector_reconcile',
+            replace_existing=True,
+        )
     scheduler.start()
     app.state.news_scheduler = scheduler
 
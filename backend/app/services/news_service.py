@@ -1,10 +1,13 @@
-from datetime import datetime
+import logging
+from datetime import datetime, timezone
 from typing import List
 
-from sqlalchemy import case, or_
+from sqlalchemy import case, or_, select
 from sqlalchemy.orm import Session
 
 from app.models.news import (
+    ArticleEmbedding,
+    ArticleTopic,
     NewsArticle,
     NewsSource,
     UserHiddenArticle,
@@ -23,6 +26,10 @@ from app.schemas.news import (
     PreferencesIn,
     PreferencesOut,
 )
+from app.services.shared_pools import invalidate_shared_pools
+from app.services.user_profiles import apply_hidden, apply_preferences as apply_profile_preferences
+
+logger = logging.getLogger(__name__)
 
 
 # TODO: Replace stub data with pipeline + vector store integration.
@@ -60,6 +67,11 @@ def _parse_date(value: str | None) -> datetime | None:
         return None
 
 
+def _epoch(value: datetime) -> float:
+    """Epoch seconds; naive datetimes are UTC, like ``published_at``."""
+    return (value if value.tzinfo else value.replace(tzinfo=timezone.utc)).timestamp()
+
+
 def _get_or_create_preferences(db: Session, user: User) -> UserNewsPreference:
     pref = db.get(UserNewsPreference, user.id)
     if pref:
@@ -137,6 +149,7 @@ def update_preferences(db: Session, user: User, payload: PreferencesIn) -> Prefe
     pref.updated_at = datetime.utcnow()
     db.commit()
     db.refresh(pref)
+    apply_profile_preferences(user.id, pref)
     return PreferencesOut(
         topics=_split_csv(pref.topics),
         level=pref.level,
@@ -265,16 +278,29 @@ def get_explore(
     page: int,
     page_size: int,
 ) -> NewsFeedResponse:
+    if q and q.strip():
+        return search_articles(db, user, q, topic, source, from_date, to_date, page, page_size)
+    return _list_explore(db, user, topic, source, q, from_date, to_date, page, page_size)
+
+
+def _list_explore(
+    db: Session,
+    user: User,
+    topic: str | None,
+    source: str | None,
+    q: str | None,
+    from_date: str | None,
+    to_date: str | None,
+    page: int,
+    page_size: int,
+) -> NewsFeedResponse:
+    """Newest-first explore listing; ``q`` is a title/summary substring match."""
     query = db.query(NewsArticle).join(NewsSource).filter(NewsSource.enabled.is_(True))
     topic_filters = _split_csv(topic)
     query = _apply_article_filters(query, topic_filters, source, q, _parse_date(from_date), _parse_date(to_date))
 
-    hidden_subquery = (
-        db.query(UserHiddenArticle.article_id)
-        .filter(UserHiddenArticle.user_id == user.id)
-        .subquery()
-    )
-    query = query.filter(~NewsArticle.id.in_(hidden_subquery))
+    hidden_ids = select(UserHiddenArticle.article_id).where(UserHiddenArticle.user_id == user.id)
+    query = query.filter(~NewsArticle.id.in_(hidden_ids))
 
     query = query.order_by(NewsArticle.published_at.desc())
 
@@ -298,6 +324,105 @@ def get_explore(
     )
 
 
+def _search_vector_filters(
+    db: Session,
+    source_filter: str | None,
+    from_date: datetime | None,
+    to_date: datetime | None,
+    article_ids: set[int] | None,
+) -> dict | None:
+    """The explore filters as vector store metadata filters.
+
+    Topics are matched on tags, which the vector metadata does not carry, so
+    a topic filter is passed as the ``article_ids`` it allows.
+    """
+    filters: dict = {}
+    if source_filter:
+        try:
+            filters['source_id'] = int(source_filter)
+        except ValueError:
+            filters['source_id'] = {'$in': [
+                row[0] for row in db.query(NewsSource.id).filter(NewsSource.name.ilike(f'%{source_filter}%'))
+            ]}
+    published: dict = {}
+    if from_date:
+        published['$gte'] = _epoch(from_date)
+    if to_date:
+        published['$lte'] = _epoch(to_date)
+    if published:
+        filters['published_ts'] = published
+    if article_ids is not None:
+        filters['article_id'] = {'$in': sorted(article_ids)}
+    return filters or None
+
+
+def search_articles(
+    db: Session,
+    user: User,
+    q: str,
+    topic: str | None,
+    source: str | None,
+    from_date: str | None,
+    to_date: str | None,
+    page: int,
+    page_size: int,
+) -> NewsFeedResponse:
+    """Rank by hybrid BM25 + vector retrieval, then apply the explore filters.
+
+    Falls back to the substring listing while the BM25 index is still empty
+    (first build after startup) or when neither retriever finds anything.
+    """
+    from app.services.hybrid_search import get_bm25_index, hybrid_search
+
+    if not len(get_bm25_index()):
+        return _list_explore(db, user, topic, source, q, from_date, to_date, page, page_size)
+
+    topic_filters = _split_csv(topic)
+    start, end = _parse_date(from_date), _parse_date(to_date)
+    # Filter before ranking, not after: a narrow filter would otherwise only
+    # see whatever matched among the global top SEARCH_CANDIDATES
+    allowed_ids = None
+    if topic_filters or source or start or end:
+        id_query = db.query(NewsArticle.id).join(NewsSource).filter(NewsSource.enabled.is_(True))
+        id_query = _apply_article_filters(id_query, topic_filters, source, None, start, end)
+        allowed_ids = {row[0] for row in id_query}
+    hits = hybrid_search(
+        q.strip(),
+        vector_filters=_search_vector_filters(db, source, start, end, allowed_ids if topic_filters else None),
+        doc_ids=allowed_ids,
+    )
+    if not hits:
+        return _list_explore(db, user, topic, source, q, from_date, to_date, page, page_size)
+
+    page = max(1, page)
+    page_size = min(max(1, page_size), 50)
+    rank = {hit.article_id: position for position, hit in enumerate(hits)}
+    query = db.query(NewsArticle).join(NewsSource).filter(
+        NewsSource.enabled.is_(True),
+        NewsArticle.id.in_(list(rank)),
+    )
+    query = _apply_article_filters(query, topic_filters, source, None, start, end)
+    hidden_ids = select(UserHiddenArticle.article_id).where(UserHiddenArticle.user_id == user.id)
+    articles = query.filter(~NewsArticle.id.in_(hidden_ids)).all()
+    articles.sort(key=lambda article: rank[article.id])
+
+    items = articles[(page - 1) * page_size:page * page_size]
+    article_ids = [article.id for article in items]
+    saved_ids = set(
+        row[0]
+        for row in db.query(UserSavedArticle.article_id)
+        .filter(UserSavedArticle.user_id == user.id, UserSavedArticle.article_id.in_(article_ids))
+        .all()
+    )
+
+    return NewsFeedResponse(
+        items=[_serialize_article(article, article.id in saved_ids) for article in items],
+        page=page,
+        page_size=page_size,
+        total=len(articles),
+    )
+
+
 def get_saved(db: Session, user: User, page: int, page_size: int) -> NewsFeedResponse:
     page = max(1, page)
     page_size = min(max(1, page_size), 50)
@@ -390,6 +515,11 @@ def hide_article(db: Session, user: User, article_id: int) -> dict:
     if saved:
         db.delete(saved)
     db.commit()
+    try:
+        apply_hidden(db, user.id, article_id)
+    except Exception as exc:
+        db.rollback()
+        logger.warning('User profile update failed for user %d: %s', user.id, exc)
     return {'status': 'hidden'}
 
 
@@ -435,6 +565,7 @@ def admin_update_source(db: Session, source_id: int, payload: NewsSourceUpdate)
         source.enabled = payload.enabled
 
     db.commit()
+    invalidate_shared_pools()
     db.refresh(source)
     return _serialize_source(source)
 
@@ -445,6 +576,7 @@ def admin_toggle_source(db: Session, source_id: int) -> NewsSourceOut:
         raise ValueError('Source not found')
     source.enabled = not source.enabled
     db.commit()
+    invalidate_shared_pools()
     db.refresh(source)
     return _serialize_source(source)
 
@@ -453,8 +585,24 @@ def admin_delete_source(db: Session, source_id: int) -> None:
     source = db.get(NewsSource, source_id)
     if not source:
         raise ValueError('Source not found')
+    article_ids = [row[0] for row in db.query(NewsArticle.id).filter(NewsArticle.source_id == source_id).all()]
+    if article_ids:
+        db.query(ArticleEmbedding).filter(
+            ArticleEmbedding.article_id.in_(article_ids)
+        ).delete(synchronize_session=False)
+        db.query(ArticleTopic).filter(
+            ArticleTopic.article_id.in_(article_ids)
+        ).delete(synchronize_session=False)
     db.delete(source)
     db.commit()
+    invalidate_shared_pools()
+
+    # SQL cascades stop at the database; drop the vectors too
+    try:
+        from app.services.vector_reconciler import delete_article_vectors
+        delete_article_vectors(article_ids)
+    except Exception as exc:
+        logger.warning('Vector cleanup for source %d failed (%s); the reconciler will retry', source_id, exc)
 
 
 def admin_fetch_now(db: Session) -> FetchNowResponse:
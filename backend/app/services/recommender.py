@@ -1,22 +1,29 @@
 """Hybrid recommendation engine.
 
-Combines 4 candidate pools (vector, topic, trending, newest),
-applies filtering, scoring, diversity reranking, and explainability.
+Combines 4 candidate pools (vector, topic, trending, newest), generated
+concurrently under per-pool deadlines, then applies filtering, scoring,
+diversity reranking, and explainability. The user-independent trending and
+newest pools come from a process-wide cache of feature records
+(``shared_pools``); full articles are loaded only for the returned page.
 """
 
 from __future__ import annotations
 
-import json
 import logging
 import math
+import threading
+import time
 from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import String, case, cast, func, literal, or_, select, union_all
+from sqlalchemy.orm import Session, contains_eager, joinedload
 
 from app.models.news import (
+    ArticleTopic,
     FeedImpression,
     NewsArticle,
     NewsSource,
@@ -25,6 +32,7 @@ from app.models.news import (
     UserNewsPreference,
     UserSavedArticle,
 )
+from app.services.shared_pools import ArticleFeatures, get_shared_pool_cache
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +62,28 @@ MAX_PER_SOURCE = 2
 MAX_PER_TOPIC = 3
 
 
+def event_weight(event_type: str, dwell_seconds: float | None = None) -> float:
+    """Implicit signal weight of a single event, with dwell-time tiers."""
+    weight = EVENT_WEIGHTS.get(event_type, 0)
+    if event_type == 'dwell' and dwell_seconds:
+        if dwell_seconds >= 60:
+            weight = 1.0
+        elif dwell_seconds >= 30:
+            weight = 0.5
+        else:
+            weight = 0.1
+    return weight
+
+
+@dataclass(frozen=True)
+class EventRecord:
+    """The ``UserEvent`` fields profile updates read, detached from any session."""
+    article_id: int
+    event_type: str
+    dwell_seconds: float | None
+    created_at: datetime
+
+
 # ---------------------------------------------------------------------------
 # User profile
 # ---------------------------------------------------------------------------
@@ -72,19 +102,108 @@ class UserProfile:
     recent_impression_ids: set[int] = field(default_factory=set)
 
 
+PROFILE_EVENT_WINDOW_DAYS = 30
+IMPRESSION_WINDOW_HOURS = 24
+
+
+def normalize_affinities(scores: dict) -> dict:
+    """Map raw signed scores to [0, 1], 0.5 being neutral."""
+    if not scores:
+        return {}
+    max_score = max(abs(v) for v in scores.values()) or 1
+    return {k: max(0, min(1, (v / max_score + 1) / 2)) for k, v in scores.items()}
+
+
+def apply_preferences(profile: UserProfile, prefs: UserNewsPreference | None) -> UserProfile:
+    """Copy explicit preferences onto ``profile``."""
+    if prefs:
+        profile.topics = [t.strip() for t in (prefs.topics or '').split(',') if t.strip()]
+        profile.level = prefs.level or 'beginner'
+        profile.equipment = prefs.equipment or 'gym'
+        profile.blocked_keywords = [k.strip().lower() for k in (prefs.blocked_keywords or '').split(',') if k.strip()]
+    return profile
+
+
+def event_weight_sql():
+    """``event_weight`` as a SQL CASE over ``user_events`` columns."""
+    dwell = case(
+        (or_(UserEvent.dwell_seconds.is_(None), UserEvent.dwell_seconds == 0), EVENT_WEIGHTS['dwell']),
+        (UserEvent.dwell_seconds >= 60, 1.0),
+        (UserEvent.dwell_seconds >= 30, 0.5),
+        else_=0.1,
+    )
+    whens = [(UserEvent.event_type == name, weight) for name, weight in EVENT_WEIGHTS.items() if name != 'dwell']
+    return case((UserEvent.event_type == 'dwell', dwell), *whens, else_=0.0)
+
+
+def aggregate_event_scores(
+    db: Session, user_id: int, since: datetime,
+) -> tuple[dict[str, float], dict[int, float], set[int]]:
+    """Raw topic and source scores plus interacted article ids from events since ``since``.
+
+    One round trip: weights are computed in SQL and the per-source sums,
+    per-topic sums (via ``article_topics``) and interacted ids come back as
+    one ``UNION ALL``.
+    """
+    weight = event_weight_sql()
+    window = (UserEvent.user_id == user_id, UserEvent.created_at >= since)
+
+    by_source = (
+        select(literal('source').label('kind'), cast(NewsArticle.source_id, String).label('key'),
+               func.sum(weight).label('score'))
+        .select_from(UserEvent).join(NewsArticle, NewsArticle.id == UserEvent.article_id)
+        .where(*window)
+        .group_by(NewsArticle.source_id)
+    )
+    by_topic = (
+        select(literal('topic').label('kind'), ArticleTopic.topic.label('key'), func.sum(weight).label('score'))
+        .select_from(UserEvent).join(ArticleTopic, ArticleTopic.article_id == UserEvent.article_id)
+        .where(*window)
+        .group_by(ArticleTopic.topic)
+    )
+    interacted = (
+        select(literal('article').label('kind'), cast(UserEvent.article_id, String).label('key'),
+               literal(0.0).label('score'))
+        .where(*window)
+        .distinct()
+    )
+
+    topic_scores: dict[str, float] = {}
+    source_scores: dict[int, float] = {}
+    interacted_ids: set[int] = set()
+    for kind, key, score in db.execute(union_all(by_source, by_topic, interacted)):
+        if kind == 'source':
+            source_scores[int(key)] = float(score)
+        elif kind == 'topic':
+            topic_scores[key] = float(score)
+        else:
+            interacted_ids.add(int(key))
+
+    return topic_scores, source_scores, interacted_ids
+
+
+def recent_impression_ids(db: Session, user_id: int) -> set[int]:
+    cutoff = datetime.utcnow() - timedelta(hours=IMPRESSION_WINDOW_HOURS)
+    impressions = db.query(FeedImpression.article_id).filter(
+        FeedImpression.user_id == user_id,
+        FeedImpression.created_at >= cutoff,
+    ).all()
+    return {i[0] for i in impressions}
+
+
 def build_user_profile(db: Session, user_id: int) -> UserProfile:
-    """Build user profile from explicit preferences and implicit events."""
+    """Build user profile from explicit preferences and implicit events.
+
+    This is the uncached, from-scratch build; feed requests go through
+    ``user_profiles.get_user_profile``.
+    """
     profile = UserProfile(user_id=user_id)
 
     # --- Explicit preferences ---
     prefs = db.query(UserNewsPreference).filter(
         UserNewsPreference.user_id == user_id
     ).first()
-    if prefs:
-        profile.topics = [t.strip() for t in (prefs.topics or '').split(',') if t.strip()]
-        profile.level = prefs.level or 'beginner'
-        profile.equipment = prefs.equipment or 'gym'
-        profile.blocked_keywords = [k.strip().lower() for k in (prefs.blocked_keywords or '').split(',') if k.strip()]
+    apply_preferences(profile, prefs)
 
     # --- Hidden articles ---
     hidden = db.query(UserHiddenArticle.article_id).filter(
@@ -93,56 +212,15 @@ def build_user_profile(db: Session, user_id: int) -> UserProfile:
     profile.hidden_article_ids = {h[0] for h in hidden}
 
     # --- Recent impressions (last 24h) ---
-    cutoff_24h = datetime.utcnow() - timedelta(hours=24)
-    impressions = db.query(FeedImpression.article_id).filter(
-        FeedImpression.user_id == user_id,
-        FeedImpression.created_at >= cutoff_24h,
-    ).all()
-    profile.recent_impression_ids = {i[0] for i in impressions}
+    profile.recent_impression_ids = recent_impression_ids(db, user_id)
 
     # --- Implicit signals from events (last 30 days) ---
-    cutoff_30d = datetime.utcnow() - timedelta(days=30)
-    events = db.query(UserEvent).filter(
-        UserEvent.user_id == user_id,
-        UserEvent.created_at >= cutoff_30d,
-    ).all()
-
-    topic_scores: dict[str, float] = {}
-    source_scores: dict[int, float] = {}
-    interacted_ids: set[int] = set()
-
-    for event in events:
-        weight = EVENT_WEIGHTS.get(event.event_type, 0)
-        if event.event_type == 'dwell' and event.dwell_seconds:
-            if event.dwell_seconds >= 60:
-                weight = 1.0
-            elif event.dwell_seconds >= 30:
-                weight = 0.5
-            else:
-                weight = 0.1
-
-        interacted_ids.add(event.article_id)
-
-        # Look up article topics
-        article = db.get(NewsArticle, event.article_id)
-        if article:
-            topics = []
-            try:
-                topics = json.loads(article.topics_json) if article.topics_json else []
-            except Exception:
-                pass
-            for topic in topics:
-                topic_scores[topic] = topic_scores.get(topic, 0) + weight
-            source_scores[article.source_id] = source_scores.get(article.source_id, 0) + weight
+    cutoff_30d = datetime.utcnow() - timedelta(days=PROFILE_EVENT_WINDOW_DAYS)
+    topic_scores, source_scores, interacted_ids = aggregate_event_scores(db, user_id, cutoff_30d)
 
     # Normalize affinities to [0, 1]
-    if topic_scores:
-        max_score = max(abs(v) for v in topic_scores.values()) or 1
-        profile.topic_affinities = {k: max(0, min(1, (v / max_score + 1) / 2)) for k, v in topic_scores.items()}
-    if source_scores:
-        max_score = max(abs(v) for v in source_scores.values()) or 1
-        profile.source_affinities = {k: max(0, min(1, (v / max_score + 1) / 2)) for k, v in source_scores.items()}
-
+    profile.topic_affinities = normalize_affinities(topic_scores)
+    profile.source_affinities = normalize_affinities(source_scores)
     profile.recent_article_ids = interacted_ids
 
     return profile
@@ -154,9 +232,10 @@ def build_user_profile(db: Session, user_id: int) -> UserProfile:
 
 @dataclass
 class Candidate:
-    article: NewsArticle
+    article: NewsArticle | ArticleFeatures  # features for the shared pools until the page is hydrated
     pool: str  # 'vector' | 'topic' | 'trending' | 'newest'
     similarity: float = 0.0
+    topics: list[str] = field(default_factory=list)  # from article_topics, in topics_json order
 
 
 def _get_topic_candidates(db: Session, profile: UserProfile, limit: int = 30) -> list[Candidate]:
@@ -169,43 +248,109 @@ def _get_topic_candidates(db: Session, profile: UserProfile, limit: int = 30) ->
     if not top_topics:
         return []
 
-    query = db.query(NewsArticle).join(NewsSource).filter(
+    # Index range scans on article_topics (topic, published_at)
+    matching = select(ArticleTopic.article_id).where(
+        ArticleTopic.topic.in_(top_topics),
+        ArticleTopic.published_at >= cutoff,
+    )
+    query = db.query(NewsArticle).join(NewsSource).options(contains_eager(NewsArticle.source)).filter(
         NewsSource.enabled.is_(True),
         NewsArticle.published_at >= cutoff,
+        NewsArticle.id.in_(matching),
     )
 
-    # Filter by topics using LIKE on topics_json
-    from sqlalchemy import or_
-    topic_filters = [NewsArticle.topics_json.contains(f'"{t}"') for t in top_topics]
-    query = query.filter(or_(*topic_filters))
-
     articles = query.order_by(NewsArticle.published_at.desc()).limit(limit).all()
     return [Candidate(article=a, pool='topic') for a in articles]
 
 
-def _get_trending_candidates(db: Session, limit: int = 20) -> list[Candidate]:
-    """Get articles with highest popularity score from last 3 days."""
+def _topics_by_article(db: Session, article_ids: list[int]) -> dict[int, list[str]]:
+    """Topics of each article from ``article_topics``, in ``topics_json`` order."""
+    topics: dict[int, list[str]] = {}
+    if not article_ids:
+        return topics
+    rows = (
+        db.query(ArticleTopic.article_id, ArticleTopic.topic)
+        .filter(ArticleTopic.article_id.in_(article_ids))
+        .order_by(ArticleTopic.article_id, ArticleTopic.position)
+        .all()
+    )
+    for article_id, topic in rows:
+        topics.setdefault(article_id, []).append(topic)
+    return topics
+
+
+def _load_features(db: Session, query) -> list[ArticleFeatures]:
+    """Run a ``NewsArticle`` query as plain column rows, topics attached."""
+    rows = query.with_entities(
+        NewsArticle.id, NewsArticle.source_id, NewsArticle.title, NewsArticle.summary,
+        NewsArticle.published_at, NewsArticle.language, NewsArticle.popularity_score, NewsArticle.quality_score,
+    ).all()
+    topics = _topics_by_article(db, [row.id for row in rows])
+    return [ArticleFeatures(*row, topics=tuple(topics.get(row.id, ()))) for row in rows]
+
+
+def _trending_features(db: Session, limit: int = 20) -> list[ArticleFeatures]:
+    """Articles with highest popularity score from last 3 days."""
     cutoff = datetime.utcnow() - timedelta(days=3)
-    articles = (
+    query = (
         db.query(NewsArticle).join(NewsSource)
         .filter(NewsSource.enabled.is_(True), NewsArticle.published_at >= cutoff)
         .order_by(NewsArticle.popularity_score.desc())
         .limit(limit)
-        .all()
     )
-    return [Candidate(article=a, pool='trending') for a in articles]
+    return _load_features(db, query)
 
 
-def _get_newest_candidates(db: Session, limit: int = 20) -> list[Candidate]:
-    """Get most recent articles regardless of topic."""
-    articles = (
+def _newest_features(db: Session, limit: int = 20) -> list[ArticleFeatures]:
+    """Most recent articles regardless of topic."""
+    query = (
         db.query(NewsArticle).join(NewsSource)
         .filter(NewsSource.enabled.is_(True))
         .order_by(NewsArticle.published_at.desc())
         .limit(limit)
-        .all()
     )
-    return [Candidate(article=a, pool='newest') for a in articles]
+    return _load_features(db, query)
+
+
+# Pools that do not depend on the user, served from ``shared_pools``
+SHARED_POOLS = {'trending': _trending_features, 'newest': _newest_features}
+
+
+def _shared_candidates(name: str, features: tuple[ArticleFeatures, ...]) -> list[Candidate]:
+    return [Candidate(article=f, pool=name, topics=list(f.topics)) for f in features]
+
+
+def _get_shared_candidates(db: Session, name: str, limit: int = 20) -> list[Candidate]:
+    """Candidates of a shared pool, loading it into the cache on a miss."""
+    features = get_shared_pool_cache().get_or_load((name, limit), lambda: SHARED_POOLS[name](db, limit))
+    return _shared_candidates(name, features)
+
+
+def _get_trending_candidates(db: Session, limit: int = 20) -> list[Candidate]:
+    """Get articles with highest popularity score from last 3 days."""
+    return _get_shared_candidates(db, 'trending', limit)
+
+
+def _get_newest_candidates(db: Session, limit: int = 20) -> list[Candidate]:
+    """Get most recent articles regardless of topic."""
+    return _get_shared_candidates(db, 'newest', limit)
+
+
+def _vector_filters(db: Session, profile: UserProfile) -> dict:
+    """Push the cheap ``_filter_candidates`` rules down into the vector search."""
+    cutoff = datetime.utcnow() - timedelta(days=FRESHNESS_WINDOW_DAYS)
+    disabled_source_ids = sorted(_disabled_source_ids(db))
+    excluded_ids = sorted(set(profile.hidden_article_ids) | set(profile.recent_impression_ids))
+
+    filters: dict = {
+        'published_ts': {'$gte': cutoff.replace(tzinfo=timezone.utc).timestamp()},
+        'language': 'en',
+    }
+    if disabled_source_ids:
+        filters['source_id'] = {'$nin': disabled_source_ids}
+    if excluded_ids:
+        filters['article_id'] = {'$nin': excluded_ids}
+    return filters
 
 
 def _get_vector_candidates(db: Session, profile: UserProfile, limit: int = 50) -> list[Candidate]:
@@ -214,47 +359,215 @@ def _get_vector_candidates(db: Session, profile: UserProfile, limit: int = 50) -
         from app.services.vector_store import get_vector_store
         from app.services.embedder import embed_user_query
 
+        from app.services.user_vectors import get_user_vector
+
         store = get_vector_store()
-        if store.count() == 0:
+        # Cached snapshot: no backend round trip when the store is empty or down
+        if not store.is_ready():
             return []
 
-        # Build query from user topics
-        query_text = ' '.join(profile.topics) if profile.topics else 'fitness training workout'
-        if profile.topic_affinities:
-            top_affinity_topics = sorted(
-                profile.topic_affinities, key=profile.topic_affinities.get, reverse=True
-            )[:5]
-            query_text = ' '.join(top_affinity_topics) + ' ' + query_text
+        # Prefer the incrementally maintained profile vector (no text encoding)
+        query_vector = get_user_vector(profile.user_id)
 
-        query_vector = embed_user_query(query_text)
+        if query_vector is None:
+            # Build query from user topics
+            query_text = ' '.join(profile.topics) if profile.topics else 'fitness training workout'
+            if profile.topic_affinities:
+                top_affinity_topics = sorted(
+                    profile.topic_affinities, key=profile.topic_affinities.get, reverse=True
+                )[:5]
+                query_text = ' '.join(top_affinity_topics) + ' ' + query_text
+
+            query_vector = embed_user_query(query_text)
         if query_vector is None:
             return []
 
-        results = store.search(query_vector=query_vector, top_k=limit)
-
-        candidates = []
-        for hit in results:
-            article_id = int(hit['id'])
-            article = db.get(NewsArticle, article_id)
-            if article:
-                candidates.append(Candidate(
-                    article=article,
-                    pool='vector',
-                    similarity=hit.get('score', 0.0),
-                ))
-        return candidates
+        results = store.search(
+            query_vector=query_vector,
+            top_k=limit,
+            filters=_vector_filters(db, profile),
+        )
+
+        ids = [int(hit['id']) for hit in results]
+        articles = {
+            a.id: a
+            for a in db.query(NewsArticle).options(joinedload(NewsArticle.source)).filter(NewsArticle.id.in_(ids))
+        } if ids else {}
+        return [
+            Candidate(article=articles[article_id], pool='vector', similarity=hit.get('score', 0.0))
+            for article_id, hit in zip(ids, results)
+            if article_id in articles
+        ]
 
     except Exception as exc:
         logger.warning('Vector search failed (%s), using SQL-only pools', exc)
         return []
 
 
+@dataclass
+class PoolResult:
+    name: str
+    candidates: list[Candidate] = field(default_factory=list)
+    status: str = 'ok'  # 'ok' | 'cached' | 'timeout' | 'busy' | 'error'
+    elapsed_ms: float = 0.0
+
+    def timing(self) -> dict:
+        return {'status': self.status, 'ms': round(self.elapsed_ms, 1), 'candidates': len(self.candidates)}
+
+
+_pool_executor: ThreadPoolExecutor | None = None
+_pool_executor_lock = threading.Lock()
+_pool_slots: dict[str, threading.BoundedSemaphore] = {}
+
+
+def _get_pool_executor() -> ThreadPoolExecutor:
+    global _pool_executor
+    if _pool_executor is None:
+        with _pool_executor_lock:
+            if _pool_executor is None:
+                from app.core.config import settings
+                _pool_executor = ThreadPoolExecutor(
+                    max_workers=max(4, settings.RECOMMENDER_POOL_WORKERS), thread_name_prefix='candidate-pool',
+                )
+    return _pool_executor
+
+
+def _submit_pool(name: str, fn, *args, **kwargs) -> Future | None:
+    """Submit one pool run, or return None while the pool has its share of workers busy.
+
+    Runs that miss their deadline keep their worker and session until they
+    return, so each pool may hold at most a quarter of the workers: a slow
+    pool cannot starve the others or exhaust DB connections.
+    """
+    with _pool_executor_lock:
+        slots = _pool_slots.get(name)
+        if slots is None:
+            from app.core.config import settings
+            slots = _pool_slots[name] = threading.BoundedSemaphore(max(1, settings.RECOMMENDER_POOL_WORKERS // 4))
+    if not slots.acquire(blocking=False):
+        return None
+    try:
+        future = _get_pool_executor().submit(_run_pool, fn, *args, **kwargs)
+    except Exception:
+        slots.release()
+        raise
+    future.add_done_callback(lambda _: slots.release())
+    return future
+
+
+def _run_pool(fn, *args, **kwargs) -> tuple[list[Candidate], float]:
+    """Run one pool on its own session; articles come back detached with ``source`` loaded."""
+    from app.db.session import SessionLocal
+
+    started = time.perf_counter()
+    db = SessionLocal()
+    try:
+        candidates = fn(db, *args, **kwargs)
+        db.expunge_all()
+    finally:
+        db.close()
+    return candidates, (time.perf_counter() - started) * 1000
+
+
+def _generate_candidates(profile: UserProfile) -> list[PoolResult]:
+    """Run all pools concurrently; a pool that misses its deadline is dropped.
+
+    Shared pools already in the cache are answered without a session or a
+    thread. Results are returned in pool priority order (vector, topic,
+    trending, newest), whatever order they finished in.
+    """
+    from app.core.config import settings
+
+    pools = [
+        ('vector', settings.RECOMMENDER_VECTOR_POOL_BUDGET_MS, _get_vector_candidates, (profile,), {'limit': 50}),
+        ('topic', settings.RECOMMENDER_POOL_BUDGET_MS, _get_topic_candidates, (profile,), {'limit': 30}),
+        ('trending', settings.RECOMMENDER_POOL_BUDGET_MS, _get_trending_candidates, (), {'limit': 20}),
+        ('newest', settings.RECOMMENDER_POOL_BUDGET_MS, _get_newest_candidates, (), {'limit': 20}),
+    ]
+    shared = get_shared_pool_cache()
+    started = time.perf_counter()
+    futures = []
+    for name, budget, fn, args, kwargs in pools:
+        cached = shared.get((name, kwargs['limit'])) if name in SHARED_POOLS else None
+        if cached is not None:
+            futures.append((name, budget, cached))
+        else:
+            futures.append((name, budget, _submit_pool(name, fn, *args, **kwargs)))
+
+    results = []
+    for name, budget_ms, future in futures:
+        if isinstance(future, tuple):
+            results.append(PoolResult(name, _shared_candidates(name, future), 'cached'))
+            continue
+        if future is None:
+            logger.info('Candidate pool "%s" skipped: its previous runs are still in flight', name)
+            results.append(PoolResult(name, status='busy'))
+            continue
+        remaining = max(0.0, budget_ms / 1000 - (time.perf_counter() - started))
+        try:
+            candidates, elapsed_ms = future.result(timeout=remaining)
+            results.append(PoolResult(name, candidates, 'ok', elapsed_ms))
+        except FutureTimeout:
+            logger.info('Candidate pool "%s" missed its %.0fms budget', name, budget_ms)
+            results.append(PoolResult(name, status='timeout', elapsed_ms=(time.perf_counter() - started) * 1000))
+        except Exception as exc:
+            logger.warning('Candidate pool "%s" failed: %s', name, exc)
+            results.append(PoolResult(name, status='error', elapsed_ms=(time.perf_counter() - started) * 1000))
+    return results
+
+
+def _attach_topics(db: Session, candidates: list[Candidate]) -> None:
+    """Load topics of the ORM-backed candidates in one ``article_topics`` query.
+
+    Feature records from the shared pools carry their topics already.
+    """
+    pending = [c for c in candidates if isinstance(c.article, NewsArticle)]
+    if not pending:
+        return
+    topics = _topics_by_article(db, [c.article.id for c in pending])
+    for c in pending:
+        c.topics = topics.get(c.article.id, [])
+
+
+def _hydrate(db: Session, candidates: list[Candidate]) -> list[Candidate]:
+    """Swap feature records for full ``NewsArticle`` rows, for serialization.
+
+    Articles deleted, or whose source was disabled, since their pool was
+    cached are dropped.
+    """
+    ids = [c.article.id for c in candidates if isinstance(c.article, ArticleFeatures)]
+    if not ids:
+        return candidates
+    articles = {
+        a.id: a for a in db.query(NewsArticle).options(joinedload(NewsArticle.source)).filter(NewsArticle.id.in_(ids))
+    }
+    hydrated = []
+    for c in candidates:
+        if isinstance(c.article, ArticleFeatures):
+            article = articles.get(c.article.id)
+            if article is None or (article.source and not article.source.enabled):
+                continue
+            c.article = article
+        hydrated.append(c)
+    return hydrated
+
+
 # ---------------------------------------------------------------------------
 # Filtering
 # ---------------------------------------------------------------------------
 
-def _filter_candidates(candidates: list[Candidate], profile: UserProfile) -> list[Candidate]:
-    """Remove articles that should not be shown."""
+def _disabled_source_ids(db: Session) -> set[int]:
+    return {row[0] for row in db.query(NewsSource.id).filter(NewsSource.enabled == False).all()}  # noqa: E712
+
+
+def _filter_candidates(
+    candidates: list[Candidate], profile: UserProfile, disabled_source_ids: set[int] = frozenset(),
+) -> list[Candidate]:
+    """Remove articles that should not be shown.
+
+    ``disabled_source_ids`` is read fresh per request: cached shared pools may
+    predate a source being disabled, possibly on another worker.
+    """
     cutoff = datetime.utcnow() - timedelta(days=FRESHNESS_WINDOW_DAYS)
     filtered = []
 
@@ -267,7 +580,9 @@ def _filter_candidates(candidates: list[Candidate], profile: UserProfile) -> lis
         if a.id in profile.recent_impression_ids:
             continue
         # Skip disabled sources
-        if a.source and not a.source.enabled:
+        if a.source_id in disabled_source_ids:
+            continue
+        if isinstance(a, NewsArticle) and a.source and not a.source.enabled:
             continue
         # Skip stale articles
         if a.published_at and a.published_at < cutoff:
@@ -290,8 +605,14 @@ def _filter_candidates(candidates: list[Candidate], profile: UserProfile) -> lis
 # Scoring
 # ---------------------------------------------------------------------------
 
-def _score_candidate(c: Candidate, profile: UserProfile, source_counts: Counter) -> float:
-    """Compute ranking score for a candidate article."""
+def _score_candidate(
+    c: Candidate, profile: UserProfile, source_counts: Counter, now: datetime | None = None,
+) -> float:
+    """Compute ranking score for a candidate article.
+
+    Scalar reference for ``candidate_scoring.score_candidates``, which the
+    feed uses; keep the two in step when changing weights or terms.
+    """
     a = c.article
 
     # Similarity (from vector search or 0)
@@ -299,19 +620,14 @@ def _score_candidate(c: Candidate, profile: UserProfile, source_counts: Counter)
 
     # Recency decay
     if a.published_at:
-        days_old = max(0, (datetime.utcnow() - a.published_at).total_seconds() / 86400)
+        days_old = max(0, ((now or datetime.utcnow()) - a.published_at).total_seconds() / 86400)
         recency = math.exp(-0.1 * days_old)
     else:
         recency = 0.3  # Unknown date penalty
 
     # Preference match
     pref_match = 0.0
-    try:
-        article_topics = json.loads(a.topics_json) if a.topics_json else []
-    except Exception:
-        article_topics = []
-
-    for topic in article_topics:
+    for topic in c.topics:
         if topic in profile.topics:
             pref_match = 1.0
             break
@@ -354,11 +670,7 @@ def _diversify(ranked: list[Candidate], page_size: int) -> list[Candidate]:
     for c in ranked:
         if source_count[c.article.source_id] >= MAX_PER_SOURCE:
             continue
-        try:
-            topics = json.loads(c.article.topics_json) if c.article.topics_json else ['general']
-        except Exception:
-            topics = ['general']
-        primary_topic = topics[0] if topics else 'general'
+        primary_topic = c.topics[0] if c.topics else 'general'
         if topic_count[primary_topic] >= MAX_PER_TOPIC:
             continue
 
@@ -380,12 +692,7 @@ def _explain(c: Candidate, score: float, profile: UserProfile) -> dict:
     """Generate why_this explanation for an article."""
     reasons = []
 
-    try:
-        topics = json.loads(c.article.topics_json) if c.article.topics_json else []
-    except Exception:
-        topics = []
-
-    for topic in topics:
+    for topic in c.topics:
         if topic in profile.topics:
             reasons.append(f'matched_topic:{topic}')
             break
@@ -427,41 +734,30 @@ def get_recommended_feed(
 ) -> dict:
     """Run the full hybrid recommendation pipeline.
 
-    Returns ``{items: [...], page, page_size, total}``.
+    Returns ``{items: [...], page, page_size, total}``; with ``explain`` the
+    response also carries per-pool ``timings``.
     """
-    profile = build_user_profile(db, user_id)
-
-    # 1. Candidate generation (4 pools)
-    all_candidates: dict[int, Candidate] = {}
-
-    for c in _get_vector_candidates(db, profile, limit=50):
-        if c.article.id not in all_candidates:
-            all_candidates[c.article.id] = c
+    from app.services.candidate_scoring import score_candidates
+    from app.services.user_profiles import get_user_profile, note_impressions
 
-    for c in _get_topic_candidates(db, profile, limit=30):
-        if c.article.id not in all_candidates:
-            all_candidates[c.article.id] = c
+    profile = get_user_profile(db, user_id)
 
-    for c in _get_trending_candidates(db, limit=20):
-        if c.article.id not in all_candidates:
-            all_candidates[c.article.id] = c
-
-    for c in _get_newest_candidates(db, limit=20):
-        if c.article.id not in all_candidates:
-            all_candidates[c.article.id] = c
+    # 1. Candidate generation (4 pools, concurrently)
+    pool_results = _generate_candidates(profile)
+    all_candidates: dict[int, Candidate] = {}
+    for result in pool_results:
+        for c in result.candidates:
+            if c.article.id not in all_candidates:
+                all_candidates[c.article.id] = c
 
     candidates = list(all_candidates.values())
 
     # 2. Filter
-    candidates = _filter_candidates(candidates, profile)
+    candidates = _filter_candidates(candidates, profile, _disabled_source_ids(db))
+    _attach_topics(db, candidates)
 
-    # 3. Score
-    source_counts: Counter = Counter()
-    scored: list[tuple[Candidate, float]] = []
-    for c in candidates:
-        score = _score_candidate(c, profile, source_counts)
-        scored.append((c, score))
-        source_counts[c.article.source_id] += 1
+    # 3. Score (vectorized, same scores as _score_candidate in candidate order)
+    scored: list[tuple[Candidate, float]] = list(zip(candidates, score_candidates(candidates, profile)))
 
     # 4. Sort by score
     scored.sort(key=lambda x: x[1], reverse=True)
@@ -472,10 +768,10 @@ def get_recommended_feed(
     diversified = _diversify(ranked, page_size=page_size * 3)  # Get enough for multiple pages
     total = len(diversified)
 
-    # 6. Paginate
+    # 6. Paginate, then load full articles for the page only
     start = (page - 1) * page_size
     end = start + page_size
-    page_items = diversified[start:end]
+    page_items = _hydrate(db, diversified[start:end])
 
     # 7. Log impressions
     for pos, c in enumerate(page_items):
@@ -486,6 +782,7 @@ def get_recommended_feed(
             feed_type='feed',
         ))
     db.commit()
+    note_impressions(user_id, [c.article.id for c in page_items])
 
     # 8. Build response
     from app.services.news_service import _serialize_article
@@ -507,9 +804,12 @@ def get_recommended_feed(
             article_dict['why_this'] = _explain(c, scores.get(c.article.id, 0), profile)
         items.append(article_dict)
 
-    return {
+    response = {
         'items': items,
         'page': page,
         'page_size': page_size,
         'total': total,
     }
+    if explain:
+        response['timings'] = {result.name: result.timing() for result in pool_results}
+    return response
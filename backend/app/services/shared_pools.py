@@ -0,0 +1,120 @@
+"""Process-wide cache of the user-independent candidate pools.
+
+The trending and newest pools are the same for every user, so they are
+loaded once as lightweight ``ArticleFeatures`` records (columns only, no ORM
+objects) and shared by all feed requests until ``RECOMMENDER_SHARED_POOL_TTL_SECONDS``
+passes or the next ingestion run calls ``invalidate_shared_pools``. Feed
+requests only filter and score the records; full articles are loaded for the
+page that is actually returned.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Hashable, Iterable
+
+
+@dataclass(frozen=True)
+class ArticleFeatures:
+    """The ``NewsArticle`` fields that filtering, scoring and reranking read."""
+    id: int
+    source_id: int
+    title: str
+    summary: str
+    published_at: datetime | None
+    language: str
+    popularity_score: float
+    quality_score: float
+    topics: tuple[str, ...] = ()
+
+
+# ---------------------------------------------------------------------------
+# In-memory TTL cache
+# ---------------------------------------------------------------------------
+
+class SharedPoolCache:
+    """Thread-safe pool key -> tuple of ``ArticleFeatures`` with a TTL.
+
+    Loads are single-flight per key, so an expiry or invalidation under load
+    costs one query, not one per concurrent request. A load that started
+    before an invalidation is returned to its caller but not stored.
+    """
+
+    def __init__(self, ttl_seconds: float = 60.0):
+        self.ttl_seconds = ttl_seconds
+        self._data: dict[Hashable, tuple[float, tuple[ArticleFeatures, ...]]] = {}
+        self._lock = threading.Lock()
+        self._load_locks: dict[Hashable, threading.Lock] = {}
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> tuple[ArticleFeatures, ...] | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                self._data.pop(key, None)
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[1]
+
+    def get_or_load(
+        self, key: Hashable, loader: Callable[[], Iterable[ArticleFeatures]],
+    ) -> tuple[ArticleFeatures, ...]:
+        """Cached pool, or ``loader()``'s result; does not count towards hits or misses."""
+        with self._lock:
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+        with load_lock:
+            with self._lock:
+                entry = self._data.get(key)
+                if entry is not None and entry[0] >= time.monotonic():
+                    return entry[1]  # fresh, possibly loaded by a request we waited on
+                generation = self._generation
+            features = tuple(loader())
+            if self.ttl_seconds > 0:
+                with self._lock:
+                    if generation == self._generation:
+                        self._data[key] = (time.monotonic() + self.ttl_seconds, features)
+            return features
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._generation += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'pools': len(self._data),
+                'ttl_seconds': self.ttl_seconds,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+_cache: SharedPoolCache | None = None
+
+
+def get_shared_pool_cache() -> SharedPoolCache:
+    """Get or create the shared pool cache singleton."""
+    global _cache
+    if _cache is None:
+        from app.core.config import settings
+        _cache = SharedPoolCache(ttl_seconds=settings.RECOMMENDER_SHARED_POOL_TTL_SECONDS)
+    return _cache
+
+
+def invalidate_shared_pools() -> None:
+    """Drop the cached pools after ingestion or a source change.
+
+    Only this process is affected; other workers pick the change up within
+    one TTL.
+    """
+    if _cache is not None:
+        _cache.invalidate()
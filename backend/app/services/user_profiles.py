@@ -0,0 +1,350 @@
+"""Cached recommender profiles with incremental updates.
+
+A profile's implicit part (raw topic and source scores, interacted and
+hidden article ids) is persisted in ``user_profiles`` and folded forward by
+``apply_events``, ``apply_hidden`` and ``apply_preferences`` as the user
+acts, instead of being re-aggregated from 30 days of events on every feed
+request. Assembled profiles are kept in a per-process TTL cache, tagged
+with the state row's ``updated_at``: a warm feed request costs one
+primary-key lookup, and an update made by another worker (a hide, new
+events, a rebuild) is seen on that worker's next request, not after the TTL.
+
+Events age out of the 30-day window only on a full rebuild, which happens
+when the stored state is older than ``USER_PROFILE_REBUILD_HOURS``.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Iterable
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.news import (
+    ArticleTopic,
+    NewsArticle,
+    UserEvent,
+    UserHiddenArticle,
+    UserNewsPreference,
+    UserProfileState,
+)
+from app.services.recommender import EventRecord
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------------
+# In-memory TTL cache
+# ---------------------------------------------------------------------------
+
+class ProfileCache:
+    """Bounded, thread-safe LRU of user id -> assembled ``UserProfile`` with a TTL.
+
+    Each entry carries the stamp (state ``updated_at``) it was built from and
+    only serves lookups with the same stamp. Entries are replaced, never
+    mutated, so readers can hold a profile while an update swaps in a new one.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl_seconds: float = 300.0):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._data: OrderedDict[int, tuple[float, object, object]] = OrderedDict()  # expiry, profile, stamp
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int, stamp=None):
+        with self._lock:
+            entry = self._data.get(user_id)
+            if entry is None or entry[0] < time.monotonic() or entry[2] != stamp:
+                self._data.pop(user_id, None)
+                self.misses += 1
+                return None
+            self._data.move_to_end(user_id)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, user_id: int, profile, stamp=None) -> None:
+        if self.max_size <= 0 or self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._data[user_id] = (time.monotonic() + self.ttl_seconds, profile, stamp)
+            self._data.move_to_end(user_id)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def replace(self, user_id: int, update, stamp=None) -> None:
+        """Swap a cached profile for ``update(profile)``; no-op when not cached.
+
+        ``stamp`` is the state's new ``updated_at`` when the update wrote it.
+        """
+        with self._lock:
+            entry = self._data.get(user_id)
+            if entry is not None:
+                self._data[user_id] = (entry[0], update(entry[1]), entry[2] if stamp is None else stamp)
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self._data.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._data),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+_cache: ProfileCache | None = None
+
+
+def get_profile_cache() -> ProfileCache:
+    """Get or create the profile cache singleton."""
+    global _cache
+    if _cache is None:
+        from app.core.config import settings
+        _cache = ProfileCache(
+            max_size=settings.USER_PROFILE_CACHE_SIZE,
+            ttl_seconds=settings.USER_PROFILE_CACHE_TTL_SECONDS,
+        )
+    return _cache
+
+
+# ---------------------------------------------------------------------------
+# Persisted state
+# ---------------------------------------------------------------------------
+
+def _load_json(value: str | None, default):
+    try:
+        return json.loads(value) if value else default
+    except ValueError:
+        return default
+
+
+def rebuild_state(db: Session, user_id: int) -> UserProfileState:
+    """Re-aggregate the event window into ``user_profiles`` (not committed)."""
+    from app.services.recommender import PROFILE_EVENT_WINDOW_DAYS, aggregate_event_scores
+
+    now = datetime.utcnow()
+    topic_scores, source_scores, interacted_ids = aggregate_event_scores(
+        db, user_id, now - timedelta(days=PROFILE_EVENT_WINDOW_DAYS),
+    )
+    hidden = db.query(UserHiddenArticle.article_id).filter(UserHiddenArticle.user_id == user_id).all()
+
+    state = db.get(UserProfileState, user_id) or UserProfileState(user_id=user_id)
+    state.topic_scores_json = json.dumps(topic_scores)
+    state.source_scores_json = json.dumps({str(k): v for k, v in source_scores.items()})
+    state.interacted_ids_json = json.dumps(sorted(interacted_ids))
+    state.hidden_ids_json = json.dumps(sorted(h[0] for h in hidden))
+    state.built_at = now
+    state.updated_at = now
+    db.add(state)
+    return state
+
+
+def _load_state(db: Session, user_id: int) -> UserProfileState:
+    """Stored state, rebuilt when missing or past ``USER_PROFILE_REBUILD_HOURS``."""
+    from app.core.config import settings
+
+    state = db.get(UserProfileState, user_id)
+    max_age = timedelta(hours=settings.USER_PROFILE_REBUILD_HOURS)
+    if state is None or datetime.utcnow() - state.built_at > max_age:
+        state = rebuild_state(db, user_id)
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()  # another worker created the row first
+            state = db.get(UserProfileState, user_id)
+    return state
+
+
+def _lock_state(db: Session, user_id: int) -> UserProfileState | None:
+    """Stored state, locked against concurrent updates until the caller commits.
+
+    ``with_for_update`` locks the row where the database supports it. SQLite
+    ignores it, so the row is first touched with an UPDATE, which takes the
+    write lock there (and the row lock everywhere else) before the read; a
+    concurrent update then waits and reads the committed result instead of
+    overwriting it. Returns None, with nothing locked, when there is no row.
+    """
+    claimed = (
+        db.query(UserProfileState)
+        .filter(UserProfileState.user_id == user_id)
+        .update({UserProfileState.updated_at: datetime.utcnow()}, synchronize_session=False)
+    )
+    if not claimed:
+        db.rollback()
+        return None
+    return (
+        db.query(UserProfileState)
+        .filter(UserProfileState.user_id == user_id)
+        .with_for_update()
+        .populate_existing()
+        .one()
+    )
+
+
+def _profile_from_state(state: UserProfileState, prefs: UserNewsPreference | None, impressions: set[int]):
+    from app.services.recommender import UserProfile, apply_preferences, normalize_affinities
+
+    profile = apply_preferences(UserProfile(user_id=state.user_id), prefs)
+    profile.topic_affinities = normalize_affinities(_load_json(state.topic_scores_json, {}))
+    profile.source_affinities = normalize_affinities(
+        {int(k): v for k, v in _load_json(state.source_scores_json, {}).items()}
+    )
+    profile.recent_article_ids = set(_load_json(state.interacted_ids_json, []))
+    profile.hidden_article_ids = set(_load_json(state.hidden_ids_json, []))
+    profile.recent_impression_ids = impressions
+    return profile
+
+
+def _with_state(state: UserProfileState):
+    """Cache updater: keep explicit preferences and impressions, take the rest from ``state``.
+
+    The state is read immediately, so call this before committing.
+    """
+    fresh = _profile_from_state(state, None, set())
+
+    def _update(cached):
+        return dataclasses.replace(
+            fresh,
+            topics=cached.topics,
+            level=cached.level,
+            equipment=cached.equipment,
+            blocked_keywords=cached.blocked_keywords,
+            recent_impression_ids=cached.recent_impression_ids,
+        )
+    return _update
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def get_user_profile(db: Session, user_id: int):
+    """Cached profile; a miss costs three indexed lookups, not an event scan.
+
+    A hit is checked against the state row's ``updated_at``, so changes
+    written by other workers are never served stale.
+    """
+    from app.services.recommender import recent_impression_ids
+
+    cache = get_profile_cache()
+    stamp = db.query(UserProfileState.updated_at).filter(UserProfileState.user_id == user_id).scalar()
+    profile = cache.get(user_id, stamp)
+    if profile is not None:
+        return profile
+
+    state = _load_state(db, user_id)
+    prefs = db.query(UserNewsPreference).filter(UserNewsPreference.user_id == user_id).first()
+    profile = _profile_from_state(state, prefs, recent_impression_ids(db, user_id))
+    cache.put(user_id, profile, state.updated_at)
+    return profile
+
+
+def apply_events(db: Session, user_id: int, events: Iterable[EventRecord | UserEvent]) -> bool:
+    """Fold freshly stored events into the persisted and cached profile."""
+    from app.services.recommender import event_weight
+
+    weighted = [(event.article_id, event_weight(event.event_type, event.dwell_seconds)) for event in events]
+    if not weighted:
+        return False
+
+    article_ids = {article_id for article_id, _ in weighted}
+    sources = dict(db.query(NewsArticle.id, NewsArticle.source_id).filter(NewsArticle.id.in_(article_ids)).all())
+    topics: dict[int, list[str]] = {}
+    for article_id, topic in db.query(ArticleTopic.article_id, ArticleTopic.topic).filter(
+        ArticleTopic.article_id.in_(article_ids)
+    ):
+        topics.setdefault(article_id, []).append(topic)
+
+    # Read-modify-write of the JSON scores: hold the row lock until commit
+    state = _lock_state(db, user_id)
+    if state is None:
+        return False  # first read builds the state from the events table, these included
+
+    topic_scores: dict[str, float] = _load_json(state.topic_scores_json, {})
+    source_scores: dict[str, float] = _load_json(state.source_scores_json, {})
+    interacted = set(_load_json(state.interacted_ids_json, []))
+
+    for article_id, weight in weighted:
+        interacted.add(article_id)
+        if article_id not in sources:
+            continue
+        for topic in topics.get(article_id, []):
+            topic_scores[topic] = topic_scores.get(topic, 0) + weight
+        key = str(sources[article_id])
+        source_scores[key] = source_scores.get(key, 0) + weight
+
+    state.topic_scores_json = json.dumps(topic_scores)
+    state.source_scores_json = json.dumps(source_scores)
+    state.interacted_ids_json = json.dumps(sorted(interacted))
+    state.updated_at = stamp = datetime.utcnow()
+    update = _with_state(state)
+    db.commit()
+    get_profile_cache().replace(user_id, update, stamp)
+    return True
+
+
+def apply_hidden(db: Session, user_id: int, article_id: int) -> None:
+    """Add a hidden article to the persisted and cached profile."""
+    state = _lock_state(db, user_id)
+    stamp = None
+    if state is not None:
+        hidden = set(_load_json(state.hidden_ids_json, []))
+        hidden.add(article_id)
+        state.hidden_ids_json = json.dumps(sorted(hidden))
+        state.updated_at = stamp = datetime.utcnow()
+        db.commit()
+    get_profile_cache().replace(
+        user_id,
+        lambda p: dataclasses.replace(p, hidden_article_ids=p.hidden_article_ids | {article_id}),
+        stamp,
+    )
+
+
+def apply_preferences(user_id: int, prefs: UserNewsPreference) -> None:
+    """Refresh the explicit part of a cached profile after a preferences update."""
+    from app.services.recommender import UserProfile, apply_preferences as copy_preferences
+
+    def _update(cached):
+        explicit = copy_preferences(UserProfile(user_id=user_id), prefs)
+        return dataclasses.replace(
+            cached,
+            topics=explicit.topics,
+            level=explicit.level,
+            equipment=explicit.equipment,
+            blocked_keywords=explicit.blocked_keywords,
+        )
+
+    get_profile_cache().replace(user_id, _update)
+
+
+def note_impressions(user_id: int, article_ids: list[int]) -> None:
+    """Mark articles just shown in the feed; they are skipped for the next 24h.
+
+    Impressions live in ``feed_impressions`` already, so only the cache is
+    touched; a cold profile re-reads them.
+    """
+    if article_ids:
+        get_profile_cache().replace(
+            user_id,
+            lambda p: dataclasses.replace(p, recent_impression_ids=p.recent_impression_ids | set(article_ids)),
+        )
@@ -0,0 +1,204 @@
+"""Per-user profile vectors.
+
+Each user is represented by a decayed, weighted centroid of the vectors of
+articles they clicked, saved or dwelled on (hides count negatively). The
+centroid is updated incrementally from ``UserEvent``s and stored in the
+``VECTOR_DB_USER_INDEX`` collection, so feed requests can search with it
+directly instead of encoding text.
+
+Event submissions only queue their weights (``queue_user_vector_update``).
+A background thread folds everything queued for all users into one batched
+upsert every ``USER_VECTOR_FLUSH_SECONDS``, so a store that rewrites itself
+on each write (NumPy, HNSW) does so once per interval, not once per request.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from typing import Iterable
+
+from app.models.news import UserEvent
+from app.services.recommender import EventRecord
+
+logger = logging.getLogger(__name__)
+
+# Event types that move the profile vector
+PROFILE_EVENT_TYPES = frozenset({'click', 'save', 'dwell', 'hide'})
+
+_pending: dict[int, list[tuple[int, float]]] = {}  # user id -> queued (article id, weight)
+_pending_lock = threading.Lock()
+_flusher: threading.Thread | None = None
+
+
+def _decay_factor(elapsed_seconds: float, half_life_days: float) -> float:
+    if half_life_days <= 0 or elapsed_seconds <= 0:
+        return 1.0
+    return 0.5 ** (elapsed_seconds / (half_life_days * 86400))
+
+
+def get_user_vector(user_id: int) -> list[float] | None:
+    """Return the stored profile vector, or None if the user has no positive signal yet."""
+    from app.services.vector_store import get_user_vector_store
+
+    hits = get_user_vector_store().get([str(user_id)])
+    if not hits:
+        return None
+    if float(hits[0]['metadata'].get('positive_weight', 0)) <= 0:
+        return None
+    return hits[0]['vector']
+
+
+def _event_weights(events: Iterable[EventRecord | UserEvent]) -> list[tuple[int, float]]:
+    from app.services.recommender import event_weight
+
+    weighted = [
+        (event.article_id, event_weight(event.event_type, event.dwell_seconds))
+        for event in events
+        if event.event_type in PROFILE_EVENT_TYPES
+    ]
+    return [(article_id, w) for article_id, w in weighted if w != 0]
+
+
+def _fold(
+    user_id: int,
+    weighted: list[tuple[int, float]],
+    article_vectors: dict[str, list[float]],
+    existing: dict | None,
+    now: float,
+    half_life_days: float,
+) -> tuple[list[float], dict] | None:
+    """New ``(embedding, metadata)`` of one user, or None when nothing changed.
+
+    The stored state is a unit centroid plus its norm and total absolute
+    weight, so the running weighted sum can be reconstructed, decayed and
+    extended without replaying history.
+    """
+    weighted_sum: list[float] | None = None
+    total_weight = 0.0
+    positive_weight = 0.0
+
+    if existing:
+        meta = existing['metadata']
+        decay = _decay_factor(now - float(meta.get('updated_ts', now)), half_life_days)
+        total_weight = float(meta.get('weight', 0)) * decay
+        positive_weight = float(meta.get('positive_weight', 0)) * decay
+        scale = float(meta.get('norm', 1.0)) * total_weight
+        weighted_sum = [x * scale for x in existing['vector']]
+
+    changed = False
+    for article_id, weight in weighted:
+        vector = article_vectors.get(str(article_id))
+        if vector is None:
+            continue
+        if weighted_sum is None or len(weighted_sum) != len(vector):
+            weighted_sum = [0.0] * len(vector)
+            total_weight = 0.0
+            positive_weight = 0.0
+        weighted_sum = [s + weight * x for s, x in zip(weighted_sum, vector)]
+        total_weight += abs(weight)
+        if weight > 0:
+            positive_weight += weight
+        changed = True
+
+    if not changed or total_weight <= 0:
+        return None
+
+    centroid = [s / total_weight for s in weighted_sum]
+    norm = math.sqrt(sum(x * x for x in centroid))
+    if norm == 0:
+        return None
+
+    return [x / norm for x in centroid], {
+        'user_id': user_id,
+        'weight': total_weight,
+        'positive_weight': positive_weight,
+        'norm': norm,
+        'updated_ts': now,
+    }
+
+
+def update_user_vectors(pending: dict[int, list[tuple[int, float]]]) -> int:
+    """Fold queued ``(article id, weight)`` pairs into each user's vector in one upsert.
+
+    Returns the number of users whose vector changed.
+    """
+    from app.core.config import settings
+    from app.services.vector_store import get_user_vector_store, get_vector_store
+
+    pending = {user_id: weighted for user_id, weighted in pending.items() if weighted}
+    if not pending:
+        return 0
+
+    article_ids = sorted({str(article_id) for weighted in pending.values() for article_id, _ in weighted})
+    article_vectors = {hit['id']: hit['vector'] for hit in get_vector_store().get(article_ids)}
+    if not article_vectors:
+        return 0
+
+    user_store = get_user_vector_store()
+    existing = {hit['id']: hit for hit in user_store.get([str(user_id) for user_id in pending])}
+    now = time.time()
+
+    ids, embeddings, metadata = [], [], []
+    for user_id, weighted in pending.items():
+        folded = _fold(
+            user_id, weighted, article_vectors, existing.get(str(user_id)), now, settings.USER_VECTOR_HALF_LIFE_DAYS,
+        )
+        if folded is not None:
+            ids.append(str(user_id))
+            embeddings.append(folded[0])
+            metadata.append(folded[1])
+
+    if ids:
+        user_store.upsert(ids=ids, embeddings=embeddings, metadata=metadata)
+    return len(ids)
+
+
+def update_user_vector(user_id: int, events: Iterable[EventRecord | UserEvent]) -> bool:
+    """Fold new events into the user's profile vector now. Returns True if it changed."""
+    return update_user_vectors({user_id: _event_weights(events)}) > 0
+
+
+def flush_user_vector_updates() -> int:
+    """Apply everything queued so far; returns the number of users updated."""
+    with _pending_lock:
+        pending = dict(_pending)
+        _pending.clear()
+    if not pending:
+        return 0
+    try:
+        return update_user_vectors(pending)
+    except Exception as exc:
+        logger.warning('User vector update failed for %d users: %s', len(pending), exc)
+        return 0
+
+
+def _run_flusher(interval_seconds: float) -> None:
+    while True:
+        time.sleep(interval_seconds)
+        flush_user_vector_updates()
+
+
+def queue_user_vector_update(user_id: int, events: Iterable[EventRecord | UserEvent]) -> None:
+    """Queue new events for the next background flush (applied inline when the interval is 0).
+
+    Only plain ``(article id, weight)`` pairs are kept, so the events' session
+    can close before the flush.
+    """
+    global _flusher
+    from app.core.config import settings
+
+    weighted = _event_weights(events)
+    if not weighted:
+        return
+    interval = settings.USER_VECTOR_FLUSH_SECONDS
+    if interval <= 0:
+        update_user_vectors({user_id: weighted})
+        return
+    with _pending_lock:
+        _pending.setdefault(user_id, []).extend(weighted)
+        if _flusher is None:
+            _flusher = threading.Thread(target=_run_flusher, args=(interval,), name='user-vector-flush', daemon=True)
+            _flusher.start()
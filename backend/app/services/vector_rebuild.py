@@ -0,0 +1,164 @@
+"""Rebuild the article vector index from vectors persisted in SQL.
+
+``article_embeddings.vector`` keeps every article's pre-reduction model
+output as float16 bytes, so a lost, migrated or re-parameterized collection
+(new backend, sharding, quantization or ``EMBEDDING_REDUCTION``) is refilled
+at read speed instead of re-encoding the corpus. The current reduction is
+applied on the way in; rows from another model, or written before vectors
+were persisted, are skipped and left to the embedding backfill.
+
+    python -m app.services.vector_rebuild            # upsert into the current index
+    python -m app.services.vector_rebuild --drop     # empty the collection first
+
+Chunk vectors are not persisted; the chunk index still needs a re-embed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+from dataclasses import asdict, dataclass
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.news import ArticleEmbedding, NewsArticle
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RebuildReport:
+    rebuilt: int = 0
+    skipped_no_vector: int = 0
+    skipped_other_model: int = 0
+    seconds: float = 0.0
+    vectors_per_s: float = 0.0
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _stored_batch(rows: list, model_name: str, report: RebuildReport) -> tuple[tuple | None, list[int]]:
+    """``bulk_upsert`` batch of the usable ``(record, article)`` rows, plus ids of the unusable ones."""
+    from app.services.dim_reduction import reduce_vectors
+    from app.services.embedder import article_metadata, unpack_vectors
+
+    usable, unusable = [], []
+    for record, article in rows:
+        if record.vector is None:
+            report.skipped_no_vector += 1
+            unusable.append(article.id)
+        elif record.model_name != model_name:
+            report.skipped_other_model += 1
+            unusable.append(article.id)
+        else:
+            usable.append((record, article))
+    if not usable:
+        return None, unusable
+    vectors = reduce_vectors(unpack_vectors([record.vector for record, _ in usable]).tolist())
+    return ([str(a.id) for _, a in usable], vectors, [article_metadata(a) for _, a in usable]), unusable
+
+
+def restore_vectors(db: Session, article_ids: list[int], batch_size: int = 2000) -> tuple[RebuildReport, list[int]]:
+    """Re-upsert ``article_ids`` from their stored vectors.
+
+    Returns the report and the ids that have no usable stored vector, which
+    need a re-embed.
+    """
+    from app.core.config import settings
+    from app.services.vector_store import get_vector_store
+
+    report = RebuildReport()
+    unusable: list[int] = []
+    model_name = settings.EMBEDDING_MODEL_NAME
+
+    def _batches():
+        for start in range(0, len(article_ids), batch_size):
+            rows = (
+                db.query(ArticleEmbedding, NewsArticle)
+                .join(NewsArticle, NewsArticle.id == ArticleEmbedding.article_id)
+                .filter(ArticleEmbedding.article_id.in_(article_ids[start:start + batch_size]))
+                .all()
+            )
+            batch, skipped = _stored_batch(rows, model_name, report)
+            unusable.extend(skipped)
+            if batch:
+                yield batch
+
+    bulk = get_vector_store().bulk_upsert(_batches())
+    report.rebuilt = bulk.vectors
+    report.seconds = round(bulk.seconds, 3)
+    report.vectors_per_s = round(bulk.vectors_per_s, 1)
+    return report, unusable
+
+
+def rebuild_vector_index(db: Session, batch_size: int = 2000, drop: bool = False) -> RebuildReport:
+    """Stream persisted vectors of servable articles into the vector store."""
+    from app.core.config import settings
+    from app.services.vector_reconciler import retention_cutoff
+    from app.services.vector_store import get_vector_store, reopen_vector_store
+
+    store = get_vector_store()
+    if drop:
+        store.drop()
+        store = reopen_vector_store()
+
+    query = db.query(ArticleEmbedding, NewsArticle).join(NewsArticle, NewsArticle.id == ArticleEmbedding.article_id)
+    cutoff = retention_cutoff()
+    if cutoff is not None:
+        query = query.filter(func.coalesce(NewsArticle.published_at, NewsArticle.created_at) >= cutoff)
+
+    report = RebuildReport()
+    model_name = settings.EMBEDDING_MODEL_NAME
+
+    def _batches():
+        last_id = 0
+        while True:
+            rows = query.filter(ArticleEmbedding.id > last_id).order_by(ArticleEmbedding.id).limit(batch_size).all()
+            if not rows:
+                return
+            last_id = rows[-1][0].id
+            batch, _ = _stored_batch(rows, model_name, report)
+            if batch:
+                yield batch
+            # Release this batch only; the caller's session may hold its own objects
+            for record, article in rows:
+                db.expunge(record)
+                db.expunge(article)
+
+    bulk = store.bulk_upsert(_batches())
+    report.rebuilt = bulk.vectors
+    report.seconds = round(bulk.seconds, 3)
+    report.vectors_per_s = round(bulk.vectors_per_s, 1)
+
+    logger.info(
+        'Vector rebuild: %d vectors in %.1fs (%.0f vectors/s); skipped %d without a stored vector, %d from another model',
+        report.rebuilt, bulk.seconds, bulk.vectors_per_s, report.skipped_no_vector, report.skipped_other_model,
+    )
+    return report
+
+
+def main(argv: list[str] | None = None) -> None:
+    from app.db.session import SessionLocal
+
+    parser = argparse.ArgumentParser(description='Rebuild the article vector index from article_embeddings.vector.')
+    parser.add_argument('--batch-size', type=int, default=2000)
+    parser.add_argument('--drop', action='store_true', help='drop the collection before rebuilding')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    started = time.perf_counter()
+    db = SessionLocal()
+    try:
+        report = rebuild_vector_index(db, batch_size=args.batch_size, drop=args.drop)
+    finally:
+        db.close()
+    for key, value in report.to_dict().items():
+        print(f'{key:>20}: {value}')
+    print(f'{"elapsed":>20}: {time.perf_counter() - started:.1f}s')
+
+
+if __name__ == '__main__':
+    main()
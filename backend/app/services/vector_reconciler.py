@@ -0,0 +1,224 @@
+"""Keep the article vector index consistent with SQL and the servable window.
+
+The recommender never shows articles older than ``VECTOR_DB_RETENTION_DAYS``,
+so their vectors only slow search down. ``reconcile_vector_index`` diffs
+``article_embeddings`` and ``news_articles`` against the ids in the vector
+store and:
+
+- deletes vectors (and chunk vectors) of deleted or out-of-window articles
+- drops ``article_embeddings`` rows of deleted articles only: expired ones
+  keep their stored vector, so widening the window (or a rebuild with a
+  larger ``VECTOR_DB_RETENTION_DAYS``) restores them without re-encoding
+- restores servable articles whose vector is missing from the float16 copy
+  in ``article_embeddings.vector``, without re-encoding
+- re-queues the missing ones without a usable stored vector by blanking
+  their recorded ``content_hash``, so ``pending_articles_query`` picks them up
+
+Nothing is touched while the store is disabled or unhealthy: an empty id
+list from a backend that failed to start must not look like a lost index.
+
+    python -m app.services.vector_reconciler            # reconcile
+    python -m app.services.vector_reconciler --dry-run  # report only
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Iterable
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.news import ArticleEmbedding, NewsArticle
+
+logger = logging.getLogger(__name__)
+
+_DELETE_BATCH = 1000
+
+
+@dataclass
+class ReconcileReport:
+    vectors_indexed: int = 0
+    articles_servable: int = 0
+    orphaned_deleted: int = 0
+    expired_deleted: int = 0
+    chunks_deleted: int = 0
+    records_dropped: int = 0
+    vectors_missing: int = 0
+    restored: int = 0
+    requeued: int = 0
+    dry_run: bool = False
+    skipped: str | None = None  # why nothing was reconciled
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def retention_cutoff(retention_days: int | None = None) -> datetime | None:
+    """Oldest servable publish time, or None when pruning is disabled."""
+    from app.core.config import settings
+    days = settings.VECTOR_DB_RETENTION_DAYS if retention_days is None else retention_days
+    return datetime.utcnow() - timedelta(days=days) if days > 0 else None
+
+
+def _batched(ids: list[str]) -> Iterable[list[str]]:
+    for start in range(0, len(ids), _DELETE_BATCH):
+        yield ids[start:start + _DELETE_BATCH]
+
+
+def _article_id(doc_id: str) -> int | None:
+    """Article id of an article (``"12"``) or chunk (``"12-3"``) vector id."""
+    head = doc_id.split('-', 1)[0]
+    return int(head) if head.isdigit() else None
+
+
+def delete_article_vectors(article_ids: Iterable[int]) -> int:
+    """Remove the article and chunk vectors of ``article_ids``; returns ids requested."""
+    from app.core.config import settings
+    from app.services.vector_store import get_chunk_vector_store, get_vector_store
+
+    ids = [str(article_id) for article_id in article_ids]
+    if not ids:
+        return 0
+    store = get_vector_store()
+    chunk_store = get_chunk_vector_store()
+    for batch in _batched(ids):
+        store.delete(batch)
+        chunk_store.delete([f'{doc_id}-{n}' for doc_id in batch for n in range(settings.EMBEDDING_MAX_CHUNKS)])
+    return len(ids)
+
+
+def reconcile_vector_index(db: Session, retention_days: int | None = None, dry_run: bool = False) -> ReconcileReport:
+    """Diff SQL against the vector store and repair the difference."""
+    from app.services.embedder import REQUEUED_HASH
+    from app.services.vector_rebuild import restore_vectors
+    from app.services.vector_store import (
+        NullVectorStore,
+        ShardedVectorStore,
+        get_chunk_vector_store,
+        get_vector_store,
+    )
+
+    store = get_vector_store()
+    if isinstance(store, NullVectorStore):
+        return ReconcileReport(dry_run=dry_run, skipped='vector store disabled')
+    status = store.refresh_status()
+    if not status.healthy:
+        logger.warning('Vector reconcile skipped: store unhealthy (%s)', status.error)
+        return ReconcileReport(dry_run=dry_run, skipped=f'vector store unhealthy: {status.error}')
+
+    chunk_store = get_chunk_vector_store()
+    cutoff = retention_cutoff(retention_days)
+
+    # Whole weeks past the window go in O(1) before any per-id work
+    if cutoff is not None and not dry_run:
+        for sharded in (store, chunk_store):
+            if isinstance(sharded, ShardedVectorStore):
+                weeks = sharded.drop_shards_before(cutoff.replace(tzinfo=timezone.utc).timestamp())
+                if weeks:
+                    logger.info('Dropped expired shards %s of "%s"', ', '.join(weeks), sharded.base_name)
+
+    # List the store before reading SQL: a vector upserted by a concurrent
+    # ingest in between then has its article in ``existing`` already, instead
+    # of looking orphaned and being deleted
+    vector_ids = store.list_ids()
+    chunk_ids = chunk_store.list_ids()
+    indexed = {_article_id(doc_id) for doc_id in vector_ids} - {None}
+
+    published = func.coalesce(NewsArticle.published_at, NewsArticle.created_at)
+    servable_query = db.query(NewsArticle.id)
+    if cutoff is not None:
+        servable_query = servable_query.filter(published >= cutoff)
+    servable = {row[0] for row in servable_query.all()}
+    existing = {row[0] for row in db.query(NewsArticle.id).all()} if cutoff is not None else servable
+    recorded = {row[0] for row in db.query(ArticleEmbedding.article_id).all()}
+
+    report = ReconcileReport(
+        vectors_indexed=len(vector_ids),
+        articles_servable=len(servable),
+        dry_run=dry_run,
+    )
+
+    orphaned = [doc_id for doc_id in vector_ids if _article_id(doc_id) not in existing]
+    expired = [doc_id for doc_id in vector_ids if _article_id(doc_id) in existing - servable]
+    stale_chunks = [doc_id for doc_id in chunk_ids if _article_id(doc_id) not in servable]
+    # Records of deleted articles. Expired ones stay: the record keeps them from
+    # being re-embedded and its blob lets a wider window restore them
+    dropped = sorted(recorded - existing)
+    # Servable and marked embedded, but the vector is gone (e.g. a lost or rebuilt index)
+    missing = sorted((recorded & servable) - indexed)
+
+    report.orphaned_deleted = len(orphaned)
+    report.expired_deleted = len(expired)
+    report.chunks_deleted = len(stale_chunks)
+    report.records_dropped = len(dropped)
+    report.vectors_missing = len(missing)
+
+    if dry_run:
+        return report
+
+    for batch in _batched(orphaned + expired):
+        store.delete(batch)
+    for batch in _batched(stale_chunks):
+        chunk_store.delete(batch)
+
+    for start in range(0, len(dropped), _DELETE_BATCH):
+        db.query(ArticleEmbedding).filter(
+            ArticleEmbedding.article_id.in_(dropped[start:start + _DELETE_BATCH])
+        ).delete(synchronize_session=False)
+    db.commit()
+
+    if missing:
+        restored, unusable = restore_vectors(db, missing)
+        report.restored = restored.rebuilt
+        report.requeued = len(unusable)
+        for start in range(0, len(unusable), _DELETE_BATCH):
+            db.query(ArticleEmbedding).filter(
+                ArticleEmbedding.article_id.in_(unusable[start:start + _DELETE_BATCH])
+            ).update({ArticleEmbedding.content_hash: REQUEUED_HASH}, synchronize_session=False)
+        db.commit()
+
+    logger.info(
+        'Vector reconcile: %d orphaned and %d expired vectors deleted, %d chunks deleted, '
+        '%d records dropped, %d missing vectors restored, %d articles re-queued',
+        report.orphaned_deleted, report.expired_deleted, report.chunks_deleted,
+        report.records_dropped, report.restored, report.requeued,
+    )
+    return report
+
+
+def run_maintenance(db: Session, embed_batch_size: int = 100) -> ReconcileReport:
+    """Scheduled job: reconcile, then embed a batch of pending servable articles."""
+    from app.services.embedder import embed_pending_articles
+
+    report = reconcile_vector_index(db)
+    if report.skipped:
+        return report
+    embed_pending_articles(db, batch_size=embed_batch_size, since=retention_cutoff())
+    return report
+
+
+def main(argv: list[str] | None = None) -> None:
+    from app.db.session import SessionLocal
+
+    parser = argparse.ArgumentParser(description='Reconcile the article vector index with the database.')
+    parser.add_argument('--dry-run', action='store_true', help='report differences without changing anything')
+    parser.add_argument('--retention-days', type=int, default=None,
+                        help='override VECTOR_DB_RETENTION_DAYS (0 keeps every article)')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    db = SessionLocal()
+    try:
+        report = reconcile_vector_index(db, retention_days=args.retention_days, dry_run=args.dry_run)
+    finally:
+        db.close()
+    for key, value in report.to_dict().items():
+        print(f'{key:>18}: {value}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,21 +1,80 @@
 """Vector store abstraction layer.
 
-Supports ChromaDB (dev) and Qdrant (prod).
-Factory reads ``settings.VECTOR_DB_PROVIDER`` to pick the backend.
+Supports ChromaDB (dev), Qdrant (prod) and two in-process stores:
+exact search over NumPy and approximate search over an hnswlib graph.
+Factory reads ``settings.VECTOR_DB_PROVIDER`` to pick the backend and
+``settings.VECTOR_DB_SHARDING`` to split article collections by week.
 """
 
 from __future__ import annotations
 
+import json
 import logging
+import os
+import shutil
+import threading
+import time
+import uuid
 from abc import ABC, abstractmethod
-from typing import Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: writers are only serialized within a process
+    fcntl = None
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class VectorStoreStatus:
+    """Snapshot of a store's size and health, cached off the request path."""
+
+    count: int = 0
+    healthy: bool = True
+    error: str | None = None
+    refreshed_at: float = 0.0
+
+    @property
+    def ready(self) -> bool:
+        return self.healthy and self.count > 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**asdict(self), 'ready': self.ready}
+
+
+@dataclass
+class BulkUpsertReport:
+    """Throughput of one ``bulk_upsert`` run."""
+
+    vectors: int = 0
+    chunks: int = 0
+    seconds: float = 0.0
+
+    @property
+    def vectors_per_s(self) -> float:
+        return self.vectors / self.seconds if self.seconds else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**asdict(self), 'vectors_per_s': round(self.vectors_per_s, 1)}
+
+
 class VectorStore(ABC):
     """Abstract interface for vector search backends."""
 
+    _status: VectorStoreStatus | None = None
+    _monitor: threading.Thread | None = None
+    # True when the client may be called from several threads at once
+    parallel_writes: bool = False
+
     @abstractmethod
     def upsert(
         self,
@@ -32,7 +91,30 @@ class VectorStore(ABC):
         top_k: int = 50,
         filters: dict[str, Any] | None = None,
     ) -> list[dict[str, Any]]:
-        """Return list of ``{id, score, metadata}`` dicts."""
+        """Return list of ``{id, score, metadata}`` dicts.
+
+        ``filters`` maps a metadata key to a value (equality), a list
+        (membership) or an operator dict using ``$eq``, ``$ne``, ``$gt``,
+        ``$gte``, ``$lt``, ``$lte``, ``$in`` and ``$nin``; keys are ANDed.
+        """
+        ...
+
+    def search_many(
+        self,
+        query_vectors: list[list[float]],
+        top_k: int = 50,
+        filters: dict[str, Any] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """Run several searches at once; result ``i`` answers ``query_vectors[i]``.
+
+        Backends override this with a native batched call; the default
+        simply loops over ``search``.
+        """
+        return [self.search(query_vector, top_k=top_k, filters=filters) for query_vector in query_vectors]
+
+    @abstractmethod
+    def get(self, ids: list[str]) -> list[dict[str, Any]]:
+        """Return list of ``{id, vector, metadata}`` dicts for the ids that exist."""
         ...
 
     @abstractmethod
@@ -43,14 +125,127 @@ class VectorStore(ABC):
     def count(self) -> int:
         ...
 
+    @abstractmethod
+    def list_ids(self) -> list[str]:
+        """Return every stored id (used to reconcile the index with SQL)."""
+        ...
+
+    @abstractmethod
+    def drop(self) -> None:
+        """Delete the whole collection and its storage."""
+        ...
+
+    # -- bulk writes -------------------------------------------------------
+
+    def _write_chunk(self, ids: list[str], embeddings: list[list[float]], metadata: list[dict[str, Any]]) -> None:
+        """Write one chunk; remote backends override this to skip the status refresh."""
+        self.upsert(ids, embeddings, metadata)
+
+    def bulk_upsert(
+        self,
+        batches: Iterable[tuple[list[str], list[list[float]], list[dict[str, Any]]]],
+        chunk_size: int | None = None,
+        parallelism: int | None = None,
+        on_batch: Callable[[int], None] | None = None,
+    ) -> BulkUpsertReport:
+        """Stream ``(ids, embeddings, metadata)`` batches into the store.
+
+        Batches are consumed lazily, split into requests of at most
+        ``chunk_size`` vectors, and (for ``parallel_writes`` backends) up to
+        ``parallelism`` requests are in flight while the next batch is
+        produced. ``on_batch(i)`` runs on the calling thread, in order, once
+        every vector of batch ``i`` is written.
+        """
+        from app.core.config import settings
+
+        chunk_size = max(1, chunk_size or settings.VECTOR_DB_UPSERT_CHUNK_SIZE)
+        parallelism = max(1, parallelism or settings.VECTOR_DB_UPSERT_PARALLELISM) if self.parallel_writes else 1
+        report = BulkUpsertReport()
+        inflight: deque = deque()  # (future or None, batch index once its last chunk is queued)
+        started = time.perf_counter()
+
+        def _drain(limit: int) -> None:
+            while len(inflight) > limit:
+                future, batch_index = inflight.popleft()
+                if future is not None:
+                    future.result()
+                if batch_index is not None and on_batch is not None:
+                    on_batch(batch_index)
+
+        with ThreadPoolExecutor(max_workers=parallelism, thread_name_prefix='vector-upsert') as pool:
+            for index, (ids, embeddings, metadata) in enumerate(batches):
+                if not len(ids):
+                    inflight.append((None, index))
+                for start in range(0, len(ids), chunk_size):
+                    end = min(start + chunk_size, len(ids))
+                    future = pool.submit(self._write_chunk, ids[start:end], embeddings[start:end], metadata[start:end])
+                    inflight.append((future, index if end == len(ids) else None))
+                    report.chunks += 1
+                    report.vectors += end - start
+                    _drain(parallelism)
+            _drain(0)
+
+        report.seconds = time.perf_counter() - started
+        self.refresh_status()
+        logger.info(
+            'Bulk upsert: %d vectors in %d chunks, %.1fs (%.0f vectors/s)',
+            report.vectors, report.chunks, report.seconds, report.vectors_per_s,
+        )
+        return report
+
+    # -- cached status -----------------------------------------------------
+
+    def refresh_status(self) -> VectorStoreStatus:
+        """Query the backend for its size; a failure marks the store degraded."""
+        previous = self._status
+        try:
+            status = VectorStoreStatus(count=self.count(), refreshed_at=time.time())
+        except Exception as exc:
+            if previous is None or previous.healthy:
+                logger.warning('Vector store %s degraded: %s', type(self).__name__, exc)
+            status = VectorStoreStatus(
+                count=previous.count if previous else 0,
+                healthy=False,
+                error=str(exc),
+                refreshed_at=time.time(),
+            )
+        self._status = status
+        return status
+
+    def status(self) -> VectorStoreStatus:
+        """Return the cached snapshot (refreshed by writes and the monitor thread)."""
+        return self._status or self.refresh_status()
+
+    def is_ready(self) -> bool:
+        """True when the store is healthy and holds at least one vector."""
+        return self.status().ready
+
+    def start_status_monitor(self, interval_seconds: float) -> None:
+        """Refresh the snapshot every ``interval_seconds`` on a daemon thread."""
+        if interval_seconds <= 0 or self._monitor is not None:
+            return
+
+        def _run():
+            while True:
+                time.sleep(interval_seconds)
+                self.refresh_status()
+
+        self._monitor = threading.Thread(target=_run, name=f'{type(self).__name__}-status', daemon=True)
+        self._monitor.start()
+
 
 # ---------------------------------------------------------------------------
 # ChromaDB backend (dev / local)
 # ---------------------------------------------------------------------------
 
+_CHROMA_SCALARS = (str, int, float, bool)
+
+
 class ChromaVectorStore(VectorStore):
     """Persistent ChromaDB backend — zero infrastructure needed."""
 
+    parallel_writes = True
+
     def __init__(self, persist_dir: str = './data/chroma', collection_name: str = 'gymunity-news'):
         try:
             import chromadb
@@ -65,106 +260,1186 @@ class ChromaVectorStore(VectorStore):
         logger.info('ChromaDB collection "%s" ready (%d vectors)', collection_name, self._collection.count())
 
     def upsert(self, ids: list[str], embeddings: list[list[float]], metadata: list[dict[str, Any]]) -> None:
-        # Chroma requires metadatas values to be str/int/float/bool
-        clean_meta = []
-        for m in metadata:
-            clean = {}
-            for k, v in m.items():
-                if isinstance(v, (str, int, float, bool)):
-                    clean[k] = v
-                else:
-                    clean[k] = str(v)
-            clean_meta.append(clean)
-        self._collection.upsert(ids=ids, embeddings=embeddings, metadatas=clean_meta)
+        self._write_chunk(ids, embeddings, metadata)
+        self.refresh_status()
+
+    def _write_chunk(self, ids: list[str], embeddings: list[list[float]], metadata: list[dict[str, Any]]) -> None:
+        # Chroma requires metadatas values to be str/int/float/bool; only copy when something needs converting
+        if not all(isinstance(v, _CHROMA_SCALARS) for m in metadata for v in m.values()):
+            metadata = [{k: v if isinstance(v, _CHROMA_SCALARS) else str(v) for k, v in m.items()} for m in metadata]
+        self._collection.upsert(ids=ids, embeddings=embeddings, metadatas=metadata)
+
+    @staticmethod
+    def _where(filters: dict[str, Any] | None) -> dict[str, Any] | None:
+        """Chroma accepts one top-level key per ``where``; AND several together."""
+        if not filters:
+            return None
+        clauses = []
+        for key, condition in filters.items():
+            if condition is None:
+                continue
+            if isinstance(condition, (list, tuple, set)):
+                condition = {'$in': list(condition)}
+            if isinstance(condition, dict):
+                clauses.extend({key: {op: value}} for op, value in condition.items())
+            else:
+                clauses.append({key: condition})
+        if not clauses:
+            return None
+        return clauses[0] if len(clauses) == 1 else {'$and': clauses}
 
     def search(self, query_vector: list[float], top_k: int = 50, filters: dict[str, Any] | None = None) -> list[dict[str, Any]]:
-        where = None
-        if filters:
-            where = {k: v for k, v in filters.items() if v is not None}
-            if not where:
-                where = None
+        return self.search_many([query_vector], top_k=top_k, filters=filters)[0]
 
+    def search_many(
+        self,
+        query_vectors: list[list[float]],
+        top_k: int = 50,
+        filters: dict[str, Any] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        if not query_vectors:
+            return []
         results = self._collection.query(
-            query_embeddings=[query_vector],
+            query_embeddings=query_vectors,
             n_results=top_k,
-            where=where,
+            where=self._where(filters),
         )
 
-        hits = []
-        if results['ids'] and results['ids'][0]:
-            for idx, doc_id in enumerate(results['ids'][0]):
+        batches = []
+        for q in range(len(query_vectors)):
+            hits = []
+            ids = results['ids'][q] if results['ids'] else []
+            for idx, doc_id in enumerate(ids):
                 hit = {
                     'id': doc_id,
-                    'score': 1.0 - (results['distances'][0][idx] if results.get('distances') else 0.0),
-                    'metadata': results['metadatas'][0][idx] if results.get('metadatas') else {},
+                    'score': 1.0 - (results['distances'][q][idx] if results.get('distances') else 0.0),
+                    'metadata': results['metadatas'][q][idx] if results.get('metadatas') else {},
                 }
                 hits.append(hit)
-        return hits
+            batches.append(hits)
+        return batches
+
+    def get(self, ids: list[str]) -> list[dict[str, Any]]:
+        if not ids:
+            return []
+        results = self._collection.get(ids=ids, include=['embeddings', 'metadatas'])
+        embeddings = results.get('embeddings')
+        metadatas = results.get('metadatas')
+        return [
+            {
+                'id': doc_id,
+                'vector': [float(x) for x in embeddings[idx]],
+                'metadata': metadatas[idx] if metadatas is not None else {},
+            }
+            for idx, doc_id in enumerate(results['ids'])
+        ]
 
     def delete(self, ids: list[str]) -> None:
         if ids:
             self._collection.delete(ids=ids)
+            self.refresh_status()
 
     def count(self) -> int:
         return self._collection.count()
 
+    def list_ids(self) -> list[str]:
+        ids: list[str] = []
+        page = 10000
+        while True:
+            batch = self._collection.get(include=[], limit=page, offset=len(ids))['ids']
+            ids.extend(batch)
+            if len(batch) < page:
+                return ids
+
+    def drop(self) -> None:
+        self._client.delete_collection(self._collection.name)
+
 
 # ---------------------------------------------------------------------------
 # Qdrant backend (production)
 # ---------------------------------------------------------------------------
 
+def _qdrant_point_id(doc_id: str) -> int | str:
+    """Qdrant only accepts unsigned ints and UUIDs as point ids."""
+    if doc_id.isdigit():
+        return int(doc_id)
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, doc_id))
+
+
+def _qdrant_filter(filters: dict[str, Any] | None):
+    """Translate the shared filter grammar into a Qdrant ``Filter``."""
+    if not filters:
+        return None
+    from qdrant_client.models import FieldCondition, Filter, MatchAny, MatchValue, Range
+
+    must, must_not = [], []
+    for key, condition in filters.items():
+        if condition is None:
+            continue
+        if isinstance(condition, (list, tuple, set)):
+            condition = {'$in': list(condition)}
+        elif not isinstance(condition, dict):
+            condition = {'$eq': condition}
+
+        bounds = {}
+        for op, value in condition.items():
+            if op == '$eq':
+                must.append(FieldCondition(key=key, match=MatchValue(value=value)))
+            elif op == '$ne':
+                must_not.append(FieldCondition(key=key, match=MatchValue(value=value)))
+            elif op == '$in':
+                must.append(FieldCondition(key=key, match=MatchAny(any=list(value))))
+            elif op == '$nin':
+                if value:
+                    must_not.append(FieldCondition(key=key, match=MatchAny(any=list(value))))
+            elif op in ('$gt', '$gte', '$lt', '$lte'):
+                bounds[op[1:]] = value
+            else:
+                raise ValueError(f'Unsupported filter operator: {op}')
+        if bounds:
+            must.append(FieldCondition(key=key, range=Range(**bounds)))
+
+    if not must and not must_not:
+        return None
+    return Filter(must=must or None, must_not=must_not or None)
+
+
 class QdrantVectorStore(VectorStore):
-    """Qdrant backend for production deployments."""
+    """Qdrant backend for production deployments.
+
+    Filters are pushed down as payload conditions, backed by payload
+    indexes on the fields the recommender filters on.
+    """
+
+    parallel_writes = True
 
-    def __init__(self, url: str = 'http://localhost:6333', collection_name: str = 'gymunity-news', vector_size: int = 384):
+    # payload field -> index schema
+    PAYLOAD_INDEXES = {
+        'source_id': 'integer',
+        'language': 'keyword',
+        'published_ts': 'float',
+    }
+
+    def __init__(
+        self,
+        url: str = 'http://localhost:6333',
+        collection_name: str = 'gymunity-news',
+        vector_size: int = 384,
+        quantization: str = 'none',
+        rescore_overfetch: int = 4,
+    ):
         try:
             from qdrant_client import QdrantClient
-            from qdrant_client.models import Distance, VectorParams
+            from qdrant_client.models import (
+                Distance,
+                QuantizationSearchParams,
+                ScalarQuantization,
+                ScalarQuantizationConfig,
+                ScalarType,
+                SearchParams,
+                VectorParams,
+            )
         except ImportError:
             raise ImportError('qdrant-client is required: pip install qdrant-client')
 
         self._client = QdrantClient(url=url)
         self._collection_name = collection_name
 
+        quantization_config = None
+        self._search_params = None
+        if quantization == 'int8':
+            # int8 copies stay in RAM; original vectors live on disk for rescoring
+            quantization_config = ScalarQuantization(
+                scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True),
+            )
+            self._search_params = SearchParams(
+                quantization=QuantizationSearchParams(rescore=True, oversampling=float(max(1, rescore_overfetch))),
+            )
+        elif quantization != 'none':
+            raise ValueError(f'Unsupported quantization: {quantization}')
+
         collections = [c.name for c in self._client.get_collections().collections]
         if collection_name not in collections:
             self._client.create_collection(
                 collection_name=collection_name,
-                vectors_config=VectorParams(size=vector_size, distance=Distance.COSINE),
+                vectors_config=VectorParams(
+                    size=vector_size, distance=Distance.COSINE, on_disk=quantization_config is not None,
+                ),
+                quantization_config=quantization_config,
             )
+        elif quantization_config is not None:
+            self._client.update_collection(collection_name=collection_name, quantization_config=quantization_config)
+        self._ensure_payload_indexes()
         logger.info('Qdrant collection "%s" ready', collection_name)
 
+    def _ensure_payload_indexes(self) -> None:
+        existing = self._client.get_collection(self._collection_name).payload_schema or {}
+        for field_name, schema in self.PAYLOAD_INDEXES.items():
+            if field_name in existing:
+                continue
+            try:
+                self._client.create_payload_index(
+                    collection_name=self._collection_name,
+                    field_name=field_name,
+                    field_schema=schema,
+                )
+            except Exception as exc:
+                logger.warning('Qdrant payload index on "%s" not created: %s', field_name, exc)
+
+    @staticmethod
+    def _to_hit(point, score: float | None = None) -> dict[str, Any]:
+        payload = dict(point.payload or {})
+        doc_id = payload.pop('doc_id', None) or str(point.id)
+        return {'id': doc_id, 'score': score, 'metadata': payload}
+
     def upsert(self, ids: list[str], embeddings: list[list[float]], metadata: list[dict[str, Any]]) -> None:
+        self._write_chunk(ids, embeddings, metadata)
+        self.refresh_status()
+
+    def _write_chunk(self, ids: list[str], embeddings: list[list[float]], metadata: list[dict[str, Any]]) -> None:
         from qdrant_client.models import PointStruct
         points = [
-            PointStruct(id=doc_id, vector=vec, payload=meta)
+            PointStruct(id=_qdrant_point_id(doc_id), vector=vec, payload={**meta, 'doc_id': doc_id})
             for doc_id, vec, meta in zip(ids, embeddings, metadata)
         ]
         self._client.upsert(collection_name=self._collection_name, points=points)
 
     def search(self, query_vector: list[float], top_k: int = 50, filters: dict[str, Any] | None = None) -> list[dict[str, Any]]:
-        results = self._client.search(
+        results = self._client.query_points(
             collection_name=self._collection_name,
-            query_vector=query_vector,
+            query=query_vector,
+            query_filter=_qdrant_filter(filters),
+            search_params=self._search_params,
             limit=top_k,
+            with_payload=True,
+        ).points
+        return [self._to_hit(hit, hit.score) for hit in results]
+
+    def search_many(
+        self,
+        query_vectors: list[list[float]],
+        top_k: int = 50,
+        filters: dict[str, Any] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        if not query_vectors:
+            return []
+        from qdrant_client.models import QueryRequest
+
+        query_filter = _qdrant_filter(filters)
+        responses = self._client.query_batch_points(
+            collection_name=self._collection_name,
+            requests=[
+                QueryRequest(
+                    query=query_vector, filter=query_filter, params=self._search_params, limit=top_k, with_payload=True,
+                )
+                for query_vector in query_vectors
+            ],
         )
-        return [
-            {'id': str(hit.id), 'score': hit.score, 'metadata': hit.payload or {}}
-            for hit in results
-        ]
+        return [[self._to_hit(hit, hit.score) for hit in response.points] for response in responses]
+
+    def get(self, ids: list[str]) -> list[dict[str, Any]]:
+        if not ids:
+            return []
+        points = self._client.retrieve(
+            collection_name=self._collection_name,
+            ids=[_qdrant_point_id(doc_id) for doc_id in ids],
+            with_payload=True,
+            with_vectors=True,
+        )
+        hits = []
+        for point in points:
+            hit = self._to_hit(point)
+            hits.append({'id': hit['id'], 'vector': list(point.vector), 'metadata': hit['metadata']})
+        return hits
 
     def delete(self, ids: list[str]) -> None:
         from qdrant_client.models import PointIdsList
         if ids:
             self._client.delete(
                 collection_name=self._collection_name,
-                points_selector=PointIdsList(points=ids),
+                points_selector=PointIdsList(points=[_qdrant_point_id(doc_id) for doc_id in ids]),
             )
+            self.refresh_status()
 
     def count(self) -> int:
         info = self._client.get_collection(self._collection_name)
         return info.points_count or 0
 
+    def list_ids(self) -> list[str]:
+        ids: list[str] = []
+        offset = None
+        while True:
+            points, offset = self._client.scroll(
+                collection_name=self._collection_name,
+                limit=10000,
+                offset=offset,
+                with_payload=['doc_id'],
+                with_vectors=False,
+            )
+            ids.extend(self._to_hit(point)['id'] for point in points)
+            if offset is None:
+                return ids
+
+    def drop(self) -> None:
+        self._client.delete_collection(self._collection_name)
+
+
+# ---------------------------------------------------------------------------
+# NumPy backend (in-process, no external service)
+# ---------------------------------------------------------------------------
+
+def _column_array(values: list) -> np.ndarray:
+    """Typed column for mask evaluation: float64 (NaN for missing) if numeric, else object."""
+    present = [v for v in values if v is not None]
+    if present and all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in present):
+        return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+def _membership_mask(column: np.ndarray, values) -> np.ndarray:
+    values = list(values)
+    if column.dtype != object:
+        return np.isin(column, values)
+    mask = np.zeros(len(column), dtype=bool)
+    for value in values:
+        mask |= column == value
+    return mask
+
+
+def _holds_when_missing(condition: Any) -> bool:
+    """Whether ``condition`` matches a document without the key: only ``$ne``/``$nin`` do (as in Chroma and Qdrant)."""
+    return isinstance(condition, dict) and bool(condition) and all(op in ('$ne', '$nin') for op in condition)
+
+
+def _condition_mask(column: np.ndarray, condition: Any) -> np.ndarray:
+    """Boolean mask for one metadata filter condition.
+
+    ``condition`` is a plain value (equality), a list (membership) or a
+    Chroma-style operator dict such as ``{'$gte': 1700000000}``.
+    """
+    if isinstance(condition, dict):
+        mask = np.ones(len(column), dtype=bool)
+        for op, value in condition.items():
+            if op == '$eq':
+                mask &= column == value
+            elif op == '$ne':
+                mask &= column != value
+            elif op in ('$gt', '$gte', '$lt', '$lte'):
+                if column.dtype == object:
+                    return np.zeros(len(column), dtype=bool)
+                with np.errstate(invalid='ignore'):
+                    if op == '$gt':
+                        mask &= column > value
+                    elif op == '$gte':
+                        mask &= column >= value
+                    elif op == '$lt':
+                        mask &= column < value
+                    else:
+                        mask &= column <= value
+            elif op == '$in':
+                mask &= _membership_mask(column, value)
+            elif op == '$nin':
+                mask &= ~_membership_mask(column, value)
+            else:
+                raise ValueError(f'Unsupported filter operator: {op}')
+        return mask
+    if isinstance(condition, (list, tuple, set)):
+        return _membership_mask(column, condition)
+    return column == condition
+
+
+def quantize_int8(vectors: np.ndarray, block_rows: int = 16384) -> tuple[np.ndarray, np.ndarray]:
+    """Symmetric per-row int8 quantization: ``row ≈ codes * scale``."""
+    codes = np.empty(vectors.shape, dtype=np.int8)
+    scales = np.empty(len(vectors), dtype=np.float32)
+    for start in range(0, len(vectors), block_rows):
+        block = np.asarray(vectors[start:start + block_rows], dtype=np.float32)
+        scale = np.abs(block).max(axis=1) / 127.0
+        scale[scale == 0] = 1.0
+        codes[start:start + len(block)] = np.rint(block / scale[:, None]).astype(np.int8)
+        scales[start:start + len(block)] = scale
+    return codes, scales
+
+
+class NumpyVectorStore(VectorStore):
+    """Exact search over a memory-mapped float16 matrix.
+
+    Layout under ``<data_dir>/<collection_name>/``:
+
+    - ``vectors-<version>.f16`` — row-major ``(n, dim)`` float16, unit-normalized
+    - ``ids-<version>.npy``     — row ids
+    - ``meta-<version>.json``   — metadata as columns
+    - ``manifest.json``         — current version, row count and dimension
+
+    Writers produce a new version and swap the manifest atomically, so every
+    worker process maps the same files read-only. Readers notice a new
+    manifest on their next call and remap. Each process also keeps a float32
+    copy of the matrix in RAM (``n * dim * 4`` bytes, twice the file), built
+    once per version, so searches multiply it directly instead of converting
+    the float16 rows on every call.
+
+    The price is that every ``upsert`` and ``delete`` rewrites the whole
+    matrix, ids and metadata, and makes every worker remap (and, with int8,
+    re-quantize) it: a write costs O(collection size) however few rows it
+    touches. Write in large batches (``bulk_upsert`` with a big
+    ``chunk_size``); for frequent small writes use Qdrant or HNSW.
+
+    With ``quantization='int8'`` each process keeps an int8 copy of the
+    matrix (plus one scale per row) in RAM instead and scans that; the top
+    ``top_k * rescore_overfetch`` rows are then rescored against the float16
+    file, so only those rows of it are paged in.
+    """
+
+    # Rows converted to float32 per matmul block: bounds temporary memory
+    _BLOCK_ROWS = 16384
+
+    def __init__(
+        self,
+        data_dir: str = './data/vectors',
+        collection_name: str = 'gymunity-news',
+        quantization: str = 'none',
+        rescore_overfetch: int = 4,
+    ):
+        if quantization not in ('none', 'int8'):
+            raise ValueError(f'Unsupported quantization: {quantization}')
+        self.quantization = quantization
+        self.rescore_overfetch = max(1, rescore_overfetch)
+        self._dir = Path(data_dir) / collection_name
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._manifest_path = self._dir / 'manifest.json'
+        self._lock = threading.RLock()
+        self._manifest_mtime: tuple[int, int] | None = None
+        self._version = 0
+        self._vectors: np.ndarray = np.zeros((0, 0), dtype=np.float16)
+        self._floats: np.ndarray | None = None  # float32 copy when not quantized
+        self._codes: np.ndarray | None = None  # int8 copy when quantized
+        self._scales: np.ndarray | None = None
+        self._ids: np.ndarray = np.array([], dtype=object)
+        self._row_of: dict[str, int] = {}
+        self._columns: dict[str, list] = {}  # metadata as stored, for returning hits
+        self._meta: dict[str, np.ndarray] = {}  # typed copies, for filter masks
+        self._reload()
+        logger.info('NumPy vector store "%s" ready (%d vectors)', collection_name, len(self._ids))
+
+    # -- persistence -------------------------------------------------------
+
+    def _reload(self) -> None:
+        """Remap the current version if another writer has replaced it."""
+        try:
+            stat = self._manifest_path.stat()
+        except FileNotFoundError:
+            return
+        # os.replace gives every manifest a fresh inode
+        mtime = (stat.st_ino, stat.st_mtime_ns)
+        if mtime == self._manifest_mtime:
+            return
+
+        manifest = json.loads(self._manifest_path.read_text(encoding='utf-8'))
+        version, count, dim = manifest['version'], manifest['count'], manifest['dim']
+        if count:
+            vectors = np.memmap(self._dir / f'vectors-{version}.f16', dtype=np.float16, mode='r', shape=(count, dim))
+        else:
+            vectors = np.zeros((0, dim), dtype=np.float16)
+        ids = np.load(self._dir / f'ids-{version}.npy', allow_pickle=True)
+        columns = json.loads((self._dir / f'meta-{version}.json').read_text(encoding='utf-8'))
+
+        self._vectors = vectors
+        if self.quantization == 'int8':
+            self._codes, self._scales = quantize_int8(vectors, self._BLOCK_ROWS)
+        else:
+            self._floats = np.asarray(vectors, dtype=np.float32)
+        self._ids = ids
+        self._row_of = {doc_id: i for i, doc_id in enumerate(ids.tolist())}
+        self._columns = columns
+        self._meta = {key: _column_array(values) for key, values in columns.items()}
+        self._version = version
+        self._manifest_mtime = mtime
+
+    def _write(self, vectors: np.ndarray, ids: list[str], columns: dict[str, list]) -> None:
+        version = self._version + 1
+        count, dim = vectors.shape if vectors.size else (0, vectors.shape[1] if vectors.ndim == 2 else 0)
+
+        if count:
+            out = np.memmap(self._dir / f'vectors-{version}.f16', dtype=np.float16, mode='w+', shape=(count, dim))
+            out[:] = vectors
+            out.flush()
+            del out
+        np.save(self._dir / f'ids-{version}.npy', np.array(ids, dtype=object), allow_pickle=True)
+        (self._dir / f'meta-{version}.json').write_text(json.dumps(columns), encoding='utf-8')
+
+        tmp = self._manifest_path.with_suffix('.tmp')
+        tmp.write_text(json.dumps({'version': version, 'count': count, 'dim': dim}), encoding='utf-8')
+        os.replace(tmp, self._manifest_path)
+
+        # Drop files older than the previous version (open maps keep their inode alive)
+        for path in self._dir.iterdir():
+            stem = path.name.split('.')[0]
+            if '-' in stem and stem.rsplit('-', 1)[1].isdigit() and int(stem.rsplit('-', 1)[1]) < version - 1:
+                try:
+                    path.unlink(missing_ok=True)
+                except OSError:
+                    pass  # still mapped on platforms that forbid unlinking open files
+
+        self._reload()
+        self.refresh_status()
+
+    @contextmanager
+    def _exclusive(self):
+        """Serialize writers within this process and, where supported, across processes."""
+        with self._lock, open(self._dir / '.lock', 'a') as handle:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                self._reload()
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+
+    # -- VectorStore API ---------------------------------------------------
+
+    def upsert(self, ids: list[str], embeddings: list[list[float]], metadata: list[dict[str, Any]]) -> None:
+        if not ids:
+            return
+        new = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(new, axis=1, keepdims=True)
+        new = (new / np.where(norms == 0, 1, norms)).astype(np.float16)
+
+        with self._exclusive():
+            if len(self._ids) and self._vectors.shape[1] != new.shape[1]:
+                raise ValueError(f'Vector dimension {new.shape[1]} does not match store ({self._vectors.shape[1]})')
+
+            all_ids = self._ids.tolist()
+            row_of = dict(self._row_of)
+            columns = {key: list(values) for key, values in self._columns.items()}
+            vectors = np.array(self._vectors) if all_ids else np.zeros((0, new.shape[1]), dtype=np.float16)
+
+            appended: dict[int, int] = {}  # row -> index into ``new``
+            for i, (doc_id, meta) in enumerate(zip(ids, metadata)):
+                row = row_of.get(doc_id)
+                if row is None:
+                    row = len(all_ids)
+                    row_of[doc_id] = row
+                    all_ids.append(doc_id)
+                    for column in columns.values():
+                        column.append(None)
+                if row >= len(vectors):
+                    appended[row] = i
+                else:
+                    vectors[row] = new[i]
+                for key in meta.keys() - columns.keys():
+                    columns[key] = [None] * len(all_ids)
+                for key, column in columns.items():
+                    column[row] = meta.get(key)
+
+            if appended:
+                vectors = np.vstack([vectors, new[[appended[row] for row in sorted(appended)]]])
+            self._write(vectors, all_ids, columns)
+
+    def search(self, query_vector: list[float], top_k: int = 50, filters: dict[str, Any] | None = None) -> list[dict[str, Any]]:
+        return self.search_many([query_vector], top_k=top_k, filters=filters)[0]
+
+    def search_many(
+        self,
+        query_vectors: list[list[float]],
+        top_k: int = 50,
+        filters: dict[str, Any] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        if not query_vectors:
+            return []
+        with self._lock:
+            self._reload()
+            vectors, ids, meta, columns = self._vectors, self._ids, self._meta, self._columns
+            floats, codes, scales = self._floats, self._codes, self._scales
+        if not len(ids) or top_k <= 0:
+            return [[] for _ in query_vectors]
+
+        queries = np.asarray(query_vectors, dtype=np.float32).reshape(len(query_vectors), -1)
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        queries = queries / np.where(norms == 0, 1, norms)
+
+        # One pass over the matrix scores every query: (n, dim) @ (dim, q)
+        quantized = codes is not None
+        if quantized:
+            scores = np.empty((len(ids), len(queries)), dtype=np.float32)
+            for start in range(0, len(ids), self._BLOCK_ROWS):
+                block = np.asarray(codes[start:start + self._BLOCK_ROWS], dtype=np.float32)
+                scores[start:start + len(block)] = block @ queries.T
+            scores *= scales[:, None]
+        else:
+            scores = floats @ queries.T
+
+        candidates = len(ids)
+        if filters:
+            mask = self._filter_mask(filters, meta, len(ids))
+            scores[~mask] = -np.inf
+            candidates = int(mask.sum())
+            if candidates == 0:
+                return [[] for _ in query_vectors]
+
+        top_k = min(top_k, candidates)
+        fetch = min(top_k * self.rescore_overfetch, candidates) if quantized else top_k
+        top = np.argpartition(-scores, fetch - 1, axis=0)[:fetch]
+        results = []
+        for q in range(len(queries)):
+            rows = top[:, q]
+            if quantized:
+                # Rescore the shortlist against the float16 rows on disk
+                rows = np.sort(rows)
+                exact = np.asarray(vectors[rows], dtype=np.float32) @ queries[q]
+                order = np.argsort(-exact)[:top_k]
+                rows, row_scores = rows[order], exact[order]
+            else:
+                rows = rows[np.argsort(-scores[rows, q])]
+                row_scores = scores[rows, q]
+            results.append([
+                {'id': ids[row], 'score': float(score), 'metadata': self._row_metadata(columns, row)}
+                for row, score in zip(rows, row_scores)
+            ])
+        return results
+
+    @staticmethod
+    def _filter_mask(filters: dict[str, Any], meta: dict[str, np.ndarray], count: int) -> np.ndarray:
+        mask = np.ones(count, dtype=bool)
+        for key, condition in filters.items():
+            if condition is None:
+                continue
+            column = meta.get(key)
+            if column is None:
+                if _holds_when_missing(condition):
+                    continue
+                return np.zeros(count, dtype=bool)
+            mask &= _condition_mask(column, condition)
+        return mask
+
+    @staticmethod
+    def _row_metadata(columns: dict[str, list], row: int) -> dict[str, Any]:
+        return {key: values[row] for key, values in columns.items() if values[row] is not None}
+
+    def get(self, ids: list[str]) -> list[dict[str, Any]]:
+        with self._lock:
+            self._reload()
+            rows = [(doc_id, self._row_of[doc_id]) for doc_id in ids if doc_id in self._row_of]
+            return [
+                {
+                    'id': doc_id,
+                    'vector': np.asarray(self._vectors[row], dtype=np.float32).tolist(),
+                    'metadata': self._row_metadata(self._columns, row),
+                }
+                for doc_id, row in rows
+            ]
+
+    def delete(self, ids: list[str]) -> None:
+        if not ids:
+            return
+        with self._exclusive():
+            drop = {self._row_of[doc_id] for doc_id in ids if doc_id in self._row_of}
+            if not drop:
+                return
+            keep = np.array([i for i in range(len(self._ids)) if i not in drop], dtype=np.int64)
+            vectors = np.asarray(self._vectors)[keep] if len(keep) else np.zeros((0, self._vectors.shape[1]), dtype=np.float16)
+            columns = {key: [values[i] for i in keep] for key, values in self._columns.items()}
+            self._write(vectors, self._ids[keep].tolist(), columns)
+
+    def count(self) -> int:
+        with self._lock:
+            self._reload()
+            return len(self._ids)
+
+    def list_ids(self) -> list[str]:
+        with self._lock:
+            self._reload()
+            return self._ids.tolist()
+
+    def drop(self) -> None:
+        with self._exclusive():
+            shutil.rmtree(self._dir, ignore_errors=True)
+            self._vectors = np.zeros((0, 0), dtype=np.float16)
+            self._floats = self._codes = self._scales = None
+            self._ids = np.array([], dtype=object)
+            self._row_of, self._columns, self._meta = {}, {}, {}
+            self._manifest_mtime = None
+
+
+# ---------------------------------------------------------------------------
+# HNSW backend (local approximate index, hnswlib)
+# ---------------------------------------------------------------------------
+
+def _matches_condition(value: Any, condition: Any) -> bool:
+    """Scalar counterpart of :func:`_condition_mask` for post-filtering single hits."""
+    if isinstance(condition, dict):
+        for op, expected in condition.items():
+            if op == '$eq':
+                ok = value == expected
+            elif op == '$ne':
+                ok = value != expected
+            elif op in ('$gt', '$gte', '$lt', '$lte'):
+                if not isinstance(value, (int, float)) or isinstance(value, bool):
+                    return False
+                ok = {
+                    '$gt': value > expected,
+                    '$gte': value >= expected,
+                    '$lt': value < expected,
+                    '$lte': value <= expected,
+                }[op]
+            elif op == '$in':
+                ok = value in expected
+            elif op == '$nin':
+                ok = value not in expected
+            else:
+                raise ValueError(f'Unsupported filter operator: {op}')
+            if not ok:
+                return False
+        return True
+    if isinstance(condition, (list, tuple, set)):
+        return value in condition
+    return value == condition
+
+
+def _matches_filters(metadata: dict[str, Any], filters: dict[str, Any] | None) -> bool:
+    if not filters:
+        return True
+    for key, condition in filters.items():
+        if condition is None:
+            continue
+        if key not in metadata:
+            if _holds_when_missing(condition):
+                continue
+            return False
+        if not _matches_condition(metadata[key], condition):
+            return False
+    return True
+
+
+class HnswVectorStore(VectorStore):
+    """Approximate nearest-neighbour search with an on-disk HNSW graph.
+
+    The graph is kept in memory and saved to ``<data_dir>/<collection_name>/``
+    after every write (``index.bin`` plus a ``state.json`` sidecar with the
+    id/label map and metadata). Deletes only mark graph nodes; their slots are
+    reused by later inserts. Metadata filters are applied after the search,
+    over-fetching ``overfetch`` times ``top_k`` and widening until enough
+    hits pass or the index is exhausted.
+    """
+
+    def __init__(
+        self,
+        data_dir: str = './data/vectors',
+        collection_name: str = 'gymunity-news',
+        dim: int = 384,
+        m: int = 16,
+        ef_construction: int = 200,
+        ef_search: int = 64,
+        overfetch: int = 4,
+    ):
+        try:
+            import hnswlib
+        except ImportError:
+            raise ImportError('hnswlib is required: pip install hnswlib')
+
+        self._hnswlib = hnswlib
+        self._dir = Path(data_dir) / collection_name
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._index_path = self._dir / 'index.bin'
+        self._state_path = self._dir / 'state.json'
+        self._dim = dim
+        self._m = m
+        self._ef_construction = ef_construction
+        self.ef_search = ef_search
+        self.overfetch = max(1, overfetch)
+        self._lock = threading.RLock()
+        self._state_key: tuple[int, int] | None = None
+        self._index = None
+        self._label_of: dict[str, int] = {}
+        self._id_of: dict[int, str] = {}
+        self._meta: dict[str, dict[str, Any]] = {}
+        self._next_label = 0
+        self._reload()
+        logger.info('HNSW index "%s" ready (%d vectors, M=%d, ef=%d)', collection_name, len(self._label_of), m, ef_search)
+
+    # -- persistence -------------------------------------------------------
+
+    def _new_index(self, capacity: int):
+        index = self._hnswlib.Index(space='cosine', dim=self._dim)
+        index.init_index(
+            max_elements=capacity, M=self._m, ef_construction=self._ef_construction,
+            allow_replace_deleted=True,
+        )
+        return index
+
+    def _reload(self) -> None:
+        """Load the saved index, or pick up a newer one saved by another process."""
+        try:
+            stat = self._state_path.stat()
+        except FileNotFoundError:
+            if self._index is None:
+                self._index = self._new_index(1024)
+            return
+        key = (stat.st_ino, stat.st_mtime_ns)
+        if key == self._state_key:
+            return
+
+        state = json.loads(self._state_path.read_text(encoding='utf-8'))
+        self._dim = state['dim']
+        index = self._hnswlib.Index(space='cosine', dim=self._dim)
+        index.load_index(str(self._index_path), max_elements=state['capacity'], allow_replace_deleted=True)
+        self._index = index
+        self._label_of = state['labels']
+        self._id_of = {label: doc_id for doc_id, label in self._label_of.items()}
+        self._meta = state['metadata']
+        self._next_label = state['next_label']
+        self._state_key = key
+
+    def _save(self) -> None:
+        tmp_index = self._index_path.with_suffix('.tmp')
+        self._index.save_index(str(tmp_index))
+        os.replace(tmp_index, self._index_path)
+        tmp_state = self._state_path.with_suffix('.tmp')
+        tmp_state.write_text(json.dumps({
+            'dim': self._dim,
+            'capacity': self._index.get_max_elements(),
+            'next_label': self._next_label,
+            'labels': self._label_of,
+            'metadata': self._meta,
+        }), encoding='utf-8')
+        os.replace(tmp_state, self._state_path)
+        stat = self._state_path.stat()
+        self._state_key = (stat.st_ino, stat.st_mtime_ns)
+        self.refresh_status()
+
+    # -- VectorStore API ---------------------------------------------------
+
+    def upsert(self, ids: list[str], embeddings: list[list[float]], metadata: list[dict[str, Any]]) -> None:
+        if not ids:
+            return
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        with self._lock:
+            self._reload()
+            if vectors.shape[1] != self._dim:
+                if self._label_of:
+                    raise ValueError(f'Vector dimension {vectors.shape[1]} does not match index ({self._dim})')
+                self._dim = vectors.shape[1]
+                self._index = self._new_index(max(1024, len(ids)))
+
+            existing_rows, existing_labels, new_rows, new_labels = [], [], [], []
+            for i, (doc_id, meta) in enumerate(zip(ids, metadata)):
+                label = self._label_of.get(doc_id)
+                if label is None:
+                    label = self._next_label
+                    self._next_label += 1
+                    self._label_of[doc_id] = label
+                    self._id_of[label] = doc_id
+                    new_rows.append(i)
+                    new_labels.append(label)
+                else:
+                    existing_rows.append(i)
+                    existing_labels.append(label)
+                self._meta[doc_id] = dict(meta)
+
+            needed = len(self._label_of)
+            capacity = self._index.get_max_elements()
+            if needed > capacity:
+                self._index.resize_index(max(needed, capacity * 2))
+
+            if existing_rows:
+                self._index.add_items(vectors[existing_rows], existing_labels)
+            if new_rows:
+                # Reuse slots freed by mark_deleted before growing the graph
+                self._index.add_items(vectors[new_rows], new_labels, replace_deleted=True)
+            self._save()
+
+    def search(self, query_vector: list[float], top_k: int = 50, filters: dict[str, Any] | None = None) -> list[dict[str, Any]]:
+        return self.search_many([query_vector], top_k=top_k, filters=filters)[0]
+
+    def search_many(
+        self,
+        query_vectors: list[list[float]],
+        top_k: int = 50,
+        filters: dict[str, Any] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        if not query_vectors:
+            return []
+        with self._lock:
+            self._reload()
+            total = len(self._label_of)
+            if total == 0 or top_k <= 0:
+                return [[] for _ in query_vectors]
+
+            queries = np.asarray(query_vectors, dtype=np.float32).reshape(len(query_vectors), -1)
+            results: list[list[dict[str, Any]]] = [[] for _ in query_vectors]
+            pending = list(range(len(queries)))
+            fetch = min(total, top_k * (self.overfetch if filters else 1))
+            while pending:
+                self._index.set_ef(max(self.ef_search, fetch))
+                labels, distances = self._index.knn_query(queries[pending], k=fetch)
+                short = []
+                for row, q in enumerate(pending):
+                    hits = self._collect(labels[row], distances[row], top_k, filters)
+                    results[q] = hits
+                    if len(hits) < top_k and fetch < total:
+                        short.append(q)
+                # Only queries whose filter rejected too many neighbours go round again
+                pending = short
+                fetch = min(total, fetch * self.overfetch)
+            return results
+
+    def _collect(self, labels, distances, top_k: int, filters: dict[str, Any] | None) -> list[dict[str, Any]]:
+        hits = []
+        for label, distance in zip(labels, distances):
+            doc_id = self._id_of.get(int(label))
+            if doc_id is None:
+                continue
+            meta = self._meta.get(doc_id, {})
+            if not _matches_filters(meta, filters):
+                continue
+            hits.append({'id': doc_id, 'score': 1.0 - float(distance), 'metadata': meta})
+            if len(hits) >= top_k:
+                break
+        return hits
+
+    def get(self, ids: list[str]) -> list[dict[str, Any]]:
+        with self._lock:
+            self._reload()
+            present = [doc_id for doc_id in ids if doc_id in self._label_of]
+            if not present:
+                return []
+            vectors = self._index.get_items([self._label_of[doc_id] for doc_id in present])
+            return [
+                {'id': doc_id, 'vector': [float(x) for x in vector], 'metadata': self._meta.get(doc_id, {})}
+                for doc_id, vector in zip(present, vectors)
+            ]
+
+    def delete(self, ids: list[str]) -> None:
+        if not ids:
+            return
+        with self._lock:
+            self._reload()
+            removed = False
+            for doc_id in ids:
+                label = self._label_of.pop(doc_id, None)
+                if label is None:
+                    continue
+                self._index.mark_deleted(label)
+                self._id_of.pop(label, None)
+                self._meta.pop(doc_id, None)
+                removed = True
+            if removed:
+                self._save()
+
+    def count(self) -> int:
+        with self._lock:
+            self._reload()
+            return len(self._label_of)
+
+    def list_ids(self) -> list[str]:
+        with self._lock:
+            self._reload()
+            return list(self._label_of)
+
+    def drop(self) -> None:
+        with self._lock:
+            shutil.rmtree(self._dir, ignore_errors=True)
+            self._index = None
+            self._label_of, self._id_of, self._meta = {}, {}, {}
+            self._state_key = None
+
+
+# ---------------------------------------------------------------------------
+# Time-sharded store (one collection per ISO week)
+# ---------------------------------------------------------------------------
+
+class ShardedVectorStore(VectorStore):
+    """Route vectors to one collection per ISO week of ``published_ts``.
+
+    Shards are named ``<base_name>-<year>w<week>`` and opened through
+    ``open_shard``, so any backend can be sharded. A search whose filters
+    bound ``published_ts`` only queries the weeks that overlap the range and
+    merges their top-k; dropping a week drops its collection outright.
+
+    ``open_shard`` returning a ``NullVectorStore`` (a backend that failed to
+    start) raises instead of being cached, so writes to that week fail loudly
+    and ``refresh_status`` marks the store unhealthy.
+    """
+
+    def __init__(
+        self,
+        base_name: str,
+        open_shard: Callable[[str], VectorStore],
+        list_collections: Callable[[], list[str]],
+        drop_collection: Callable[[str], None],
+        time_key: str = 'published_ts',
+        refresh_seconds: float = 60.0,
+    ):
+        self.base_name = base_name
+        self.time_key = time_key
+        self._open_shard = open_shard
+        self._list_collections = list_collections
+        self._drop_collection = drop_collection
+        self._refresh_seconds = refresh_seconds
+        self._lock = threading.RLock()
+        self._shards: dict[str, VectorStore] = {}  # week -> opened store
+        self._weeks: set[str] = set()
+        self._listed_at = 0.0
+        self._refresh_weeks()
+        logger.info('Sharded vector store "%s" ready (%d weekly shards)', base_name, len(self._weeks))
+
+    # -- shard bookkeeping -------------------------------------------------
+
+    @staticmethod
+    def week_of(ts: float) -> str:
+        year, week, _ = datetime.fromtimestamp(ts, tz=timezone.utc).isocalendar()
+        return f'{year}w{week:02d}'
+
+    @staticmethod
+    def week_bounds(week: str) -> tuple[float, float]:
+        """``[start, end)`` of an ISO week as epoch seconds."""
+        year, number = week.split('w')
+        monday = date.fromisocalendar(int(year), int(number), 1)
+        start = datetime(monday.year, monday.month, monday.day, tzinfo=timezone.utc)
+        return start.timestamp(), (start + timedelta(days=7)).timestamp()
+
+    def _refresh_weeks(self, force: bool = False) -> None:
+        """Pick up shards created by other processes."""
+        now = time.monotonic()
+        if not force and now - self._listed_at < self._refresh_seconds:
+            return
+        prefix = f'{self.base_name}-'
+        weeks = set()
+        for name in self._list_collections():
+            week = name[len(prefix):] if name.startswith(prefix) else ''
+            if week[:4].isdigit() and week[4:5] == 'w' and week[5:].isdigit():
+                weeks.add(week)
+        with self._lock:
+            self._weeks = weeks | set(self._shards)
+            self._listed_at = now
+
+    def _shard(self, week: str) -> VectorStore:
+        with self._lock:
+            shard = self._shards.get(week)
+            if shard is None:
+                name = f'{self.base_name}-{week}'
+                shard = self._open_shard(name)
+                if isinstance(shard, NullVectorStore):
+                    raise RuntimeError(f'vector shard "{name}" failed to open')
+                self._shards[week] = shard
+                self._weeks.add(week)
+            return shard
+
+    def shards(self) -> list[str]:
+        """Known weeks, newest first."""
+        self._refresh_weeks()
+        return sorted(self._weeks, reverse=True)
+
+    def _time_range(self, filters: dict[str, Any] | None) -> tuple[float, float]:
+        lo, hi = float('-inf'), float('inf')
+        condition = (filters or {}).get(self.time_key)
+        if isinstance(condition, dict):
+            for op, value in condition.items():
+                if op in ('$gt', '$gte'):
+                    lo = max(lo, float(value))
+                elif op in ('$lt', '$lte'):
+                    hi = min(hi, float(value))
+                elif op == '$eq':
+                    lo, hi = max(lo, float(value)), min(hi, float(value))
+        elif isinstance(condition, (int, float)):
+            lo = hi = float(condition)
+        return lo, hi
+
+    def _weeks_for(self, filters: dict[str, Any] | None) -> list[str]:
+        lo, hi = self._time_range(filters)
+        weeks = []
+        for week in self.shards():
+            start, end = self.week_bounds(week)
+            if end > lo and start <= hi:
+                weeks.append(week)
+        return weeks
+
+    def drop_shard(self, week: str) -> None:
+        """Drop one week's collection; a week that was never opened is dropped by name."""
+        self._refresh_weeks()
+        with self._lock:
+            shard = self._shards.pop(week, None)
+            known = week in self._weeks
+            self._weeks.discard(week)
+        if shard is not None:
+            shard.drop()
+        elif known:
+            self._drop_collection(f'{self.base_name}-{week}')
+        self.refresh_status()
+
+    def drop_shards_before(self, ts: float) -> list[str]:
+        """Drop every shard whose week ends at or before ``ts``; returns the weeks dropped."""
+        dropped = [week for week in self.shards() if self.week_bounds(week)[1] <= ts]
+        for week in dropped:
+            self.drop_shard(week)
+        return dropped
+
+    # -- VectorStore API ---------------------------------------------------
+
+    def upsert(self, ids: list[str], embeddings: list[list[float]], metadata: list[dict[str, Any]]) -> None:
+        groups: dict[str, tuple[list, list, list]] = {}
+        now = time.time()
+        for doc_id, vector, meta in zip(ids, embeddings, metadata):
+            week = self.week_of(float(meta.get(self.time_key) or now))
+            group = groups.setdefault(week, ([], [], []))
+            group[0].append(doc_id)
+            group[1].append(vector)
+            group[2].append(meta)
+        for week, (group_ids, group_vectors, group_meta) in groups.items():
+            self._shard(week).upsert(group_ids, group_vectors, group_meta)
+        # An id whose ``published_ts`` moved to another week leaves its old copy behind
+        for week in self.shards():
+            stale = [doc_id for other, (group_ids, _, _) in groups.items() if other != week for doc_id in group_ids]
+            if stale:
+                self._shard(week).delete(stale)
+        self.refresh_status()
+
+    def search(self, query_vector: list[float], top_k: int = 50, filters: dict[str, Any] | None = None) -> list[dict[str, Any]]:
+        return self.search_many([query_vector], top_k=top_k, filters=filters)[0]
+
+    def search_many(
+        self,
+        query_vectors: list[list[float]],
+        top_k: int = 50,
+        filters: dict[str, Any] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        merged: list[list[dict[str, Any]]] = [[] for _ in query_vectors]
+        if not query_vectors:
+            return merged
+        for week in self._weeks_for(filters):
+            for hits, shard_hits in zip(merged, self._shard(week).search_many(query_vectors, top_k, filters)):
+                hits.extend(shard_hits)
+        return [sorted(hits, key=lambda h: h['score'], reverse=True)[:top_k] for hits in merged]
+
+    def get(self, ids: list[str]) -> list[dict[str, Any]]:
+        found: dict[str, dict[str, Any]] = {}
+        for week in self.shards():
+            missing = [doc_id for doc_id in ids if doc_id not in found]
+            if not missing:
+                break
+            for hit in self._shard(week).get(missing):
+                found[hit['id']] = hit
+        return [found[doc_id] for doc_id in ids if doc_id in found]
+
+    def delete(self, ids: list[str]) -> None:
+        if not ids:
+            return
+        for week in self.shards():
+            self._shard(week).delete(ids)
+        self.refresh_status()
+
+    def count(self) -> int:
+        return sum(self._shard(week).count() for week in self.shards())
+
+    def list_ids(self) -> list[str]:
+        return [doc_id for week in self.shards() for doc_id in self._shard(week).list_ids()]
+
+    def drop(self) -> None:
+        for week in self.shards():
+            self.drop_shard(week)
+
 
 # ---------------------------------------------------------------------------
 # Null backend (no vector search — graceful degradation)
@@ -179,47 +1454,197 @@ class NullVectorStore(VectorStore):
     def search(self, query_vector, top_k=50, filters=None):
         return []
 
+    def search_many(self, query_vectors, top_k=50, filters=None):
+        return [[] for _ in query_vectors]
+
+    def get(self, ids):
+        return []
+
     def delete(self, ids):
         pass
 
     def count(self):
         return 0
 
+    def list_ids(self):
+        return []
+
+    def drop(self):
+        pass
+
+    def start_status_monitor(self, interval_seconds):
+        pass
+
 
 # ---------------------------------------------------------------------------
 # Factory
 # ---------------------------------------------------------------------------
 
 _instance: VectorStore | None = None
+_user_instance: VectorStore | None = None
+_chunk_instance: VectorStore | None = None
 
 
-def get_vector_store() -> VectorStore:
-    """Get or create the vector store singleton."""
-    global _instance
-    if _instance is not None:
-        return _instance
-
+def _create_backend(collection_name: str) -> VectorStore:
+    """Build a backend for ``collection_name`` from ``settings.VECTOR_DB_PROVIDER``."""
     from app.core.config import settings
     provider = getattr(settings, 'VECTOR_DB_PROVIDER', 'none')
 
     if provider == 'chroma':
         try:
             path = getattr(settings, 'VECTOR_DB_PATH', './data/chroma')
-            name = getattr(settings, 'VECTOR_DB_NEWS_INDEX', 'gymunity-news')
-            _instance = ChromaVectorStore(persist_dir=path, collection_name=name)
+            if settings.VECTOR_DB_QUANTIZATION != 'none':
+                logger.warning('VECTOR_DB_QUANTIZATION=%s is not supported by ChromaDB — storing float vectors',
+                               settings.VECTOR_DB_QUANTIZATION)
+            return ChromaVectorStore(persist_dir=path, collection_name=collection_name)
         except Exception as exc:
             logger.warning('ChromaDB init failed (%s), falling back to NullVectorStore', exc)
-            _instance = NullVectorStore()
+            return NullVectorStore()
     elif provider == 'qdrant':
         try:
+            from app.services.dim_reduction import get_embedding_dim
             url = settings.VECTOR_DB_URL
-            name = settings.VECTOR_DB_NEWS_INDEX
-            _instance = QdrantVectorStore(url=url, collection_name=name)
+            return QdrantVectorStore(
+                url=url,
+                collection_name=collection_name,
+                vector_size=get_embedding_dim(),
+                quantization=settings.VECTOR_DB_QUANTIZATION,
+                rescore_overfetch=settings.VECTOR_DB_RESCORE_OVERFETCH,
+            )
         except Exception as exc:
             logger.warning('Qdrant init failed (%s), falling back to NullVectorStore', exc)
-            _instance = NullVectorStore()
-    else:
-        _instance = NullVectorStore()
-        logger.info('Vector search disabled (VECTOR_DB_PROVIDER=%s)', provider)
+            return NullVectorStore()
+    elif provider == 'numpy':
+        try:
+            path = getattr(settings, 'VECTOR_DB_PATH', './data/vectors')
+            return NumpyVectorStore(
+                data_dir=path,
+                collection_name=collection_name,
+                quantization=settings.VECTOR_DB_QUANTIZATION,
+                rescore_overfetch=settings.VECTOR_DB_RESCORE_OVERFETCH,
+            )
+        except Exception as exc:
+            logger.warning('NumPy vector store init failed (%s), falling back to NullVectorStore', exc)
+            return NullVectorStore()
+    elif provider == 'hnsw':
+        try:
+            from app.services.dim_reduction import get_embedding_dim
+            if settings.VECTOR_DB_QUANTIZATION != 'none':
+                logger.warning('VECTOR_DB_QUANTIZATION=%s is not supported by hnswlib — storing float vectors',
+                               settings.VECTOR_DB_QUANTIZATION)
+            return HnswVectorStore(
+                data_dir=getattr(settings, 'VECTOR_DB_PATH', './data/vectors'),
+                collection_name=collection_name,
+                dim=get_embedding_dim(),
+                m=settings.VECTOR_DB_HNSW_M,
+                ef_construction=settings.VECTOR_DB_HNSW_EF_CONSTRUCTION,
+                ef_search=settings.VECTOR_DB_HNSW_EF_SEARCH,
+                overfetch=settings.VECTOR_DB_HNSW_OVERFETCH,
+            )
+        except Exception as exc:
+            logger.warning('HNSW init failed (%s), falling back to NullVectorStore', exc)
+            return NullVectorStore()
+
+    logger.info('Vector search disabled (VECTOR_DB_PROVIDER=%s)', provider)
+    return NullVectorStore()
+
 
+def _list_collections() -> list[str]:
+    """Names of the collections that exist for the configured provider."""
+    from app.core.config import settings
+    provider = settings.VECTOR_DB_PROVIDER
+
+    if provider == 'chroma':
+        import chromadb
+        client = chromadb.PersistentClient(path=settings.VECTOR_DB_PATH)
+        return [getattr(c, 'name', c) for c in client.list_collections()]
+    if provider == 'qdrant':
+        from qdrant_client import QdrantClient
+        return [c.name for c in QdrantClient(url=settings.VECTOR_DB_URL).get_collections().collections]
+    if provider in ('numpy', 'hnsw'):
+        root = Path(settings.VECTOR_DB_PATH)
+        return [path.name for path in root.iterdir() if path.is_dir()] if root.exists() else []
+    return []
+
+
+def _drop_collection(collection_name: str) -> None:
+    """Delete ``collection_name`` of the configured provider without opening a store on it."""
+    from app.core.config import settings
+    provider = settings.VECTOR_DB_PROVIDER
+
+    if provider == 'chroma':
+        import chromadb
+        chromadb.PersistentClient(path=settings.VECTOR_DB_PATH).delete_collection(collection_name)
+    elif provider == 'qdrant':
+        from qdrant_client import QdrantClient
+        QdrantClient(url=settings.VECTOR_DB_URL).delete_collection(collection_name)
+    elif provider in ('numpy', 'hnsw'):
+        shutil.rmtree(Path(settings.VECTOR_DB_PATH) / collection_name, ignore_errors=True)
+
+
+def _create_store(collection_name: str, shardable: bool = False) -> VectorStore:
+    """Build the store for ``collection_name``, weekly-sharded when configured."""
+    from app.core.config import settings
+
+    if shardable and settings.VECTOR_DB_SHARDING == 'week' and settings.VECTOR_DB_PROVIDER != 'none':
+        try:
+            return ShardedVectorStore(
+                collection_name,
+                open_shard=_create_backend,
+                list_collections=_list_collections,
+                drop_collection=_drop_collection,
+            )
+        except Exception as exc:
+            logger.warning('Sharded vector store init failed (%s), falling back to NullVectorStore', exc)
+            return NullVectorStore()
+    elif settings.VECTOR_DB_SHARDING not in ('none', 'week'):
+        logger.warning('Ignoring unknown VECTOR_DB_SHARDING=%s', settings.VECTOR_DB_SHARDING)
+    return _create_backend(collection_name)
+
+
+def _monitored(store: VectorStore) -> VectorStore:
+    """Take the first status snapshot and keep it fresh in the background."""
+    from app.core.config import settings
+    store.refresh_status()
+    store.start_status_monitor(settings.VECTOR_DB_STATUS_INTERVAL_SECONDS)
+    return store
+
+
+def get_vector_store() -> VectorStore:
+    """Get or create the article vector store singleton."""
+    global _instance
+    if _instance is not None:
+        return _instance
+
+    from app.core.config import settings
+    _instance = _monitored(_create_store(getattr(settings, 'VECTOR_DB_NEWS_INDEX', 'gymunity-news'), shardable=True))
     return _instance
+
+
+def reopen_vector_store() -> VectorStore:
+    """Forget the article store singleton and open it again (e.g. after ``drop``)."""
+    global _instance
+    _instance = None
+    return get_vector_store()
+
+
+def get_user_vector_store() -> VectorStore:
+    """Get or create the user profile vector store singleton."""
+    global _user_instance
+    if _user_instance is not None:
+        return _user_instance
+
+    from app.core.config import settings
+    _user_instance = _monitored(_create_store(getattr(settings, 'VECTOR_DB_USER_INDEX', 'gymunity-users')))
+    return _user_instance
+
+
+def get_chunk_vector_store() -> VectorStore:
+    """Get or create the per-chunk (RAG) vector store singleton."""
+    global _chunk_instance
+    if _chunk_instance is not None:
+        return _chunk_instance
+
+    from app.core.config import settings
+    _chunk_instance = _monitored(_create_store(getattr(settings, 'VECTOR_DB_CHUNK_INDEX', 'gymunity-news-chunks'), shardable=True))
+    return _chunk_instance
@@ -0,0 +1,115 @@
+"""Candidate scoring time: per-candidate loop vs the vectorized engine.
+
+Builds synthetic candidates (feature records with topics, sources, ages and
+scores drawn at random) and a profile with explicit topics, affinities and
+seen articles, then times the ``_score_candidate`` loop against
+``candidate_scoring.score_candidates`` (packing included) at one fixed
+``now``, and checks both give identical scores.
+
+    python -m benchmarks.candidate_scoring --candidates 100 1000 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+from app.services import recommender
+from app.services.candidate_scoring import pack_candidates, score_candidates, score_packed
+from app.services.shared_pools import ArticleFeatures
+from benchmarks.common import percentiles_ms
+
+_TOPICS = [
+    'strength', 'cardio', 'nutrition', 'mobility', 'recovery', 'hypertrophy', 'running', 'yoga',
+    'supplements', 'injury', 'sleep', 'crossfit', 'powerlifting', 'cycling', 'swimming', 'mindset',
+]
+
+
+def _candidates(count: int, now: datetime, seed: int = 0) -> list[recommender.Candidate]:
+    rng = random.Random(seed)
+    candidates = []
+    for i in range(count):
+        topics = tuple(rng.sample(_TOPICS, rng.randint(0, 3)))
+        article = ArticleFeatures(
+            id=i + 1,
+            source_id=rng.randint(1, 40),
+            title=f'article {i}',
+            summary='',
+            published_at=None if rng.random() < 0.05 else now - timedelta(seconds=rng.randint(-600, 14 * 86400)),
+            language='en',
+            popularity_score=rng.choice([0.0, rng.uniform(-5, 150)]),
+            quality_score=rng.choice([0.0, rng.random()]),
+            topics=topics,
+        )
+        pool = rng.choice(['vector', 'topic', 'trending', 'newest'])
+        similarity = rng.random() if pool == 'vector' else 0.0
+        candidates.append(recommender.Candidate(article=article, pool=pool, similarity=similarity, topics=list(topics)))
+    return candidates
+
+
+def _profile(count: int, seed: int = 0) -> recommender.UserProfile:
+    rng = random.Random(seed + 1)
+    raw = {topic: rng.uniform(-3, 5) for topic in rng.sample(_TOPICS, 10)}
+    return recommender.UserProfile(
+        user_id=1,
+        topics=rng.sample(_TOPICS, 2),
+        topic_affinities=recommender.normalize_affinities(raw),
+        recent_article_ids=set(rng.sample(range(1, count + 1), count // 10)),
+    )
+
+
+def _loop(candidates, profile, now) -> list[float]:
+    source_counts: Counter = Counter()
+    scores = []
+    for c in candidates:
+        scores.append(recommender._score_candidate(c, profile, source_counts, now=now))
+        source_counts[c.article.source_id] += 1
+    return scores
+
+
+def _time(fn, repeats: int) -> tuple[dict, object]:
+    samples, result = [], None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        samples.append(time.perf_counter() - start)
+    return percentiles_ms(samples), result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--candidates', type=int, nargs='+', default=[100, 1000, 10000])
+    parser.add_argument('--repeats', type=int, default=20)
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    args = parser.parse_args()
+
+    now = datetime.utcnow()
+    results = []
+    for n in args.candidates:
+        candidates, profile = _candidates(n, now), _profile(n)
+        loop, loop_out = _time(lambda: _loop(candidates, profile, now), args.repeats)
+        vectorized, vec_out = _time(lambda: score_candidates(candidates, profile, now=now), args.repeats)
+        packed = pack_candidates(candidates, profile, now)
+        scoring_only, _ = _time(lambda: score_packed(packed, profile), args.repeats)
+        results.append({
+            'candidates': n, 'loop': loop, 'vectorized': vectorized, 'score_packed': scoring_only,
+            'speedup': round(loop['mean_ms'] / vectorized['mean_ms'], 1) if vectorized['mean_ms'] else None,
+            'identical': loop_out == vec_out,
+        })
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'candidates':>10} {'loop ms':>9} {'vectorized ms':>14} {'of which scoring':>17} {'speedup':>8} {'same':>5}")
+    for r in results:
+        print(f"{r['candidates']:>10} {r['loop']['mean_ms']:>9.3f} {r['vectorized']['mean_ms']:>14.3f} "
+              f"{r['score_packed']['mean_ms']:>17.3f} {r['speedup']:>7}x {str(r['identical']):>5}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""Throughput cost of chunked long-content embeddings.
+
+Encodes the same synthetic articles in truncation mode and in chunking
+mode and reports articles/sec and chunks per article for each.
+
+    python -m benchmarks.chunked_embeddings --articles 200 --words 1500
+
+Requires sentence-transformers.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from types import SimpleNamespace
+
+from app.core.config import settings
+from app.services import embedder
+
+_VOCAB = (
+    'squat deadlift protein recovery sleep cardio interval hypertrophy volume '
+    'mobility tendon calorie deficit creatine endurance rowing barbell press '
+    'training program athlete coach muscle strength nutrition meal habit'
+).split()
+
+
+def _synthetic_articles(count: int, words: int, seed: int = 7) -> list[SimpleNamespace]:
+    rng = random.Random(seed)
+    articles = []
+    for i in range(count):
+        length = rng.randint(words // 2, words * 3 // 2)
+        articles.append(SimpleNamespace(
+            id=i,
+            title=' '.join(rng.choices(_VOCAB, k=8)),
+            summary=' '.join(rng.choices(_VOCAB, k=40)),
+            content=' '.join(rng.choices(_VOCAB, k=length)),
+        ))
+    return articles
+
+
+def _run(model, articles, chunking: bool) -> dict:
+    settings.EMBEDDING_CHUNKING_ENABLED = chunking
+    settings.EMBEDDING_STORE_CHUNKS = chunking
+    start = time.perf_counter()
+    encoded = embedder.encode_articles(model, articles)
+    elapsed = time.perf_counter() - start
+    chunk_count = sum(len(c) for c in encoded.chunks.values()) if chunking else len(articles)
+    return {
+        'mode': 'chunked' if chunking else 'truncated',
+        'articles': len(articles),
+        'seconds': round(elapsed, 3),
+        'articles_per_sec': round(len(articles) / elapsed, 1),
+        'chunks_per_article': round(chunk_count / len(articles), 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--articles', type=int, default=200)
+    parser.add_argument('--words', type=int, default=1500, help='mean content length in words')
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    args = parser.parse_args()
+
+    model = embedder._get_model()
+    if model is None:
+        raise SystemExit('sentence-transformers model not available')
+
+    articles = _synthetic_articles(args.articles, args.words)
+    embedder.encode_articles(model, articles[:8])  # warm-up
+
+    results = [_run(model, articles, chunking=False), _run(model, articles, chunking=True)]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for r in results:
+        print(f"{r['mode']:>10}: {r['articles_per_sec']:>8.1f} articles/s  "
+              f"({r['chunks_per_article']:.2f} chunks/article, {r['seconds']:.2f}s)")
+    slowdown = results[0]['articles_per_sec'] / results[1]['articles_per_sec']
+    print(f'chunking cost: {slowdown:.2f}x slower')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""Shared helpers for the benchmark scripts."""
+
+from __future__ import annotations
+
+import sys
+import time
+
+import numpy as np
+
+
+def synthetic_embeddings(count: int, dim: int = 384, latent_dim: int = 48, seed: int = 0) -> np.ndarray:
+    """Unit vectors with low intrinsic dimension, like sentence embeddings.
+
+    Points come from a mixture of clusters in a ``latent_dim`` space mapped
+    through a fixed random projection, plus a little isotropic noise.
+    """
+    rng = np.random.default_rng(seed)
+    projection = rng.standard_normal((latent_dim, dim)).astype(np.float32)
+    centers = rng.standard_normal((32, latent_dim)).astype(np.float32) * 2.0
+    labels = rng.integers(0, len(centers), size=count)
+    latent = centers[labels] + rng.standard_normal((count, latent_dim)).astype(np.float32)
+    vectors = latent @ projection + 0.3 * rng.standard_normal((count, dim)).astype(np.float32)
+    return normalize(vectors)
+
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return (vectors / np.where(norms == 0, 1, norms)).astype(np.float32)
+
+
+def exact_top_k(corpus: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    """Ground-truth top-k row indices by inner product."""
+    scores = queries @ corpus.T
+    top = np.argpartition(-scores, min(k, scores.shape[1] - 1), axis=1)[:, :k]
+    order = np.argsort(-np.take_along_axis(scores, top, axis=1), axis=1)
+    return np.take_along_axis(top, order, axis=1)
+
+
+def recall_at_k(truth: list[list], found: list[list], k: int) -> float:
+    """Mean fraction of the true top-k that appears in the returned top-k."""
+    if not truth:
+        return 0.0
+    total = 0.0
+    for t, f in zip(truth, found):
+        total += len(set(list(t)[:k]) & set(list(f)[:k])) / k
+    return round(total / len(truth), 4)
+
+
+def percentiles_ms(samples: list[float]) -> dict:
+    """p50/p99/mean of latencies given in seconds, reported in milliseconds."""
+    arr = np.asarray(samples) * 1000
+    return {
+        'p50_ms': round(float(np.percentile(arr, 50)), 3),
+        'p99_ms': round(float(np.percentile(arr, 99)), 3),
+        'mean_ms': round(float(arr.mean()), 3),
+    }
+
+
+def timed(fn, *args, **kwargs) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def resident_bytes() -> int:
+    """Current resident set size of this process (peak RSS where /proc is missing)."""
+    try:
+        with open('/proc/self/status', encoding='ascii') as status:
+            for line in status:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
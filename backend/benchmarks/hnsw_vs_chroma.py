@@ -0,0 +1,111 @@
+"""Latency and recall of the HNSW backend against the Chroma backend.
+
+Both stores are built in a temporary directory from the same synthetic
+embeddings; recall@k is measured against exact search.
+
+    python -m benchmarks.hnsw_vs_chroma --corpus 50000 --ef 32 64 128
+
+Backends whose library is not installed are skipped.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+
+import numpy as np
+
+from app.services.vector_store import ChromaVectorStore, HnswVectorStore
+from benchmarks.common import exact_top_k, percentiles_ms, recall_at_k, synthetic_embeddings
+
+_LANGUAGES = ['en', 'en', 'en', 'de']
+
+
+def _metadata(count: int) -> list[dict]:
+    return [{'source_id': i % 7, 'language': _LANGUAGES[i % 4]} for i in range(count)]
+
+
+def _filtered_truth(corpus: np.ndarray, queries: np.ndarray, meta: list[dict], k: int) -> list[list[str]]:
+    allowed = np.array([m['language'] == 'de' for m in meta])
+    rows = np.flatnonzero(allowed)
+    top = exact_top_k(corpus[rows], queries, k)
+    return [[str(rows[i]) for i in row] for row in top]
+
+
+def _bench(store, queries: np.ndarray, truth: list[list[str]], k: int, filters: dict | None) -> dict:
+    latencies, found = [], []
+    for q in queries:
+        start = time.perf_counter()
+        hits = store.search(q.tolist(), top_k=k, filters=filters)
+        latencies.append(time.perf_counter() - start)
+        found.append([h['id'] for h in hits])
+    return {f'recall@{k}': recall_at_k(truth, found, k), **percentiles_ms(latencies)}
+
+
+def _build(factory, ids, corpus, meta, batch: int = 5000):
+    store = factory()
+    start = time.perf_counter()
+    for lo in range(0, len(ids), batch):
+        store.upsert(ids[lo:lo + batch], corpus[lo:lo + batch].tolist(), meta[lo:lo + batch])
+    return store, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--corpus', type=int, default=20000)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--dim', type=int, default=384)
+    parser.add_argument('--k', type=int, default=10)
+    parser.add_argument('--ef', type=int, nargs='+', default=[32, 64, 128])
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    args = parser.parse_args()
+
+    data = synthetic_embeddings(args.corpus + args.queries, dim=args.dim)
+    corpus, queries = data[:-args.queries], data[-args.queries:]
+    ids = [str(i) for i in range(len(corpus))]
+    meta = _metadata(len(corpus))
+    truth = [[str(i) for i in row] for row in exact_top_k(corpus, queries, args.k)]
+    truth_filtered = _filtered_truth(corpus, queries, meta, args.k)
+    lang_filter = {'language': 'de'}
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            hnsw, build_s = _build(lambda: HnswVectorStore(data_dir=tmp, collection_name='bench', dim=args.dim), ids, corpus, meta)
+            for ef in args.ef:
+                hnsw.ef_search = ef
+                results.append({
+                    'backend': 'hnsw', 'ef': ef, 'build_s': round(build_s, 2),
+                    'unfiltered': _bench(hnsw, queries, truth, args.k, None),
+                    'filtered': _bench(hnsw, queries, truth_filtered, args.k, lang_filter),
+                })
+        except ImportError as exc:
+            print(f'skipping hnsw: {exc}')
+
+        try:
+            chroma, build_s = _build(lambda: ChromaVectorStore(persist_dir=f'{tmp}/chroma', collection_name='bench'), ids, corpus, meta)
+            results.append({
+                'backend': 'chroma', 'ef': None, 'build_s': round(build_s, 2),
+                'unfiltered': _bench(chroma, queries, truth, args.k, None),
+                'filtered': _bench(chroma, queries, truth_filtered, args.k, lang_filter),
+            })
+        except ImportError as exc:
+            print(f'skipping chroma: {exc}')
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    key = f'recall@{args.k}'
+    print(f"{'backend':>8} {'ef':>5} {'build s':>8} {key:>10} {'p50 ms':>8} {'p99 ms':>8} "
+          f"{'filt ' + key:>15} {'filt p50':>9} {'filt p99':>9}")
+    for r in results:
+        u, f = r['unfiltered'], r['filtered']
+        print(f"{r['backend']:>8} {str(r['ef'] or '-'):>5} {r['build_s']:>8.2f} {u[key]:>10.3f} "
+              f"{u['p50_ms']:>8.3f} {u['p99_ms']:>8.3f} {f[key]:>15.3f} {f['p50_ms']:>9.3f} {f['p99_ms']:>9.3f}")
+
+
+if __name__ == '__main__':
+    main()
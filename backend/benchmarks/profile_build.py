@@ -0,0 +1,151 @@
+"""Profile build time against event history size.
+
+Fills a scratch SQLite database with articles and one user per history size,
+then times the uncached ``build_user_profile`` with the SQL aggregation
+against the previous per-event loop (one ``db.get`` and ``json.loads`` per
+event), and checks both produce the same scores.
+
+    python -m benchmarks.profile_build --events 10 1000 10000
+    python -m benchmarks.profile_build --database-url postgresql://localhost/gymunity_bench
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+import app.models.ai_coach  # noqa: F401  (register tables)
+import app.models.user  # noqa: F401
+from app.models.news import NewsArticle, NewsSource, UserEvent
+from app.models.user import User
+from app.services import recommender
+from app.services.enrichment import topic_rows
+from benchmarks.common import percentiles_ms
+
+_TOPICS = ['strength', 'cardio', 'nutrition', 'mobility', 'recovery', 'hypertrophy', 'running', 'yoga']
+_EVENT_TYPES = ['impression', 'impression', 'impression', 'click', 'dwell', 'save', 'unsave', 'hide']
+
+
+def _legacy_aggregate(db, user_id: int, since: datetime):
+    """The per-event loop ``aggregate_event_scores`` replaced."""
+    events = db.query(UserEvent).filter(UserEvent.user_id == user_id, UserEvent.created_at >= since).all()
+    topic_scores: dict[str, float] = {}
+    source_scores: dict[int, float] = {}
+    interacted_ids: set[int] = set()
+    for event in events:
+        weight = recommender.event_weight(event.event_type, event.dwell_seconds)
+        interacted_ids.add(event.article_id)
+        article = db.get(NewsArticle, event.article_id)
+        if article:
+            topics = json.loads(article.topics_json) if article.topics_json else []
+            for topic in topics:
+                topic_scores[topic] = topic_scores.get(topic, 0) + weight
+            source_scores[article.source_id] = source_scores.get(article.source_id, 0) + weight
+    return topic_scores, source_scores, interacted_ids
+
+
+def _seed(db, articles: int, histories: list[int], seed: int = 0) -> dict[int, int]:
+    rng = random.Random(seed)
+    sources = [NewsSource(name=f'source {i}', rss_url=f'https://example.com/{i}.xml') for i in range(10)]
+    db.add_all(sources)
+    db.flush()
+    now = datetime.utcnow()
+    for i in range(articles):
+        published = now - timedelta(hours=i % 500)
+        topics_json = json.dumps(rng.sample(_TOPICS, rng.randint(1, 3)))
+        db.add(NewsArticle(
+            source_id=sources[i % len(sources)].id, title=f'article {i}', link=f'https://example.com/a/{i}',
+            unique_hash=f'h{i}', published_at=published, topics_json=topics_json,
+            topic_rows=topic_rows(topics_json, published),
+        ))
+    db.flush()
+
+    users = {}
+    for n in histories:
+        user = User(name=f'user {n}', email=f'user{n}@example.com', password_hash='x', role='user')
+        db.add(user)
+        db.flush()
+        users[n] = user.id
+        db.bulk_insert_mappings(UserEvent, [
+            {
+                'user_id': user.id,
+                'article_id': rng.randint(1, articles),
+                'event_type': (kind := rng.choice(_EVENT_TYPES)),
+                'dwell_seconds': rng.choice([None, 10.0, 45.0, 90.0]) if kind == 'dwell' else None,
+                'created_at': now - timedelta(minutes=rng.randint(0, 60 * 24 * 29)),
+            }
+            for _ in range(n)
+        ])
+    db.commit()
+    return users
+
+
+def _time(db, fn, repeats: int) -> tuple[dict, object]:
+    samples, result = [], None
+    for _ in range(repeats):
+        db.expunge_all()  # no identity-map hits carried over between runs
+        start = time.perf_counter()
+        result = fn()
+        samples.append(time.perf_counter() - start)
+    return percentiles_ms(samples), result
+
+
+def _close(a: tuple, b: tuple) -> bool:
+    def same(x: dict, y: dict) -> bool:
+        return x.keys() == y.keys() and all(abs(x[k] - y[k]) < 1e-9 for k in x)
+    return same(a[0], b[0]) and same(a[1], b[1]) and a[2] == b[2]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--events', type=int, nargs='+', default=[10, 1000, 10000])
+    parser.add_argument('--articles', type=int, default=5000)
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--database-url', default=None, help='defaults to a scratch SQLite file')
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.database_url or f'sqlite:///{os.path.join(tmp, "bench.db")}'
+        engine = create_engine(url)
+        Base.metadata.create_all(engine)
+        db = sessionmaker(bind=engine)()
+        try:
+            users = _seed(db, args.articles, args.events)
+            since = datetime.utcnow() - timedelta(days=recommender.PROFILE_EVENT_WINDOW_DAYS)
+            results = []
+            for n, user_id in users.items():
+                legacy, legacy_out = _time(db, lambda: _legacy_aggregate(db, user_id, since), args.repeats)
+                sql, sql_out = _time(db, lambda: recommender.aggregate_event_scores(db, user_id, since), args.repeats)
+                full, _ = _time(db, lambda: recommender.build_user_profile(db, user_id), args.repeats)
+                results.append({
+                    'events': n, 'legacy': legacy, 'sql': sql, 'build_user_profile': full,
+                    'speedup': round(legacy['mean_ms'] / sql['mean_ms'], 1) if sql['mean_ms'] else None,
+                    'identical': _close(legacy_out, sql_out),
+                })
+        finally:
+            db.close()
+            if args.database_url is None:
+                engine.dispose()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'events':>8} {'per-event ms':>13} {'SQL ms':>8} {'speedup':>8} {'profile ms':>11} {'same':>5}")
+    for r in results:
+        print(f"{r['events']:>8} {r['legacy']['mean_ms']:>13.2f} {r['sql']['mean_ms']:>8.2f} "
+              f"{r['speedup']:>7}x {r['build_user_profile']['mean_ms']:>11.2f} {str(r['identical']):>5}")
+
+
+if __name__ == '__main__':
+    main()
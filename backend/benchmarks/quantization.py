@@ -0,0 +1,89 @@
+"""Memory saved by int8 quantization against the recall it costs.
+
+Builds one NumPy store from synthetic embeddings, then searches it as a
+float16 store and as int8 stores with several rescoring over-fetch factors.
+Recall@k is measured against exact float32 search; "resident" is the scan
+matrix each worker process keeps in RAM (a float32 copy vs int8 codes plus
+per-row scales).
+
+    python -m benchmarks.quantization --corpus 100000 --overfetch 1 2 4 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+
+import numpy as np
+
+from app.services.vector_store import NumpyVectorStore
+from benchmarks.common import exact_top_k, percentiles_ms, recall_at_k, synthetic_embeddings
+
+
+def _bench(store: NumpyVectorStore, queries: np.ndarray, truth: list[list[str]], k: int) -> dict:
+    latencies, found = [], []
+    for q in queries:
+        start = time.perf_counter()
+        hits = store.search(q.tolist(), top_k=k)
+        latencies.append(time.perf_counter() - start)
+        found.append([h['id'] for h in hits])
+    return {f'recall@{k}': recall_at_k(truth, found, k), **percentiles_ms(latencies)}
+
+
+def _resident_bytes(store: NumpyVectorStore) -> int:
+    if store._codes is not None:
+        return int(store._codes.nbytes + store._scales.nbytes)
+    return int(store._floats.nbytes)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--corpus', type=int, default=50000)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--dim', type=int, default=384)
+    parser.add_argument('--k', type=int, default=10)
+    parser.add_argument('--overfetch', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    args = parser.parse_args()
+
+    data = synthetic_embeddings(args.corpus + args.queries, dim=args.dim)
+    corpus, queries = data[:-args.queries], data[-args.queries:]
+    ids = [str(i) for i in range(len(corpus))]
+    truth = [[str(i) for i in row] for row in exact_top_k(corpus, queries, args.k)]
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        NumpyVectorStore(data_dir=tmp, collection_name='bench').upsert(ids, corpus.tolist(), [{}] * len(ids))
+
+        base = NumpyVectorStore(data_dir=tmp, collection_name='bench')
+        baseline = {'mode': 'float16', 'overfetch': None, 'resident_bytes': _resident_bytes(base),
+                    **_bench(base, queries, truth, args.k)}
+        results.append(baseline)
+
+        for overfetch in args.overfetch:
+            store = NumpyVectorStore(data_dir=tmp, collection_name='bench', quantization='int8',
+                                     rescore_overfetch=overfetch)
+            results.append({'mode': 'int8', 'overfetch': overfetch, 'resident_bytes': _resident_bytes(store),
+                            **_bench(store, queries, truth, args.k)})
+
+    key = f'recall@{args.k}'
+    for r in results:
+        r['memory_saved'] = round(1 - r['resident_bytes'] / baseline['resident_bytes'], 3)
+        r['recall_delta'] = round(r[key] - baseline[key], 4)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'mode':>8} {'overfetch':>9} {'resident MB':>12} {'saved':>6} {key:>10} {'delta':>8} "
+          f"{'p50 ms':>8} {'p99 ms':>8}")
+    for r in results:
+        print(f"{r['mode']:>8} {str(r['overfetch'] or '-'):>9} {r['resident_bytes'] / 2**20:>12.1f} "
+              f"{r['memory_saved']:>6.1%} {r[key]:>10.3f} {r['recall_delta']:>+8.4f} "
+              f"{r['p50_ms']:>8.3f} {r['p99_ms']:>8.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""Recall, index size and query latency of reduced-dimension embeddings.
+
+Compares truncation and PCA at several target dimensions against the full
+vectors, using exact inner-product search so only the reduction is measured.
+
+    python -m benchmarks.reduced_dims --corpus 20000 --dims 256 128 64
+    python -m benchmarks.reduced_dims --npy data/article_vectors.npy
+
+``--npy`` loads real article embeddings (one row per article) instead of
+synthetic ones.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+import numpy as np
+
+from app.services.dim_reduction import Reducer
+from benchmarks.common import exact_top_k, percentiles_ms, recall_at_k, synthetic_embeddings
+
+
+def _measure(corpus: np.ndarray, queries: np.ndarray, truth: np.ndarray, k: int) -> dict:
+    latencies = []
+    found = []
+    for q in queries:
+        start = time.perf_counter()
+        scores = corpus @ q
+        top = np.argpartition(-scores, k)[:k]
+        top = top[np.argsort(-scores[top])]
+        latencies.append(time.perf_counter() - start)
+        found.append(top.tolist())
+    return {
+        f'recall@{k}': recall_at_k(truth.tolist(), found, k),
+        'index_bytes': int(corpus.nbytes),
+        **percentiles_ms(latencies),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--corpus', type=int, default=20000)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--dims', type=int, nargs='+', default=[256, 192, 128, 64])
+    parser.add_argument('--k', type=int, default=10)
+    parser.add_argument('--npy', help='real embeddings to use instead of synthetic ones')
+    parser.add_argument('--json', action='store_true', help='print results as JSON')
+    args = parser.parse_args()
+
+    if args.npy:
+        data = np.load(args.npy).astype(np.float32)
+        data /= np.linalg.norm(data, axis=1, keepdims=True)
+    else:
+        data = synthetic_embeddings(args.corpus + args.queries)
+    corpus, queries = data[:-args.queries], data[-args.queries:]
+    truth = exact_top_k(corpus, queries, args.k)
+
+    results = [{'method': 'full', 'dim': corpus.shape[1], **_measure(corpus, queries, truth, args.k)}]
+    for dim in args.dims:
+        reducers = [Reducer('truncate', dim), Reducer.fit_pca(corpus, dim)]
+        for reducer in reducers:
+            reduced_corpus = reducer.transform_array(corpus)
+            reduced_queries = reducer.transform_array(queries)
+            results.append({
+                'method': reducer.method,
+                'dim': dim,
+                'variance_kept': round(reducer.explained_variance(corpus), 4),
+                **_measure(reduced_corpus, reduced_queries, truth, args.k),
+            })
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    full_bytes = results[0]['index_bytes']
+    print(f"{'method':>8} {'dim':>5} {'recall@' + str(args.k):>10} {'size':>10} {'p50 ms':>8} {'p99 ms':>8}")
+    for r in results:
+        size = f"{r['index_bytes'] / full_bytes:.0%}"
+        print(f"{r['method']:>8} {r['dim']:>5} {r[f'recall@{args.k}']:>10.3f} {size:>10} "
+              f"{r['p50_ms']:>8.3f} {r['p99_ms']:>8.3f}")
+
+
+if __name__ == '__main__':
+    main()
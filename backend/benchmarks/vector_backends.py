@@ -0,0 +1,190 @@
+"""Upsert throughput, search latency, recall and memory of every vector backend.
+
+Each (backend, corpus size) pair runs in a fresh process so resident memory
+can be attributed to the store: RSS is sampled after the corpus is generated
+and again after the store is built and queried. Recall@k is measured against
+exact search, with and without a metadata filter (``language='de'``, ~25% of
+the corpus).
+
+    python -m benchmarks.vector_backends --sizes 10000 100000 1000000
+    python -m benchmarks.vector_backends --backends numpy hnsw --output report.json
+    python -m benchmarks.vector_backends --npy data/article_vectors.npy --sizes 50000
+
+Backends: ``numpy``, ``numpy-int8``, ``hnsw``, ``chroma`` and ``qdrant``
+(needs ``--qdrant-url``). Backends whose library is missing are reported as
+skipped. The JSON report is written to ``--output``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import platform
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+
+from benchmarks.common import exact_top_k, percentiles_ms, recall_at_k, resident_bytes, synthetic_embeddings
+
+BACKENDS = ['numpy', 'numpy-int8', 'hnsw', 'chroma', 'qdrant']
+_LANGUAGES = ['en', 'en', 'en', 'de']
+_UPSERT_BATCH = 5000
+_TRUTH_BATCH = 16
+
+
+def _dataset(size: int, queries: int, dim: int, npy: str | None) -> tuple[np.ndarray, np.ndarray]:
+    if npy:
+        data = np.load(npy, mmap_mode='r')[:size + queries].astype(np.float32)
+        data /= np.linalg.norm(data, axis=1, keepdims=True)
+    else:
+        data = synthetic_embeddings(size + queries, dim=dim)
+    return data[:-queries], data[-queries:]
+
+
+def _metadata(count: int) -> list[dict]:
+    return [{'article_id': i, 'source_id': i % 7, 'language': _LANGUAGES[i % 4]} for i in range(count)]
+
+
+def _truth(corpus: np.ndarray, queries: np.ndarray, k: int, rows: np.ndarray | None = None) -> list[list[str]]:
+    """Exact top-k ids, a few queries at a time to bound the score matrix."""
+    subset = corpus if rows is None else corpus[rows]
+    found = []
+    for start in range(0, len(queries), _TRUTH_BATCH):
+        top = exact_top_k(subset, queries[start:start + _TRUTH_BATCH], k)
+        found.extend([str(i if rows is None else rows[i]) for i in row] for row in top)
+    return found
+
+
+def _preload(backend: str) -> None:
+    """Import the backend's modules first so their code is not counted as store memory."""
+    import importlib
+
+    importlib.import_module('app.services.vector_store')
+    library = {'hnsw': 'hnswlib', 'chroma': 'chromadb', 'qdrant': 'qdrant_client'}.get(backend)
+    if library:
+        try:
+            importlib.import_module(library)
+        except ImportError:
+            pass
+
+
+def _open_store(backend: str, tmp: str, dim: int, qdrant_url: str | None):
+    from app.services import vector_store as vs
+
+    if backend == 'numpy':
+        return vs.NumpyVectorStore(data_dir=tmp, collection_name='bench')
+    if backend == 'numpy-int8':
+        return vs.NumpyVectorStore(data_dir=tmp, collection_name='bench', quantization='int8')
+    if backend == 'hnsw':
+        return vs.HnswVectorStore(data_dir=tmp, collection_name='bench', dim=dim)
+    if backend == 'chroma':
+        return vs.ChromaVectorStore(persist_dir=f'{tmp}/chroma', collection_name='bench')
+    if backend == 'qdrant':
+        if not qdrant_url:
+            raise ImportError('pass --qdrant-url to benchmark a Qdrant server')
+        return vs.QdrantVectorStore(url=qdrant_url, collection_name=f'bench-{time.time_ns()}', vector_size=dim)
+    raise ValueError(f'Unknown backend: {backend}')
+
+
+def _search(store, queries: np.ndarray, truth: list[list[str]], k: int, filters: dict | None) -> dict:
+    latencies, found = [], []
+    for q in queries:
+        start = time.perf_counter()
+        hits = store.search(q.tolist(), top_k=k, filters=filters)
+        latencies.append(time.perf_counter() - start)
+        found.append([h['id'] for h in hits])
+    return {f'recall@{k}': recall_at_k(truth, found, k), **percentiles_ms(latencies)}
+
+
+def run_one(backend: str, size: int, args: dict) -> dict:
+    """Benchmark one backend at one corpus size (runs in a child process)."""
+    corpus, queries = _dataset(size, args['queries'], args['dim'], args['npy'])
+    meta = _metadata(len(corpus))
+    ids = [str(i) for i in range(len(corpus))]
+    k = args['k']
+    truth = _truth(corpus, queries, k)
+    truth_filtered = _truth(corpus, queries, k, rows=np.flatnonzero(np.arange(len(corpus)) % 4 == 3))
+    _preload(backend)
+    baseline_rss = resident_bytes()
+
+    result = {'backend': backend, 'size': len(corpus), 'dim': corpus.shape[1]}
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            store = _open_store(backend, tmp, corpus.shape[1], args['qdrant_url'])
+        except ImportError as exc:
+            return {**result, 'skipped': str(exc)}
+
+        start = time.perf_counter()
+        for lo in range(0, len(ids), _UPSERT_BATCH):
+            store.upsert(ids[lo:lo + _UPSERT_BATCH], corpus[lo:lo + _UPSERT_BATCH].tolist(), meta[lo:lo + _UPSERT_BATCH])
+        upsert_s = time.perf_counter() - start
+
+        result.update({
+            'upsert_s': round(upsert_s, 3),
+            'upsert_vectors_per_s': round(len(ids) / upsert_s, 1) if upsert_s else None,
+            'unfiltered': _search(store, queries, truth, k, None),
+            'filtered': _search(store, queries, truth_filtered, k, {'language': 'de'}),
+            'resident_bytes': max(0, resident_bytes() - baseline_rss),
+        })
+        if backend == 'qdrant':
+            store.drop()
+    return result
+
+
+def _run_isolated(backend: str, size: int, args: dict) -> dict:
+    ctx = multiprocessing.get_context('spawn')
+    with ctx.Pool(1) as pool:
+        return pool.apply(run_one, (backend, size, args))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--backends', nargs='+', default=BACKENDS, choices=BACKENDS)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--dim', type=int, default=384)
+    parser.add_argument('--k', type=int, default=10)
+    parser.add_argument('--npy', help='replay real embeddings (one row per vector) instead of synthetic ones')
+    parser.add_argument('--qdrant-url', default=None)
+    parser.add_argument('--output', default='vector_backends_report.json')
+    args = parser.parse_args()
+
+    shared = {'queries': args.queries, 'dim': args.dim, 'k': args.k, 'npy': args.npy, 'qdrant_url': args.qdrant_url}
+    results = []
+    for size in args.sizes:
+        for backend in args.backends:
+            print(f'{backend} @ {size} ...', flush=True)
+            try:
+                results.append(_run_isolated(backend, size, shared))
+            except Exception as exc:
+                results.append({'backend': backend, 'size': size, 'error': f'{type(exc).__name__}: {exc}'})
+
+    report = {
+        'generated_at': datetime.utcnow().isoformat(),
+        'machine': {'platform': platform.platform(), 'python': platform.python_version(),
+                    'cpus': multiprocessing.cpu_count()},
+        'params': {**shared, 'sizes': args.sizes, 'filter': {'language': 'de'}},
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as out:
+        json.dump(report, out, indent=2)
+
+    key = f'recall@{args.k}'
+    print(f"\n{'backend':>11} {'size':>8} {'upsert/s':>10} {key:>10} {'p50 ms':>8} {'p99 ms':>8} "
+          f"{'filt ' + key:>15} {'filt p99':>9} {'RSS MB':>8}")
+    for r in results:
+        if 'unfiltered' not in r:
+            print(f"{r['backend']:>11} {r['size']:>8}  {r.get('skipped') or r.get('error')}")
+            continue
+        u, f = r['unfiltered'], r['filtered']
+        print(f"{r['backend']:>11} {r['size']:>8} {r['upsert_vectors_per_s']:>10.0f} {u[key]:>10.3f} "
+              f"{u['p50_ms']:>8.3f} {u['p99_ms']:>8.3f} {f[key]:>15.3f} {f['p99_ms']:>9.3f} "
+              f"{r['resident_bytes'] / 2**20:>8.1f}")
+    print(f'\nReport written to {args.output}')
+
+
+if __name__ == '__main__':
+    main()
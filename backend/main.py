@@ -48,6 +48,15 @@ def on_startup():
     logger.info("  Selected provider: %s", provider.__class__.__name__)
     logger.info("=" * 50)
 
+    # ---- Search index (built in the background; search uses substring matching until then) ----
+    from app.services.hybrid_search import schedule_bm25_refresh
+    schedule_bm25_refresh(force=True)
+
+    # ---- Embedding model (loaded in the background, outside any request budget) ----
+    if settings.VECTOR_DB_PROVIDER != 'none':
+        from app.services.embedder import warm_model
+        warm_model()
+
     # ---- News pipeline scheduler ----
     if settings.NEWS_PIPELINE_ENABLED:
         from app.services.news_scheduler import start_news_scheduler
@@ -60,7 +69,9 @@ def on_startup():
 @app.on_event('shutdown')
 def on_shutdown():
     from app.services.news_scheduler import stop_news_scheduler
+    from app.services.user_vectors import flush_user_vector_updates
     stop_news_scheduler(app)
+    flush_user_vector_updates()
 
 app.add_middleware(
     CORSMiddleware,